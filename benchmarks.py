@@ -0,0 +1,244 @@
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import platform
+import sqlite3
+import tempfile
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+import pandas as pd
+
+import data_transformation
+from data_extraction import READER_ENGINES, load_raw_data, iter_raw_data_chunks, resolve_reader_engine
+from load_to_sqlite import load_df_to_sqlite, bulk_load_df_to_sqlite, load_df_chunks_to_sqlite
+from pipeline_metrics import peak_rss_mb
+from schema import optimize_transformed_dtypes
+from synthetic_data import generate_raw_chunk, write_raw_csv
+
+TRANSFORMED_CSV_FILENAME = "transformed_laptops.csv"
+BENCH_TABLE_NAME = "laptops_final"
+RESULTS_FILENAME = "benchmark_results.jsonl"
+SUITES = ('parsers', 'readers', 'e2e', 'loaders')
+E2E_ROW_COUNTS = [10_000, 1_000_000, 10_000_000]
+E2E_MODES = ('batch', 'stream')
+E2E_STREAM_CHUNKSIZE = 250_000
+# End-to-end runs start from a fresh interpreter rather than a fork (see benchmark_end_to_end).
+SPAWN_CONTEXT = multiprocessing.get_context('spawn')
+READER_ROW_COUNTS = [1_000_000]
+
+
+def make_transformed_frame(n_rows, seed=0, source_csv=TRANSFORMED_CSV_FILENAME):
+    """Builds an `n_rows` transformed frame by resampling the rows of transformed_laptops.csv."""
+    source = pd.read_csv(source_csv)
+    rng = np.random.default_rng(seed)
+    return source.iloc[rng.integers(0, len(source), n_rows)].reset_index(drop=True)
+
+
+def time_call(func, *args, **kwargs):
+    """Runs `func` with its prints suppressed and returns the elapsed wall time in seconds."""
+    return time_call_result(func, *args, **kwargs)[0]
+
+
+def time_call_result(func, *args, **kwargs):
+    """Like time_call, but returns (seconds, result)."""
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = func(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def environment_info():
+    """Versions and machine details stored with every result, so runs can be compared."""
+    return {'python': platform.python_version(), 'pandas': pd.__version__, 'numpy': np.__version__,
+            'sqlite': sqlite3.sqlite_version, 'platform': platform.platform(), 'cpu_count': os.cpu_count()}
+
+
+def save_results(results, path, run_id):
+    """Appends benchmark results to a JSON-lines file, tagged with the run and environment."""
+    environment = environment_info()
+    timestamp = round(time.time(), 3)
+    with open(path, 'a') as f:
+        for result in results:
+            f.write(json.dumps({'run_id': run_id, 'timestamp': timestamp, **result, 'environment': environment}) + "\n")
+    print(f"Appended {len(results)} results for run {run_id} to {path}")
+
+
+def _result(suite, name, n_rows, seconds, **fields):
+    return {'suite': suite, 'name': name, 'rows': n_rows, 'seconds': round(seconds, 4),
+            'rows_per_sec': round(n_rows / seconds) if seconds else None, **fields}
+
+
+def _apply_each(func):
+    return lambda series: series.apply(func)
+
+
+# Helper parsers timed by benchmark_parsers: name -> (raw column, callable on that column)
+PARSERS = {
+    'parse_storage_capacity': ('SSD', _apply_each(data_transformation.parse_storage_capacity)),
+    'parse_storage_column': ('SSD', data_transformation.parse_storage_column),
+    'extract_processor_brand': ('Processor_Name', _apply_each(data_transformation.extract_processor_brand)),
+    'extract_processor_series': ('Processor_Name', _apply_each(data_transformation.extract_processor_series)),
+    'extract_processor_generation': ('Processor_Name',
+                                     _apply_each(data_transformation.extract_processor_generation)),
+    'extract_core_info': ('Processor_Name', _apply_each(data_transformation.extract_core_info)),
+    'engineer_processor_features': ('Processor_Name', data_transformation.engineer_processor_features),
+}
+
+
+def benchmark_parsers(n_rows, parsers=tuple(PARSERS), seed=0):
+    """Times each helper parser on `n_rows` synthetic raw values of the column it parses."""
+    raw = generate_raw_chunk(n_rows, seed=seed)
+    results = []
+    for parser_name in parsers:
+        column, parse = PARSERS[parser_name]
+        seconds = time_call(parse, raw[column])
+        results.append(_result('parsers', parser_name, n_rows, seconds))
+        print(f"{parser_name:>30} {n_rows:>12,} rows  {seconds:8.3f}s  {n_rows / seconds:>14,.0f} rows/sec")
+    return results
+
+
+def benchmark_readers(row_counts, engines=READER_ENGINES, seed=0):
+    """
+    Times load_raw_data with each reader engine on a synthetic raw CSV of each row count,
+    and checks that every engine returns the same frame as the C parser.
+    """
+    results = []
+    for n_rows in row_counts:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            csv_path = os.path.join(tmp_dir, "raw.csv")
+            write_raw_csv(csv_path, n_rows, seed=seed)
+            size_mb = os.path.getsize(csv_path) / 2 ** 20
+            reference = None
+            for engine in engines:
+                used_engine = resolve_reader_engine(engine)
+                seconds, df = time_call_result(load_raw_data, csv_path, engine=engine)
+                if reference is None:
+                    reference = df
+                identical = df is not None and reference is not None and df.equals(reference)
+                results.append(_result('readers', engine, n_rows, seconds, engine_used=used_engine,
+                                       mb_per_sec=round(size_mb / seconds, 1), identical=identical))
+                print(f"{engine:>8} {n_rows:>12,} rows  {seconds:8.2f}s  {size_mb / seconds:8.1f} MB/s  "
+                      f"{n_rows / seconds:>12,.0f} rows/sec  (ran as {used_engine}, identical: {identical})")
+                del df
+    return results
+
+
+def _timed_stage(results, stage, n_rows, func, *args, **kwargs):
+    seconds, result = time_call_result(func, *args, **kwargs)
+    results.append({'stage': stage, 'seconds': round(seconds, 4),
+                    'rows_per_sec': round(n_rows / seconds) if seconds else None, 'peak_rss_mb': peak_rss_mb()})
+    return result
+
+
+def _run_end_to_end(n_rows, seed, mode, chunksize, work_dir):
+    """Generates, extracts, transforms and loads `n_rows` synthetic rows; returns per-stage timings."""
+    csv_path = os.path.join(work_dir, "raw.csv")
+    write_raw_csv(csv_path, n_rows, seed=seed)
+    stages = []
+    if mode == 'stream':
+        chunks = (optimize_transformed_dtypes(data_transformation.transform_laptop_data(chunk, verbose=False))
+                  for chunk in iter_raw_data_chunks(csv_path, chunksize))
+        _timed_stage(stages, 'stream', n_rows, load_df_chunks_to_sqlite, chunks, "bench.db", BENCH_TABLE_NAME,
+                     project_root_dir=work_dir)
+        return stages
+    raw_df = _timed_stage(stages, 'extract', n_rows, load_raw_data, csv_path)
+    transformed_df = _timed_stage(stages, 'transform', n_rows, data_transformation.transform_laptop_data,
+                                  raw_df, verbose=False)
+    del raw_df
+    _timed_stage(stages, 'optimize_dtypes', n_rows, optimize_transformed_dtypes, transformed_df)
+    _timed_stage(stages, 'load', n_rows, bulk_load_df_to_sqlite, transformed_df, "bench.db", BENCH_TABLE_NAME,
+                 project_root_dir=work_dir)
+    return stages
+
+
+def benchmark_end_to_end(row_counts, modes=('batch',), seed=0, chunksize=E2E_STREAM_CHUNKSIZE):
+    """
+    Times extract, transform and load on synthetic data at each row count.
+
+    Every run happens in a freshly spawned worker process so its peak RSS belongs to that
+    run alone (a forked worker would start out with this process's memory, and so with its
+    peak); a run that dies (e.g. killed for running out of memory) is recorded as failed.
+    """
+    results = []
+    for n_rows in row_counts:
+        for mode in modes:
+            with tempfile.TemporaryDirectory() as tmp_dir, ProcessPoolExecutor(max_workers=1, mp_context=SPAWN_CONTEXT) as executor:
+                try:
+                    stages = executor.submit(_run_end_to_end, n_rows, seed, mode, chunksize, tmp_dir).result()
+                except BrokenProcessPool as e:
+                    print(f"{mode:>8} {n_rows:>12,} rows  FAILED ({e})")
+                    results.append({'suite': 'e2e', 'name': mode, 'rows': n_rows, 'status': 'failed'})
+                    continue
+            total_seconds = sum(stage['seconds'] for stage in stages)
+            results.append(_result('e2e', mode, n_rows, total_seconds, status='ok', stages=stages,
+                                   peak_rss_mb=max(stage['peak_rss_mb'] or 0 for stage in stages)))
+            stage_summary = ', '.join(f"{stage['stage']} {stage['seconds']:.2f}s" for stage in stages)
+            print(f"{mode:>8} {n_rows:>12,} rows  {total_seconds:8.2f}s  ({stage_summary}; "
+                  f"peak RSS {results[-1]['peak_rss_mb']} MB)")
+    return results
+
+
+LOADERS = {'to_sql': load_df_to_sqlite, 'bulk': bulk_load_df_to_sqlite}
+
+
+def benchmark_loaders(row_counts, loaders=tuple(LOADERS), seed=0):
+    """Times load_df_to_sqlite (pandas to_sql) against bulk_load_df_to_sqlite at each row count."""
+    results = []
+    for n_rows in row_counts:
+        df = make_transformed_frame(n_rows, seed=seed)
+        for loader_name in loaders:
+            loader = LOADERS[loader_name]
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                seconds = time_call(loader, df, "bench.db", BENCH_TABLE_NAME, project_root_dir=tmp_dir)
+            results.append(_result('loaders', loader_name, n_rows, seconds))
+            print(f"{loader_name:>8} {n_rows:>12,} rows  {seconds:8.2f}s  {n_rows / seconds:>12,.0f} rows/sec")
+    return results
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks for the laptop ETL pipeline.")
+    parser.add_argument("--suites", nargs="+", choices=SUITES, default=list(SUITES),
+                        help="Which benchmarks to run (default: all).")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000_000, 10_000_000],
+                        help="Row counts to benchmark the SQLite loaders at.")
+    parser.add_argument("--loaders", nargs="+", choices=sorted(LOADERS), default=list(LOADERS))
+    parser.add_argument("--parser-rows", type=int, default=1_000_000,
+                        help="Synthetic values each helper parser is timed on.")
+    parser.add_argument("--parsers", nargs="+", choices=sorted(PARSERS), default=list(PARSERS))
+    parser.add_argument("--reader-rows", type=int, nargs="+", default=READER_ROW_COUNTS,
+                        help="Row counts of the synthetic raw CSV each reader engine parses.")
+    parser.add_argument("--readers", nargs="+", choices=READER_ENGINES, default=list(READER_ENGINES))
+    parser.add_argument("--e2e-rows", type=int, nargs="+", default=E2E_ROW_COUNTS,
+                        help="Row counts for the end-to-end extract/transform/load runs.")
+    parser.add_argument("--e2e-modes", nargs="+", choices=E2E_MODES, default=['batch'],
+                        help="Run end-to-end in one batch, in chunks (stream), or both.")
+    parser.add_argument("--chunksize", type=int, default=E2E_STREAM_CHUNKSIZE,
+                        help="Rows per chunk for the stream end-to-end mode.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=RESULTS_FILENAME,
+                        help=f"JSON-lines file results are appended to (default: {RESULTS_FILENAME}).")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    run_id = uuid.uuid4().hex[:12]
+    all_results = []
+    if 'parsers' in args.suites:
+        all_results += benchmark_parsers(args.parser_rows, parsers=args.parsers, seed=args.seed)
+    if 'readers' in args.suites:
+        all_results += benchmark_readers(args.reader_rows, engines=args.readers, seed=args.seed)
+    if 'e2e' in args.suites:
+        all_results += benchmark_end_to_end(args.e2e_rows, modes=args.e2e_modes, seed=args.seed,
+                                            chunksize=args.chunksize)
+    if 'loaders' in args.suites:
+        all_results += benchmark_loaders(args.rows, loaders=args.loaders, seed=args.seed)
+    save_results(all_results, args.output, run_id)
@@ -0,0 +1,232 @@
+import os
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from pipeline_metrics import timed_stage
+
+DEFAULT_MAX_IN_FLIGHT = 4  # Chunks read but not yet written; bounds memory and gives back-pressure
+QUEUE_POLL_SECONDS = 0.1  # How often blocked stages check whether the pipeline was stopped
+
+# Marks the end of the stream on a queue (one per transformer).
+_END_OF_STREAM = object()
+
+
+class PipelineAborted(Exception):
+    """Raised inside the writer when another stage failed, so the load is rolled back."""
+
+
+class ConcurrentChunkPipeline:
+    """
+    Runs read -> transform -> write as separate threads connected by bounded queues.
+
+    The reader pulls raw chunks, `transformers` threads transform them, and a single
+    writer thread hands them in their original order to `write_chunks` (e.g. the bulk or
+    upsert loader, which takes an iterable of chunks). While chunk N is being written to
+    SQLite, chunk N+1 is already being read and parsed.
+
+    At most `max_in_flight` chunks exist between reading and writing, so a slow stage
+    blocks the ones before it instead of letting chunks pile up in memory. The first
+    error in any stage stops every stage; if the writer has started a load, it sees
+    PipelineAborted and rolls it back. run() then re-raises the original error.
+    """
+
+    def __init__(self, raw_chunks, transform, write_chunks, transformers=1,
+                 max_in_flight=DEFAULT_MAX_IN_FLIGHT, open_transformer=None, close_transformer=None):
+        self.raw_chunks = raw_chunks
+        self.transform = transform
+        self.write_chunks = write_chunks
+        self.transformers = max(1, transformers)
+        # Optional per-thread setup/teardown, e.g. opening a thread's own parse cache connection.
+        self.open_transformer = open_transformer
+        self.close_transformer = close_transformer
+        self.in_flight = threading.BoundedSemaphore(max(1, max_in_flight))
+        self.raw_queue = queue.Queue(maxsize=max(1, max_in_flight))
+        self.transformed_queue = queue.Queue(maxsize=max(1, max_in_flight))
+        self.stop_event = threading.Event()
+        self.error = None
+        self.result = None
+        self._error_lock = threading.Lock()
+
+    def _fail(self, error):
+        with self._error_lock:
+            if self.error is None:
+                self.error = error
+        self.stop_event.set()
+
+    def _put(self, q, item):
+        """Puts with back-pressure; returns False if the pipeline was stopped while waiting."""
+        while not self.stop_event.is_set():
+            try:
+                q.put(item, timeout=QUEUE_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, q):
+        while not self.stop_event.is_set():
+            try:
+                return q.get(timeout=QUEUE_POLL_SECONDS)
+            except queue.Empty:
+                continue
+        raise PipelineAborted("Pipeline stopped by another stage.")
+
+    def _read(self):
+        try:
+            chunks = iter(self.raw_chunks)
+            sequence = 0
+            while True:
+                while not self.in_flight.acquire(timeout=QUEUE_POLL_SECONDS):
+                    if self.stop_event.is_set():
+                        return
+                with timed_stage('concurrent.read_chunk', chunk=sequence + 1) as stage:
+                    chunk = next(chunks, _END_OF_STREAM)
+                    stage.rows_out = None if chunk is _END_OF_STREAM else len(chunk)
+                if chunk is _END_OF_STREAM:
+                    self.in_flight.release()
+                    break
+                if not self._put(self.raw_queue, (sequence, chunk)):
+                    return
+                sequence += 1
+            for _ in range(self.transformers):
+                if not self._put(self.raw_queue, _END_OF_STREAM):
+                    return
+        except BaseException as e:
+            self._fail(e)
+
+    def _transform(self):
+        state = None
+        try:
+            if self.open_transformer is not None:
+                state = self.open_transformer()
+            while True:
+                item = self._get(self.raw_queue)
+                if item is _END_OF_STREAM:
+                    self._put(self.transformed_queue, _END_OF_STREAM)
+                    return
+                sequence, raw_chunk = item
+                with timed_stage('concurrent.transform_chunk', rows_in=len(raw_chunk), chunk=sequence + 1) as stage:
+                    transformed = self.transform(raw_chunk, state)
+                    stage.rows_out = None if transformed is None else len(transformed)
+                if transformed is None:
+                    raise RuntimeError(f"Transformation of chunk {sequence + 1} failed.")
+                if not self._put(self.transformed_queue, (sequence, transformed)):
+                    return
+        except PipelineAborted:
+            return
+        except BaseException as e:
+            self._fail(e)
+        finally:
+            if self.close_transformer is not None and state is not None:
+                self.close_transformer(state)
+
+    def _ordered_chunks(self):
+        """Yields transformed chunks to the writer in read order, re-sequencing parallel results."""
+        pending = {}
+        next_sequence = 0
+        finished_transformers = 0
+        while finished_transformers < self.transformers or pending:
+            if next_sequence in pending:
+                yield pending.pop(next_sequence)
+                next_sequence += 1
+                self.in_flight.release()
+                continue
+            if finished_transformers == self.transformers:
+                raise PipelineAborted(f"Chunk {next_sequence + 1} never arrived from the transformers.")
+            item = self._get(self.transformed_queue)
+            if item is _END_OF_STREAM:
+                finished_transformers += 1
+            else:
+                sequence, chunk = item
+                pending[sequence] = chunk
+        if self.stop_event.is_set():
+            raise PipelineAborted("Pipeline stopped by another stage.")
+
+    def _write(self):
+        try:
+            self.result = self.write_chunks(self._ordered_chunks())
+            if self.result is None and self.error is None:
+                self._fail(RuntimeError("The SQLite writer failed; see the messages above."))
+        except BaseException as e:
+            self._fail(e)
+        finally:
+            # Whatever happened, nothing upstream is needed any more.
+            self.stop_event.set()
+
+    def run(self):
+        """Runs every stage to completion and returns the writer's result; re-raises the first error."""
+        threads = [threading.Thread(target=self._read, name="chunk-reader", daemon=True)]
+        threads += [threading.Thread(target=self._transform, name=f"chunk-transformer-{number + 1}", daemon=True)
+                    for number in range(self.transformers)]
+        threads.append(threading.Thread(target=self._write, name="sqlite-writer", daemon=True))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+def run_concurrent_pipeline(raw_chunks, write_chunks, workers=1, parse_cache_path=None,
+                            max_in_flight=DEFAULT_MAX_IN_FLIGHT, prepare_chunk=None):
+    """
+    Reads, transforms and writes chunks concurrently (see ConcurrentChunkPipeline).
+
+    With workers <= 1 a single transformer thread runs transform_laptop_data; otherwise
+    `workers` transformer threads each drive one process of a process pool, so parsing
+    runs on several cores while the writer thread keeps SQLite busy.
+
+    Args:
+        raw_chunks (iterable of pd.DataFrame): Raw chunks, e.g. from iter_raw_data_chunks.
+        write_chunks (callable): Takes an iterable of transformed chunks and loads them,
+            returning None on failure (e.g. load_df_chunks_to_sqlite with its other args bound).
+        workers (int): Worker processes for the transformation (1 = a thread in this process).
+        parse_cache_path (str): Optional path of the on-disk parse cache each transformer opens.
+        max_in_flight (int): Chunks allowed between reading and writing at once.
+        prepare_chunk (callable): Optional in-place step run on each transformed chunk in its
+            transformer (e.g. optimize_transformed_dtypes).
+
+    Returns:
+        The result of `write_chunks`, or None if any stage failed.
+    """
+    # Imported here so DEFAULT_MAX_IN_FLIGHT is available to the CLI without pandas.
+    from data_transformation import transform_laptop_data
+    from parallel_transform import _init_worker, _transform_in_worker
+    from parse_cache import open_parse_cache
+
+    def finish(transformed):
+        if transformed is not None and prepare_chunk is not None:
+            prepare_chunk(transformed)
+        return transformed
+
+    def open_thread_cache():
+        return open_parse_cache(os.path.dirname(parse_cache_path) or ".", os.path.basename(parse_cache_path))
+
+    executor = None
+    if workers > 1:
+        # Every transformer thread needs a chunk of its own to keep its process busy.
+        max_in_flight = max(max_in_flight, workers + 1)
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(parse_cache_path,))
+        pipeline = ConcurrentChunkPipeline(
+            raw_chunks, lambda chunk, _: finish(executor.submit(_transform_in_worker, chunk).result()),
+            write_chunks, transformers=workers, max_in_flight=max_in_flight)
+    else:
+        pipeline = ConcurrentChunkPipeline(
+            raw_chunks,
+            lambda chunk, cache: finish(transform_laptop_data(chunk, verbose=False, parse_cache=cache)),
+            write_chunks, max_in_flight=max_in_flight,
+            open_transformer=open_thread_cache if parse_cache_path else None,
+            close_transformer=lambda cache: cache.close())
+
+    print(f"Running reader, {pipeline.transformers} transformer(s) and the SQLite writer concurrently "
+          f"(at most {max_in_flight} chunks in flight)...")
+    try:
+        return pipeline.run()
+    except Exception as e:
+        print(f"Concurrent pipeline failed: {e}")
+        return None
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
@@ -1,17 +1,118 @@
-import pandas as pd
-from data_transformation import transform_laptop_data
-# Import the SQLite loading function
-from load_to_sqlite import load_df_to_sqlite
+CSV_FILE_PATH = r'C:\Users\bchai\.cache\kagglehub\datasets\pradeepjangirml007\laptop-data-set\versions\1\laptop.csv'
 
+# Free-text raw columns. Reading them as strings keeps their dtype stable no matter
+# which rows end up in a chunk (e.g. a chunk where every 'Display' value looks numeric).
+RAW_TEXT_COLUMNS = ['Brand', 'Name', 'Processor_Name', 'Processor_Brand', 'RAM_Expandable', 'RAM',
+                    'RAM_TYPE', 'Ghz', 'Display_type', 'Display', 'GPU', 'GPU_Brand', 'SSD', 'HDD',
+                    'Adapter', 'Battery_Life']
+RAW_TEXT_DTYPES = {col: str for col in RAW_TEXT_COLUMNS}
 
-CSV_FILE_PATH = r'C:\Users\bchai\.cache\kagglehub\datasets\pradeepjangirml007\laptop-data-set\versions\1\laptop.csv'
+# CSV reader engines for the raw file:
+#   c        pandas' default C parser (single-threaded)
+#   pyarrow  pyarrow's multi-threaded CSV reader (falls back to 'c' when pyarrow is missing)
+#   mmap     the C parser reading from a memory-mapped file instead of buffered reads
+READER_ENGINES = ('c', 'pyarrow', 'mmap')
+DEFAULT_READER_ENGINE = 'c'
+# Strings pandas' C parser reads as missing by default; given to pyarrow so both agree.
+PANDAS_DEFAULT_NA_VALUES = ['', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND',
+                            '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null']
+
+
+def raw_read_options(use_schema=True):
+    """
+    read_csv keyword arguments for the raw file.
+
+    With `use_schema`, the declared raw schema (schema.py) picks the columns to read and
+    stores the repetitive strings as categories; otherwise every column is read and the
+    text columns are plain strings.
+    """
+    if use_schema:
+        from schema import RAW_DTYPES, is_raw_column
+        return {'dtype': RAW_DTYPES, 'usecols': is_raw_column}
+    return {'dtype': RAW_TEXT_DTYPES}
+
+
+def resolve_reader_engine(engine, chunked=False):
+    """
+    Returns the reader engine actually used for `engine`: 'pyarrow' falls back to 'c' when
+    pyarrow is not installed, and for chunked reads, which its reader does not support.
+    """
+    if engine not in READER_ENGINES:
+        raise ValueError(f"Unknown reader engine '{engine}' (expected one of: {', '.join(READER_ENGINES)}).")
+    if engine == 'pyarrow':
+        if chunked:
+            print("Note: the pyarrow reader cannot stream chunks; using the C parser instead.")
+            return 'c'
+        try:
+            import pyarrow.csv  # noqa: F401
+        except ImportError:
+            print("Warning: pyarrow is not installed; reading the raw CSV with the C parser instead.")
+            return 'c'
+    return engine
+
+
+def _read_csv_pyarrow(csv_filepath, use_schema=True):
+    """
+    Reads the raw CSV with pyarrow's multi-threaded reader into the same frame read_csv builds.
+
+    pandas' own engine='pyarrow' infers column types before applying `dtype`, which turns
+    e.g. a text value '14' into '14.0', so the column types and missing-value strings are
+    given to pyarrow directly instead.
+    """
+    import numpy as np
+    import pandas as pd
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+
+    options = raw_read_options(use_schema)
+    # Column names exactly as pandas derives them (e.g. an empty header -> 'Unnamed: 0').
+    header = list(pd.read_csv(csv_filepath, nrows=0).columns)
+    usecols = options.get('usecols')
+    columns = [col for col in header if usecols is None or usecols(col)]
+    dtypes = options['dtype']
+    text_columns = [col for col in columns if col in dtypes]
+    table = pa_csv.read_csv(
+        csv_filepath,
+        read_options=pa_csv.ReadOptions(column_names=header, skip_rows=1, use_threads=True),
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=columns, column_types={col: pa.string() for col in text_columns},
+            null_values=PANDAS_DEFAULT_NA_VALUES, strings_can_be_null=True))
+    df = table.to_pandas()
+    del table
+    for col in text_columns:
+        if dtypes[col] == 'category':
+            df[col] = df[col].astype('category')
+        else:
+            df[col] = df[col].where(df[col].notna(), np.nan)  # read_csv gives NaN, not None
+    return df
+
+
+def load_raw_data(csv_filepath, use_schema=True, engine=DEFAULT_READER_ENGINE):
+    """
+    Loads the raw laptop data from the specified CSV file path.
 
+    Args:
+        csv_filepath (str): Path to the raw CSV file.
+        use_schema (bool): Read with the declared raw schema (see raw_read_options).
+        engine (str): CSV reader engine, one of READER_ENGINES. Every engine gives the same
+            DataFrame; 'pyarrow' parses on several threads.
+
+    Returns:
+        pd.DataFrame: The raw rows, or None if the file could not be read.
+    """
+    import pandas as pd
+    from schema import object_equivalent_memory, report_memory_usage
 
-def load_raw_data(csv_filepath):
-    """Loads the raw laptop data from the specified CSV file path."""
     try:
-        df = pd.read_csv(csv_filepath)
+        engine = resolve_reader_engine(engine)
+        if engine == 'pyarrow':
+            df = _read_csv_pyarrow(csv_filepath, use_schema)
+        else:
+            df = pd.read_csv(csv_filepath, memory_map=engine == 'mmap', **raw_read_options(use_schema))
         print(f"Successfully loaded {csv_filepath}")
+        if use_schema:
+            report_memory_usage("Raw data (inferred object dtypes -> declared schema)",
+                                object_equivalent_memory(df), df.memory_usage(deep=True).sum())
         return df
     except FileNotFoundError:
         print(f"Error: The file was not found at {csv_filepath}")
@@ -20,7 +121,42 @@ def load_raw_data(csv_filepath):
         print(f"An error occurred while loading the file: {e}")
         return None
 
+
+def iter_raw_data_chunks(csv_filepath, chunksize, use_schema=True, engine=DEFAULT_READER_ENGINE):
+    """
+    Lazily reads the raw laptop CSV in chunks of `chunksize` rows.
+
+    Only one chunk is held in memory at a time, so peak memory is bounded by the
+    chunk size rather than the size of the file.
+
+    Args:
+        csv_filepath (str): Path to the raw CSV file.
+        chunksize (int): Number of rows per chunk.
+        use_schema (bool): Read with the declared raw schema (see raw_read_options).
+        engine (str): CSV reader engine; 'mmap' memory-maps the file, 'pyarrow' falls back to 'c'.
+
+    Yields:
+        pd.DataFrame: The next chunk of raw rows.
+    """
+    import pandas as pd
+
+    try:
+        engine = resolve_reader_engine(engine, chunked=True)
+        reader = pd.read_csv(csv_filepath, chunksize=chunksize, memory_map=engine == 'mmap',
+                             **raw_read_options(use_schema))
+    except FileNotFoundError:
+        print(f"Error: The file was not found at {csv_filepath}")
+        return
+    print(f"Streaming {csv_filepath} in chunks of {chunksize} rows")
+    with reader:
+        for chunk in reader:
+            yield chunk
+
+
 if __name__ == "__main__":
+    from data_transformation import transform_laptop_data
+    from load_to_sqlite import load_df_to_sqlite
+
     raw_laptop_df = load_raw_data(CSV_FILE_PATH)
 
     if raw_laptop_df is not None:
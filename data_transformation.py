@@ -1,7 +1,20 @@
+import io
+import logging
+
 import pandas as pd
 import numpy as np  # numpy might be useful for more complex transformations or NaN handling
 import re  # For more complex regex later if needed
 
+from parse_cache import parse_distinct
+from pipeline_manifest import source_version
+from pipeline_metrics import timed_stage
+
+logger = logging.getLogger(__name__)
+
+# Version of the parsing code in this module; cached parse results from any other
+# version are ignored, so editing a parser invalidates the on-disk parse cache.
+PARSER_VERSION = source_version(__file__)
+
 
 def parse_storage_capacity(storage_str):
     """Helper function to parse storage strings (e.g., '512 GB SSD Storage', '1 TB HDD', 'No HDD') into GB."""
@@ -28,6 +41,17 @@ def parse_storage_capacity(storage_str):
     return int(capacity)  # Return as integer GB
 
 
+def _parse_storage_values(values):
+    return [parse_storage_capacity(value) for value in values]
+
+
+def parse_storage_column(storage_series, parse_cache=None):
+    """Applies parse_storage_capacity to each distinct value of a column (optionally cached)."""
+    codes, unique_capacities = parse_distinct(storage_series, _parse_storage_values,
+                                              'storage_capacity', PARSER_VERSION, parse_cache)
+    return pd.Series(unique_capacities[codes].tolist(), index=storage_series.index)
+
+
 def extract_processor_brand(name_str):
     name_str = str(name_str).lower()
     if 'intel' in name_str or 'celeron' in name_str or 'pentium' in name_str:
@@ -140,114 +164,298 @@ def extract_core_info(name_str):
     return None
 
 
-def transform_laptop_data(df_raw):
-    """Applies various cleaning and transformation steps to the raw laptop DataFrame."""
-    # Make a copy to avoid modifying the original DataFrame in place
-    df = df_raw.copy()
-
-    print("Starting data transformation...")
+# Precompiled patterns for the vectorized processor feature engine below. They mirror
+# the patterns used by the extract_processor_* / extract_core_info helpers one-to-one.
+PROC_BRAND_PATTERNS = [
+    ('Intel', re.compile(r'intel|celeron|pentium')),
+    ('AMD', re.compile(r'amd|ryzen|athlon')),
+    ('Apple', re.compile(r'apple|m1|m2')),
+    ('MediaTek', re.compile(r'mediatek')),
+    ('Qualcomm', re.compile(r'qualcomm|snapdragon')),
+]
+PROC_APPLE_M_PATTERN = re.compile(r'(m[123])(?:\s*(pro|max|ultra))?')
+PROC_CORE_PATTERN = re.compile(r'core\s+(i[3579]|ultra\s*[3579]|m[357])')
+PROC_RYZEN_PATTERN = re.compile(r'ryzen\s+([3579]|threadripper)')
+PROC_MEDIATEK_PATTERN = re.compile(r'mediatek\s*([^\s(]+)')
+PROC_SNAPDRAGON_PATTERN = re.compile(r'snapdragon\s*([^\s(]+)')
+PROC_GEN_EXPLICIT_PATTERN = re.compile(r'(?:\(|\b)(\d{1,2})(?:st|nd|rd|th)\s*gen(?:eration)?(?:\)|\b)')
+PROC_GEN_INTEL_MODEL_PATTERN = re.compile(r'(?:core\s*)?i([3579])(?:-|\s)(\d{1,2})\d{2,3}')
+PROC_GEN_INTEL_NAMED_PATTERN = re.compile(r'intel\s+core\s+i[3579]\s+(\d{1,2})(?:st|nd|rd|th)\s+gen')
+PROC_GEN_RYZEN_PATTERN = re.compile(r'ryzen\s+[3579]\s+(\d)\d{3}')
+PROC_CORE_INFO_PATTERN = re.compile(r'(dual|quad|hexa|octa|deca)[-\s]*core')
+PROC_MEDIATEK_GENERIC_CORES = ['octa-core', 'quad-core', 'dual-core']
+
+
+def _first_match(*candidates):
+    """Combines candidate Series (NaN where a rule did not apply) in priority order."""
+    result = candidates[0]
+    for candidate in candidates[1:]:
+        result = result.where(result.notna(), candidate)
+    return result
+
+
+def _as_feature_series(values, index):
+    """Builds the output Series the same way `.apply` would (strings, None for no match)."""
+    values = values.astype(object)
+    return pd.Series(values.where(values.notna(), None).tolist(), index=index)
+
+
+def _engineer_processor_features_unique(processor_names):
+    """Runs the vectorized processor rules over a Series of (distinct) processor names."""
+    index = processor_names.index
+    # Same as str(name).lower() in the row-wise helpers (NaN becomes 'nan').
+    names = processor_names.astype(object).where(processor_names.notna(), 'nan').astype(str).str.lower()
+    empty = pd.Series(np.nan, index=index, dtype=object)
+
+    def contains(pattern):
+        return names.str.contains(pattern, regex=True)
+
+    # Brand: first keyword group that appears anywhere in the name.
+    brand = empty.copy()
+    for label, pattern in reversed(PROC_BRAND_PATTERNS):
+        brand = brand.mask(contains(pattern), label)
+
+    # Series: same rule order as extract_processor_series.
+    apple_m = names.str.extract(PROC_APPLE_M_PATTERN)
+    apple_series = apple_m[0].str.upper() + (' ' + apple_m[1].str.capitalize()).fillna('')
+    core_series = 'Core ' + names.str.extract(PROC_CORE_PATTERN)[0].str.replace(' ', '', regex=False)
+    ryzen_series = 'Ryzen ' + names.str.extract(PROC_RYZEN_PATTERN)[0]
+    keyword_series = empty.copy()
+    has_mediatek = contains(r'mediatek')
+    mediatek_model = names.str.extract(PROC_MEDIATEK_PATTERN)[0]
+    mediatek_model = mediatek_model.where(~mediatek_model.isin(PROC_MEDIATEK_GENERIC_CORES))
+    mediatek_series = ('MediaTek ' + mediatek_model.str.capitalize()).fillna('MediaTek').where(has_mediatek)
+    has_snapdragon = contains(r'snapdragon')
+    snapdragon_series = ('Snapdragon ' + names.str.extract(PROC_SNAPDRAGON_PATTERN)[0]).fillna(
+        'Snapdragon').where(has_snapdragon)
+    keyword_series = keyword_series.mask(has_snapdragon, snapdragon_series)
+    keyword_series = keyword_series.mask(has_mediatek, mediatek_series)
+    keyword_series = keyword_series.mask(contains(r'athlon'), 'Athlon')
+    keyword_series = keyword_series.mask(contains(r'intel') & contains(r'xeon'), 'Xeon')
+    keyword_series = keyword_series.mask(contains(r'pentium'), 'Pentium')
+    keyword_series = keyword_series.mask(contains(r'celeron'), 'Celeron')
+    series = _first_match(apple_series, core_series, ryzen_series, keyword_series)
+
+    # Generation: same rule order as extract_processor_generation.
+    explicit_gen = names.str.extract(PROC_GEN_EXPLICIT_PATTERN)[0] + 'th Gen'
+    intel_model_gen_num = pd.to_numeric(names.str.extract(PROC_GEN_INTEL_MODEL_PATTERN)[1], errors='coerce')
+    intel_model_gen_num = intel_model_gen_num.where(intel_model_gen_num.between(1, 19))
+    intel_model_gen = intel_model_gen_num.astype('Int64').astype(str).where(intel_model_gen_num.notna()) + 'th Gen'
+    intel_named_gen = names.str.extract(PROC_GEN_INTEL_NAMED_PATTERN)[0] + 'th Gen'
+    ryzen_gen_digit = names.str.extract(PROC_GEN_RYZEN_PATTERN)[0]
+    ryzen_gen = ryzen_gen_digit.where(ryzen_gen_digit != '0') + 'xxx Series Gen'
+    generation = _first_match(explicit_gen, intel_model_gen, intel_named_gen, ryzen_gen)
+
+    core_info = names.str.extract(PROC_CORE_INFO_PATTERN)[0].str.capitalize() + '-Core'
+
+    return pd.DataFrame({
+        'Processor_Brand': brand,
+        'Processor_Series': series,
+        'Processor_Generation': generation,
+        'Processor_Core_Info': core_info,
+    }, index=index)
+
+
+PROCESSOR_FEATURE_COLUMNS = ['Processor_Brand', 'Processor_Series', 'Processor_Generation', 'Processor_Core_Info']
+
+
+def _parse_processor_values(values):
+    features = _engineer_processor_features_unique(pd.Series(values, dtype=object))
+    return features.astype(object).where(features.notna(), None).values.tolist()
+
+
+def engineer_processor_features(processor_names, parse_cache=None):
+    """
+    Vectorized equivalent of extract_processor_brand, extract_processor_series,
+    extract_processor_generation and extract_core_info.
+
+    The column is factorized once, the distinct names are lower-cased once, every rule
+    runs as a pandas `.str` operation with a precompiled pattern, and the results are
+    mapped back to the rows by their codes. This replaces four row-wise `.apply` passes.
+
+    Args:
+        processor_names (pd.Series): The raw 'Processor_Name' column.
+        parse_cache (ParseCache): Optional persistent cache of already-parsed names.
+
+    Returns:
+        pd.DataFrame: Columns 'Processor_Brand', 'Processor_Series', 'Processor_Generation'
+        and 'Processor_Core_Info', aligned to the input index.
+    """
+    codes, unique_results = parse_distinct(processor_names, _parse_processor_values,
+                                           'processor_features', PARSER_VERSION, parse_cache)
+    unique_features = pd.DataFrame(list(unique_results), columns=PROCESSOR_FEATURE_COLUMNS, dtype=object)
+    return pd.DataFrame({
+        col: _as_feature_series(unique_features[col].take(codes), processor_names.index)
+        for col in PROCESSOR_FEATURE_COLUMNS
+    }, index=processor_names.index)
+
+
+# Declarative cleaning rules for the unit-string columns: derived column -> rule.
+#   source:  raw column the number is parsed from (left out of the transformed frame)
+#   case:    'upper'/'lower' applied to str(value) first, or None
+#   remove:  (pattern, is_regex) fragments deleted in order before extraction
+#   strip:   strip surrounding whitespace after the removals
+#   pattern: regex whose first group is the number; None parses the whole cleaned string
+#   scale:   multiplier converting the parsed number to the target unit
+#   dtype:   'integer' (int64, float64 if any value is missing) or 'float' (float64)
+UNIT_COLUMN_RULES = {
+    'RAM_GB': {  # "8 GB RAM", "16GB"
+        'source': 'RAM', 'case': 'upper', 'remove': [(r'\s*GB\s*RAM', True), (r'\s*GB', True)],
+        'pattern': r'(\d+)', 'scale': 1, 'dtype': 'integer'},
+    'Processor_Speed_GHz': {  # "2.1 Ghz", "3.0 Ghz Max", "1.8GHz"
+        'source': 'Ghz', 'pattern': r'(\d+\.?\d*)', 'scale': 1, 'dtype': 'float'},
+    'Adapter_Wattage': {  # "65 Watt", "45W"
+        'source': 'Adapter', 'case': 'lower', 'remove': [('watt', False), ('w', False)], 'strip': True,
+        'pattern': None, 'scale': 1, 'dtype': 'float'},
+    'Battery_Life_Hours': {  # "5 Hrs", "Upto 10 Hours"
+        'source': 'Battery_Life', 'pattern': r'(\d+\.?\d*)', 'scale': 1, 'dtype': 'float'},
+}
+CLEANING_RULE_DTYPES = ('integer', 'float')
+
+
+def compile_cleaning_rule(rule):
+    """
+    Compiles a UNIT_COLUMN_RULES entry into a function of the raw source column.
+
+    The column is factorized once (free for the 'category' columns of the raw schema),
+    the string clean-up and extraction run only on its distinct values, and a single
+    take() maps the parsed numbers back to the rows, so no full-length intermediate
+    string Series is built. Values are the same as the row-wise .str chain would give.
+    """
+    if rule.get('dtype', 'float') not in CLEANING_RULE_DTYPES:
+        raise ValueError(f"Unknown cleaning rule dtype {rule['dtype']!r}; expected one of {CLEANING_RULE_DTYPES}.")
+    case = rule.get('case')
+    removals = [(re.compile(fragment) if is_regex else fragment, is_regex) for fragment, is_regex in rule.get('remove', [])]
+    pattern = re.compile(rule['pattern']) if rule.get('pattern') else None
+    scale = rule.get('scale', 1)
+    as_integer = rule.get('dtype', 'float') == 'integer'
+
+    def clean(series):
+        codes, uniques = pd.factorize(series, use_na_sentinel=False)
+        # Same as series.astype(str) on each distinct value (NaN -> 'nan', which never parses).
+        texts = pd.Series([str(value) for value in uniques], dtype=object)
+        if case == 'upper':
+            texts = texts.str.upper()
+        elif case == 'lower':
+            texts = texts.str.lower()
+        for fragment, is_regex in removals:
+            texts = texts.str.replace(fragment, '', regex=is_regex)
+        if rule.get('strip'):
+            texts = texts.str.strip()
+        if pattern is not None:
+            texts = texts.str.extract(pattern, expand=False)
+        numbers = pd.to_numeric(texts, errors='coerce').astype('float64').to_numpy()
+        if scale != 1:
+            numbers = numbers * scale
+        values = numbers.take(codes)
+        if as_integer and not np.isnan(values).any():
+            values = values.astype('int64')
+        return pd.Series(values, index=series.index)
+
+    return clean
+
+
+COMPILED_UNIT_COLUMN_RULES = {target: compile_cleaning_rule(rule) for target, rule in UNIT_COLUMN_RULES.items()}
+STORAGE_COLUMN_SOURCES = {'SSD_Capacity_GB': 'SSD', 'HDD_Capacity_GB': 'HDD'}  # Parsed by parse_storage_column
+# Numbered transform steps producing the cleaned columns, in output column order.
+CLEANING_STEPS = [('02_ram', 'RAM_GB'), ('03_ghz', 'Processor_Speed_GHz'), ('04_ssd', 'SSD_Capacity_GB'),
+                  ('05_hdd', 'HDD_Capacity_GB'), ('06_adapter', 'Adapter_Wattage'),
+                  ('07_battery_life', 'Battery_Life_Hours')]
+
+
+def transform_laptop_data(df_raw, verbose=True, parse_cache=None):
+    """
+    Applies various cleaning and transformation steps to the raw laptop DataFrame.
+
+    Progress is logged at INFO; the final info/head summary is only built when the
+    logger is at DEBUG and `verbose` is set (pass verbose=False when transforming many
+    chunks in a row). Each numbered step is timed as a 'transform.*' stage (see
+    pipeline_metrics.py). Pass a ParseCache (see parse_cache.py) to reuse
+    storage/processor parse results across runs and chunks.
+    """
+    n_rows = len(df_raw)
+
+    logger.info("Starting data transformation...")
 
     # 1. Drop 'Unnamed: 0' column
-    if 'Unnamed: 0' in df.columns:
-        df.drop('Unnamed: 0', axis=1, inplace=True)
-        print("- Dropped 'Unnamed: 0' column.")
-
-    # 2. Clean RAM column
-    # Expecting formats like "8 GB RAM", "16GB", etc.
-    if 'RAM' in df.columns:
-        df['RAM_GB'] = df['RAM'].astype(str).str.upper()  # Convert to string and uppercase
-        df['RAM_GB'] = df['RAM_GB'].str.replace(r'\s*GB\s*RAM', '', regex=True)  # Remove " GB RAM"
-        df['RAM_GB'] = df['RAM_GB'].str.replace(r'\s*GB', '', regex=True)  # Remove " GB"
-        df['RAM_GB'] = df['RAM_GB'].str.extract(r'(\d+)')  # Extract digits
-        df['RAM_GB'] = pd.to_numeric(df['RAM_GB'], errors='coerce')  # Convert to numeric, errors become NaN
-        # df.drop('RAM', axis=1, inplace=True) # Optional: drop original RAM column
-        print("- Cleaned 'RAM' column into 'RAM_GB' (numeric).")
-
-    # 3. Clean Ghz column
-    # Expecting formats like "2.1 Ghz", "3.0 Ghz Max", "1.8GHz"
-    if 'Ghz' in df.columns:
-        df['Processor_Speed_GHz'] = df['Ghz'].astype(str).str.lower()  # Convert to string and lowercase
-        # Extract the first floating point or integer number found
-        df['Processor_Speed_GHz'] = df['Processor_Speed_GHz'].str.extract(r'(\d+\.?\d*)')
-        df['Processor_Speed_GHz'] = pd.to_numeric(df['Processor_Speed_GHz'], errors='coerce')
-        # df.drop('Ghz', axis=1, inplace=True) # Optional: drop original Ghz column
-        print("- Cleaned 'Ghz' column into 'Processor_Speed_GHz' (numeric).")
-
-    # 4. Clean SSD Column
-    if 'SSD' in df.columns:
-        df['SSD_Capacity_GB'] = df['SSD'].apply(parse_storage_capacity)
-        print("- Cleaned 'SSD' column into 'SSD_Capacity_GB' (numeric GB).")
-
-    # 5. Clean HDD Column
-    if 'HDD' in df.columns:
-        df['HDD_Capacity_GB'] = df['HDD'].apply(parse_storage_capacity)
-        print("- Cleaned 'HDD' column into 'HDD_Capacity_GB' (numeric GB).")
-
-    # 6. Clean Adapter Column
-    if 'Adapter' in df.columns:
-        df['Adapter_Wattage'] = df['Adapter'].astype(str).str.lower()
-        df['Adapter_Wattage'] = df['Adapter_Wattage'].str.replace(r'watt', '', regex=False)  # remove "watt"
-        df['Adapter_Wattage'] = df['Adapter_Wattage'].str.replace(r'w', '', regex=False)  # remove "w"
-        df['Adapter_Wattage'] = df['Adapter_Wattage'].str.strip()
-        # Extract leading digits, coerce non-numeric to NaN
-        df['Adapter_Wattage'] = pd.to_numeric(df['Adapter_Wattage'], errors='coerce')
-        print("- Cleaned 'Adapter' column into 'Adapter_Wattage' (numeric).")
-
-    # 7. Clean Battery_Life Column
-    if 'Battery_Life' in df.columns:
-        df['Battery_Life_Hours'] = df['Battery_Life'].astype(str).str.lower()
-        # Extract the first number (integer or float) found
-        df['Battery_Life_Hours'] = df['Battery_Life_Hours'].str.extract(r'(\d+\.?\d*)')
-        df['Battery_Life_Hours'] = pd.to_numeric(df['Battery_Life_Hours'], errors='coerce')
-        print("- Cleaned 'Battery_Life' column into 'Battery_Life_Hours' (numeric).")
-
-    # 8. Drop original columns that have been transformed
-    columns_to_drop = ['RAM', 'Ghz', 'SSD', 'HDD', 'Adapter', 'Battery_Life']
-    existing_cols_to_drop = [col for col in columns_to_drop if col in df.columns]
-    if existing_cols_to_drop:
-        df.drop(columns=existing_cols_to_drop, axis=1, inplace=True)
-        print(f"- Dropped original columns: {', '.join(existing_cols_to_drop)}.")
+    # The transformed frame is assembled from references to the kept raw columns instead
+    # of a full df_raw.copy(): every later step assigns whole new columns, so df_raw is
+    # never modified, and the source columns of steps 2-7 are never copied at all.
+    source_columns = [rule['source'] for rule in UNIT_COLUMN_RULES.values()] + list(STORAGE_COLUMN_SOURCES.values())
+    with timed_stage('transform.01_drop_index', rows_in=n_rows) as stage:
+        kept_columns = [col for col in df_raw.columns if col != 'Unnamed: 0' and col not in source_columns]
+        df = pd.DataFrame({col: df_raw[col] for col in kept_columns}, index=df_raw.index, copy=False)
+        stage.rows_out = len(df)
+    if 'Unnamed: 0' in df_raw.columns:
+        logger.info("- Dropped 'Unnamed: 0' column.")
+
+    # 2-7. Clean the unit-string columns into numbers: RAM, Ghz, Adapter and Battery_Life
+    # through their compiled UNIT_COLUMN_RULES, SSD and HDD through the storage parser.
+    for step, target in CLEANING_STEPS:
+        source = UNIT_COLUMN_RULES[target]['source'] if target in UNIT_COLUMN_RULES else STORAGE_COLUMN_SOURCES[target]
+        if source not in df_raw.columns:
+            continue
+        with timed_stage(f'transform.{step}', rows_in=n_rows) as stage:
+            if target in COMPILED_UNIT_COLUMN_RULES:
+                df[target] = COMPILED_UNIT_COLUMN_RULES[target](df_raw[source])
+            else:
+                df[target] = parse_storage_column(df_raw[source], parse_cache)
+            stage.rows_out = len(df)
+        logger.info(f"- Cleaned '{source}' column into '{target}' (numeric).")
+
+    # 8. The original columns transformed above were never copied into the frame
+    dropped_originals = [col for col in df_raw.columns if col in source_columns]
+    if dropped_originals:
+        logger.info(f"- Dropped original columns: {', '.join(dropped_originals)}.")
 
     # --- Feature Engineering ---
-    print("\nStarting feature engineering...")
+    logger.info("Starting feature engineering...")
 
     # 9. Refine Processor_Brand and Engineer Processor Features
+    # All four features come from a single vectorized scan of 'Processor_Name'
+    # (see engineer_processor_features); the extract_* helpers remain the reference.
     if 'Processor_Name' in df.columns:
-        df['Processor_Brand_Cleaned'] = df['Processor_Name'].apply(extract_processor_brand)
-        # Overwrite original Processor_Brand if it exists, or use the new one
-        df['Processor_Brand'] = df['Processor_Brand_Cleaned']
-        df.drop('Processor_Brand_Cleaned', axis=1, inplace=True)
-        print("- Refined 'Processor_Brand'.")
-
-        df['Processor_Series'] = df['Processor_Name'].apply(extract_processor_series)
-        print("- Engineered 'Processor_Series'.")
-        df['Processor_Generation'] = df['Processor_Name'].apply(extract_processor_generation)
-        print("- Engineered 'Processor_Generation'.")
-        df['Processor_Core_Info'] = df['Processor_Name'].apply(extract_core_info)
-        print("- Engineered 'Processor_Core_Info'.")
+        with timed_stage('transform.09_processor_features', rows_in=n_rows) as stage:
+            processor_features = engineer_processor_features(df['Processor_Name'], parse_cache)
+            # Overwrite original Processor_Brand if it exists, or use the new one
+            df['Processor_Brand'] = processor_features['Processor_Brand']
+            df['Processor_Series'] = processor_features['Processor_Series']
+            df['Processor_Generation'] = processor_features['Processor_Generation']
+            df['Processor_Core_Info'] = processor_features['Processor_Core_Info']
+            stage.rows_out = len(df)
+        logger.info("- Refined 'Processor_Brand'.")
+        logger.info("- Engineered 'Processor_Series'.")
+        logger.info("- Engineered 'Processor_Generation'.")
+        logger.info("- Engineered 'Processor_Core_Info'.")
 
     # 10. Engineer Display_Size_Inches
     if 'Display' in df.columns:
-        # Attempt to extract a number, assuming it's inches.
-        # This regex looks for numbers, possibly with a decimal, that might be followed by ' inch' or '\"'
-        # More robustly extract the first number sequence found, assuming it is the display size.
-        df['Display_Size_Inches'] = df['Display'].astype(str).str.extract(r'^\s*(\d+\.?\d*)')
-        df['Display_Size_Inches'] = pd.to_numeric(df['Display_Size_Inches'], errors='coerce')
-        # df.drop('Display', axis=1, inplace=True) # Optional: drop original Display column
-        print("- Engineered 'Display_Size_Inches' from 'Display' column.")
+        with timed_stage('transform.10_display_size', rows_in=n_rows) as stage:
+            # Attempt to extract a number, assuming it's inches.
+            # This regex looks for numbers, possibly with a decimal, that might be followed by ' inch' or '\"'
+            # More robustly extract the first number sequence found, assuming it is the display size.
+            df['Display_Size_Inches'] = df['Display'].astype(str).str.extract(r'^\s*(\d+\.?\d*)')
+            df['Display_Size_Inches'] = pd.to_numeric(df['Display_Size_Inches'], errors='coerce')
+            # df.drop('Display', axis=1, inplace=True) # Optional: drop original Display column
+            stage.rows_out = len(df)
+        logger.info("- Engineered 'Display_Size_Inches' from 'Display' column.")
 
     # 11. Engineer Price_Range
     if 'Price' in df.columns:
-        # Define price bins and labels
-        # Adjust bins according to actual price distribution for better categorization
-        price_bins = [0, 30000, 60000, 90000, np.inf]
-        price_labels = ['Budget', 'Mid-Range', 'Upper Mid-Range', 'Premium']
-        df['Price_Range'] = pd.cut(df['Price'], bins=price_bins, labels=price_labels, right=False)
-        print("- Engineered 'Price_Range'.")
-
-    print("\nTransformation steps applied so far:")
-    print(df.info())
-    print("\nSample of transformed data (first 5 rows):")
-    print(df.head())
-
-    return df
\ No newline at end of file
+        with timed_stage('transform.11_price_range', rows_in=n_rows) as stage:
+            # Define price bins and labels
+            # Adjust bins according to actual price distribution for better categorization
+            price_bins = [0, 30000, 60000, 90000, np.inf]
+            price_labels = ['Budget', 'Mid-Range', 'Upper Mid-Range', 'Premium']
+            df['Price_Range'] = pd.cut(df['Price'], bins=price_bins, labels=price_labels, right=False)
+            stage.rows_out = len(df)
+        logger.info("- Engineered 'Price_Range'.")
+
+    # info()/head() are costly on large frames, so only build them when they will be shown
+    if verbose and logger.isEnabledFor(logging.DEBUG):
+        buffer = io.StringIO()
+        df.info(buf=buffer)
+        logger.debug("Transformation steps applied so far:\n%s", buffer.getvalue())
+        logger.debug("Sample of transformed data (first 5 rows):\n%s", df.head())
+
+    return df
@@ -1,6 +1,41 @@
-import kagglehub
+import os
 
-path = kagglehub.dataset_download("pradeepjangirml007/laptop-data-set")
+KAGGLE_DATASET = "pradeepjangirml007/laptop-data-set"
+RAW_CSV_FILENAME = "laptop.csv"  # The CSV file inside the downloaded dataset
 
-print(f"Dataset downloaded to: {path}")
-print("Please inspect this directory to find the actual CSV file name.")
\ No newline at end of file
+
+def download_kaggle_dataset(dataset=KAGGLE_DATASET, csv_filename=RAW_CSV_FILENAME):
+    """
+    Downloads the laptop dataset with kagglehub (reusing its local cache if present).
+
+    kagglehub is only imported here, so importing this module never touches the network.
+
+    Args:
+        dataset (str): The Kaggle dataset handle.
+        csv_filename (str): Name of the CSV file inside the dataset.
+
+    Returns:
+        str: Path of the downloaded CSV file, or None if the download failed.
+    """
+    try:
+        import kagglehub
+    except ImportError:
+        print("Error: kagglehub is not installed; cannot download the dataset.")
+        return None
+    try:
+        path = kagglehub.dataset_download(dataset)
+    except Exception as e:
+        print(f"An error occurred while downloading {dataset}: {e}")
+        return None
+    print(f"Dataset downloaded to: {path}")
+    csv_path = os.path.join(path, csv_filename)
+    if not os.path.exists(csv_path):
+        print(f"Error: {csv_filename} not found in the downloaded dataset at {path}")
+        return None
+    return csv_path
+
+
+if __name__ == "__main__":
+    downloaded_csv = download_kaggle_dataset()
+    if downloaded_csv is not None:
+        print(f"Raw CSV: {downloaded_csv}")
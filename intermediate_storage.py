@@ -0,0 +1,138 @@
+import os
+import shutil
+
+# Formats for the transformed intermediate artifact. CSV keeps the original behaviour;
+# Parquet and Feather (Arrow IPC) keep dtypes such as the Price_Range category and
+# can be memory-mapped when read back. Both columnar formats need pyarrow.
+INTERMEDIATE_FORMATS = {
+    'csv': '.csv',
+    'parquet': '.parquet',
+    'feather': '.feather',
+}
+COLUMNAR_FORMATS = ('parquet', 'feather')
+INTERMEDIATE_STEM = "transformed_laptops"
+CSV_READ_CHUNKSIZE = 100_000  # Rows per chunk when streaming a CSV intermediate back in
+
+
+def intermediate_path(project_root_dir, fmt):
+    """Returns the path of the transformed artifact for the given format."""
+    return os.path.join(project_root_dir, INTERMEDIATE_STEM + INTERMEDIATE_FORMATS[fmt])
+
+
+def detect_format(path):
+    """Infers the intermediate format from a path's extension."""
+    extension = os.path.splitext(path.rstrip(os.sep))[1].lower()
+    for fmt, fmt_extension in INTERMEDIATE_FORMATS.items():
+        if extension == fmt_extension:
+            return fmt
+    raise ValueError(f"Unrecognised intermediate format for '{path}' "
+                     f"(expected one of: {', '.join(INTERMEDIATE_FORMATS.values())}).")
+
+
+def columnar_format_available():
+    try:
+        import pyarrow  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def _write_frame(df, path, fmt):
+    if fmt == 'parquet':
+        df.to_parquet(path, index=False)
+    elif fmt == 'feather':
+        # Feather requires a default RangeIndex. Uncompressed so it can be memory-mapped as is.
+        df.reset_index(drop=True).to_feather(path, compression='uncompressed')
+    else:
+        df.to_csv(path, index=False)
+
+
+def _read_frame(path, fmt):
+    import pandas as pd
+
+    if fmt == 'parquet':
+        return pd.read_parquet(path, memory_map=True)
+    if fmt == 'feather':
+        from pyarrow import feather
+        return feather.read_table(path, memory_map=True).to_pandas()
+    from schema import TRANSFORMED_CSV_DTYPES
+    return pd.read_csv(path, dtype=TRANSFORMED_CSV_DTYPES)
+
+
+def _remove_existing(path):
+    if os.path.isdir(path):
+        shutil.rmtree(path)
+    elif os.path.exists(path):
+        os.remove(path)
+
+
+def save_intermediate(df, path, fmt=None):
+    """Writes the transformed DataFrame to `path` as CSV, Parquet or Feather."""
+    fmt = fmt or detect_format(path)
+    _remove_existing(path)
+    _write_frame(df, path, fmt)
+
+
+class IntermediateChunkWriter:
+    """
+    Writes transformed chunks to the intermediate artifact as they are produced.
+
+    CSV chunks are appended to a single file. Columnar chunks are written as numbered
+    part files inside a directory named like the artifact (e.g. transformed_laptops.parquet/),
+    because chunks may infer slightly different dtypes (an integer column that only gains
+    missing values in a later chunk); reading the parts back concatenates them with
+    the same promotion rules as a single in-memory pass.
+    """
+
+    def __init__(self, path, fmt=None):
+        self.path = path
+        self.fmt = fmt or detect_format(path)
+        self.chunks_written = 0
+        _remove_existing(path)
+        if self.fmt in COLUMNAR_FORMATS:
+            os.makedirs(path)
+
+    def write(self, df):
+        if self.fmt in COLUMNAR_FORMATS:
+            part_path = os.path.join(self.path, f"part-{self.chunks_written:05d}{INTERMEDIATE_FORMATS[self.fmt]}")
+            _write_frame(df, part_path, self.fmt)
+        else:
+            is_first_chunk = self.chunks_written == 0
+            df.to_csv(self.path, index=False, mode='w' if is_first_chunk else 'a', header=is_first_chunk)
+        self.chunks_written += 1
+
+
+def iter_intermediate_chunks(path, fmt=None):
+    """
+    Yields the transformed artifact back as DataFrames, without re-running the transform.
+
+    A single columnar file is yielded whole (memory-mapped); a directory of part files
+    is yielded one part at a time; a CSV is read in CSV_READ_CHUNKSIZE-row chunks, with
+    the declared text columns kept as text.
+    """
+    import pandas as pd
+
+    from schema import TRANSFORMED_CSV_DTYPES
+
+    fmt = fmt or detect_format(path)
+    if os.path.isdir(path):
+        extension = INTERMEDIATE_FORMATS[fmt]
+        for part_name in sorted(name for name in os.listdir(path) if name.endswith(extension)):
+            yield _read_frame(os.path.join(path, part_name), fmt)
+    elif fmt in COLUMNAR_FORMATS:
+        yield _read_frame(path, fmt)
+    else:
+        with pd.read_csv(path, dtype=TRANSFORMED_CSV_DTYPES, chunksize=CSV_READ_CHUNKSIZE) as reader:
+            for chunk in reader:
+                yield chunk
+
+
+def load_intermediate(path, fmt=None):
+    """Reads the whole transformed artifact back into one DataFrame."""
+    fmt = fmt or detect_format(path)
+    if fmt == 'csv' and not os.path.isdir(path):
+        return _read_frame(path, fmt)
+    import pandas as pd
+
+    parts = list(iter_intermediate_chunks(path, fmt))
+    return parts[0] if len(parts) == 1 else pd.concat(parts, ignore_index=True)
@@ -1,9 +1,47 @@
 import pandas as pd
+import numpy as np
 import sqlite3
 import os
+import logging
+import time
 
+from multi_file_ingest import SOURCE_VERSION_COLUMN
+from pipeline_metrics import timed_stage
 
-def load_df_to_sqlite(df, db_name, table_name, project_root_dir="."):
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 50_000  # Rows per executemany() call in the bulk loader
+ROWS_PER_INSERT = 10  # Rows bound to each multi-row INSERT statement (see insert_df_rows)
+SQLITE_MAX_VARIABLES = 999  # Bound parameters per statement allowed by every SQLite version
+# PRAGMAs applied by the bulk loader. WAL lets readers keep querying the old table while
+# a load runs; synchronous=NORMAL is durable across application crashes in WAL mode.
+# synchronous=OFF and larger or smaller caches measured no faster at 1M rows.
+DEFAULT_LOAD_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'cache_size': -256_000,  # Negative means KiB, i.e. ~256 MB of page cache
+    'temp_store': 'MEMORY',
+}
+# Upsert loads stage the whole input in a TEMP table until the merge; on disk it is paged
+# through a small cache, so a streamed upsert stays within bounded memory.
+UPSERT_LOAD_PRAGMAS = {**DEFAULT_LOAD_PRAGMAS, 'temp_store': 'FILE'}
+STAGING_TABLE_SUFFIX = "__staging"
+
+# Incremental (upsert) loads key each listing on the product ID embedded at the end of
+# 'Name', e.g. "...Laptop (...)::585119::computer::laptops" -> 585119.
+PRODUCT_ID_PATTERN = r'::(\d+)::[^:]*::[^:]*$'
+PRODUCT_ID_COLUMN = 'Product_ID'
+ROW_HASH_COLUMN = 'Row_Hash'
+INCOMING_TABLE_NAME = "_incoming_rows"
+# Per-table load generation, bumped in the same transaction as every load that changes
+# the table; readers (see query_service.py) use it to tell when cached results are stale.
+LOAD_GENERATION_TABLE = "_load_generations"
+# First characters of text that can parse as a number ('14', '-1', '.5', ' 3', 'inf', 'NaN');
+# Row_Hash only tries to parse text values starting with one of them.
+NUMBER_START_CHARACTERS = frozenset('0123456789+-. \tiInN')
+
+
+def load_df_to_sqlite(df, db_name, table_name, project_root_dir=".", if_exists="replace", summaries=None):
     """
     Loads a pandas DataFrame into a specified SQLite database and table.
 
@@ -12,6 +50,9 @@ def load_df_to_sqlite(df, db_name, table_name, project_root_dir="."):
         db_name (str): The name of the SQLite database file (e.g., 'laptops_analytics.db').
         table_name (str): The name of the table to create/replace in the database.
         project_root_dir (str): The root directory of the project, to ensure db is saved there.
+        if_exists (str): Passed through to `DataFrame.to_sql` ('replace' or 'append').
+        summaries (SummaryTables): Summary tables rebuilt from the loaded table in the same
+            transaction (default SummaryTables(); SummaryTables(enabled=False) drops them).
     """
     if df is None:
         print("Error: DataFrame is None. Cannot load to SQLite.")
@@ -23,10 +64,14 @@ def load_df_to_sqlite(df, db_name, table_name, project_root_dir="."):
         conn = sqlite3.connect(db_path)
         print(f"Successfully connected to SQLite database: {db_path}")
 
-        # Load the DataFrame into the SQLite table
-        # if_exists='replace' will drop the table first if it exists and create a new one.
+        # Load the DataFrame into a staging table first: to_sql commits as it goes (the
+        # drop, the create and the inserts are separate transactions), so the target table
+        # only changes below, in one transaction together with its load generation.
         # index=False will prevent pandas from writing DataFrame index as a column.
-        df.to_sql(name=table_name, con=conn, if_exists='replace', index=False)
+        staging_table = table_name + STAGING_TABLE_SUFFIX
+        df.to_sql(name=staging_table, con=conn, if_exists='replace', index=False)
+        _swap_in_staging_table(conn, staging_table, table_name, append=if_exists == 'append',
+                               summaries=_summaries_or_default(summaries))
 
         print(f"Successfully loaded DataFrame into table '{table_name}' in database '{db_name}'.")
 
@@ -43,4 +88,574 @@ def load_df_to_sqlite(df, db_name, table_name, project_root_dir="."):
     finally:
         if 'conn' in locals() and conn:
             conn.close()
-            print(f"SQLite connection to '{db_name}' closed.")
\ No newline at end of file
+            print(f"SQLite connection to '{db_name}' closed.")
+
+
+def _swap_in_staging_table(conn, staging_table, table_name, append=False, summaries=None):
+    """
+    Replaces `table_name` with `staging_table` (or, with `append`, appends its rows to an
+    existing `table_name`) in one transaction that also bumps the load generation and,
+    given `summaries`, rebuilds the summary tables from the result.
+    """
+    # Imported here: text_search imports this module.
+    from text_search import sync_text_search_in_transaction
+
+    target, staging = quote_identifier(table_name), quote_identifier(staging_table)
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        if append and _table_columns(conn, table_name):
+            columns = ', '.join(quote_identifier(col) for col in _table_columns(conn, staging_table))
+            conn.execute(f"INSERT INTO {target} ({columns}) SELECT {columns} FROM {staging}")
+            conn.execute(f"DROP TABLE {staging}")
+        else:
+            conn.execute(f"DROP TABLE IF EXISTS {target}")
+            conn.execute(f"ALTER TABLE {staging} RENAME TO {target}")
+        sync_text_search_in_transaction(conn, table_name)
+        if summaries is not None:
+            summaries.rebuild(conn, table_name)
+        bump_load_generation(conn, table_name)
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def quote_identifier(name):
+    """Quotes a table/column name for use in SQLite statements."""
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def sqlite_column_type(dtype):
+    """Maps a pandas dtype to the SQLite column type used in CREATE TABLE."""
+    if pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_integer_dtype(dtype):
+        return 'INTEGER'
+    if pd.api.types.is_float_dtype(dtype):
+        return 'REAL'
+    return 'TEXT'
+
+
+def build_create_table_sql(df, table_name, primary_key=None, temporary=False):
+    """Builds an explicit, typed CREATE TABLE statement for the columns of `df`."""
+    columns = ',\n    '.join(
+        f"{quote_identifier(col)} {sqlite_column_type(dtype)}{' PRIMARY KEY' if col == primary_key else ''}"
+        for col, dtype in df.dtypes.items()
+    )
+    create = "CREATE TEMP TABLE" if temporary else "CREATE TABLE"
+    return f"{create} {quote_identifier(table_name)} (\n    {columns}\n)"
+
+
+def _column_to_python(series):
+    """
+    Converts a column to a sequence of plain Python values, with NaN for missing.
+
+    SQLite stores a bound NaN as NULL, and the sqlite3 module binds a float several times
+    faster than None (None goes through its adapter lookup on every value).
+    """
+    if series.dtype.kind == 'f' or (series.dtype.kind in 'iub' and not series.hasnans):
+        # Numeric columns: tolist() boxes them directly, keeping NaN for missing.
+        return series.tolist()
+    values = series.to_numpy(dtype=object)
+    missing = pd.isna(values)
+    if missing.any():
+        values[missing] = np.nan
+    return values
+
+
+def build_insert_sql(table_name, columns, rows=1, verb="INSERT"):
+    """Builds an INSERT statement with placeholders for `rows` rows of `columns`."""
+    column_list = ', '.join(quote_identifier(col) for col in columns)
+    row = f"({', '.join('?' * len(columns))})"
+    return f"{verb} INTO {quote_identifier(table_name)} ({column_list}) VALUES {', '.join([row] * rows)}"
+
+
+def insert_df_rows(conn, table_name, df, batch_size=DEFAULT_BATCH_SIZE, verb="INSERT"):
+    """
+    Inserts the rows of `df` into `table_name` with batched executemany, in the caller's transaction.
+
+    Rows are sent ROWS_PER_INSERT at a time through one multi-row INSERT: most of the cost
+    of executemany is per statement execution, not per bound value.
+
+    Args:
+        conn (sqlite3.Connection): The connection to insert through.
+        table_name (str): The table to insert into; its columns are named after df's.
+        df (pd.DataFrame): The rows to insert.
+        batch_size (int): Rows converted to Python values and passed to one executemany() call.
+        verb (str): "INSERT" or e.g. "INSERT OR REPLACE".
+    """
+    columns = list(df.columns)
+    rows_per_insert = max(1, min(ROWS_PER_INSERT, SQLITE_MAX_VARIABLES // max(1, len(columns))))
+    multi_row_sql = build_insert_sql(table_name, columns, rows_per_insert, verb)
+    single_row_sql = build_insert_sql(table_name, columns, 1, verb)
+    for start in range(0, len(df), batch_size):
+        part = df.iloc[start:start + batch_size]
+        values = np.empty((len(part), len(columns)), dtype=object)
+        for position in range(len(columns)):
+            values[:, position] = _column_to_python(part.iloc[:, position])
+        whole = len(part) - len(part) % rows_per_insert
+        conn.executemany(multi_row_sql, values[:whole].reshape(-1, rows_per_insert * len(columns)).tolist())
+        conn.executemany(single_row_sql, values[whole:].tolist())
+
+
+def apply_pragmas(conn, pragmas):
+    for name, value in pragmas.items():
+        conn.execute(f"PRAGMA {name}={value}")
+
+
+def bump_load_generation(conn, table_name):
+    """Records that a load changed `table_name`; call inside the load's committing transaction."""
+    conn.execute(f"CREATE TABLE IF NOT EXISTS {quote_identifier(LOAD_GENERATION_TABLE)} "
+                 f"(table_name TEXT PRIMARY KEY, generation INTEGER NOT NULL, loaded_at REAL NOT NULL)")
+    conn.execute(f"INSERT INTO {quote_identifier(LOAD_GENERATION_TABLE)} (table_name, generation, loaded_at) "
+                 f"VALUES (?, 1, ?) ON CONFLICT(table_name) DO UPDATE SET "
+                 f"generation = generation + 1, loaded_at = excluded.loaded_at", (table_name, time.time()))
+
+
+def load_generation(conn, table_name):
+    """Current load generation of `table_name` (0 if it was never loaded since generations were tracked)."""
+    try:
+        row = conn.execute(f"SELECT generation FROM {quote_identifier(LOAD_GENERATION_TABLE)} "
+                           f"WHERE table_name = ?", (table_name,)).fetchone()
+    except sqlite3.OperationalError:  # No load has created the table yet
+        return 0
+    return 0 if row is None else row[0]
+
+
+def _summaries_or_default(summaries):
+    """The summary tables a load maintains: `summaries`, or SummaryTables() if None."""
+    # Imported here: summary_tables imports this module.
+    from summary_tables import SummaryTables
+
+    return SummaryTables() if summaries is None else summaries
+
+
+class SQLiteBulkLoader:
+    """
+    Bulk-loads DataFrames into a staging table, then atomically swaps it in for the target.
+
+    The staging table is created with an explicit typed schema from the first DataFrame
+    written. Each `write()` inserts its rows with batched `executemany` inside a single
+    transaction. `commit()` drops the old target table and renames the staging table in
+    one transaction, so readers see either the old table or the complete new one. An
+    existing full-text search index (see text_search.py) is rebuilt in that transaction.
+
+    Every written frame is folded into `summaries` (a summary_tables.SummaryTables, by
+    default SummaryTables()) and the summary tables are replaced in the same swap
+    transaction; pass SummaryTables(enabled=False) to drop them there instead.
+    """
+
+    def __init__(self, db_path, table_name, batch_size=DEFAULT_BATCH_SIZE, pragmas=None, summaries=None):
+        self.db_path = db_path
+        self.summaries = _summaries_or_default(summaries)
+        self.table_name = table_name
+        self.staging_table_name = table_name + STAGING_TABLE_SUFFIX
+        self.batch_size = batch_size
+        self.rows_written = 0
+        self._columns = None
+        # isolation_level=None: transactions are managed explicitly below.
+        self.conn = sqlite3.connect(db_path, isolation_level=None)
+        apply_pragmas(self.conn, DEFAULT_LOAD_PRAGMAS if pragmas is None else pragmas)
+
+    def _create_staging_table(self, df):
+        self._columns = list(df.columns)
+        self.conn.execute(f"DROP TABLE IF EXISTS {quote_identifier(self.staging_table_name)}")
+        self.conn.execute(build_create_table_sql(df, self.staging_table_name))
+
+    def write(self, df):
+        """Appends the rows of `df` to the staging table in one transaction."""
+        if self._columns is None:
+            self._create_staging_table(df)
+        elif list(df.columns) != self._columns:
+            raise ValueError(f"Columns of this frame do not match the staging table '{self.staging_table_name}'.")
+
+        self.conn.execute("BEGIN")
+        try:
+            insert_df_rows(self.conn, self.staging_table_name, df, self.batch_size)
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.rows_written += len(df)
+        self.summaries.add_chunk(df)
+        return len(df)
+
+    def commit(self):
+        """Atomically replaces the target table with the staging table."""
+        # Imported here: text_search imports this module.
+        from text_search import sync_text_search_in_transaction
+
+        if self._columns is None:
+            raise ValueError("Nothing was written; refusing to replace the table with an empty one.")
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self.conn.execute(f"DROP TABLE IF EXISTS {quote_identifier(self.table_name)}")
+            self.conn.execute(f"ALTER TABLE {quote_identifier(self.staging_table_name)} "
+                              f"RENAME TO {quote_identifier(self.table_name)}")
+            # Dropping the old table dropped the index's sync triggers, and the index still
+            # holds the old rowids; rebuild it before the new table becomes visible.
+            sync_text_search_in_transaction(self.conn, self.table_name)
+            self.summaries.write_replacement(self.conn)
+            bump_load_generation(self.conn, self.table_name)
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+
+    def abort(self):
+        """Drops the staging table, leaving the target table untouched."""
+        self.conn.execute(f"DROP TABLE IF EXISTS {quote_identifier(self.staging_table_name)}")
+
+    def close(self):
+        self.conn.close()
+
+
+def load_df_chunks_to_sqlite(df_chunks, db_name, table_name, project_root_dir=".",
+                             batch_size=DEFAULT_BATCH_SIZE, pragmas=None, summaries=None):
+    """
+    Bulk-loads an iterable of DataFrame chunks into a SQLite table (see SQLiteBulkLoader).
+
+    All chunks go to a staging table which replaces `table_name` only once every chunk
+    has been written, so only one chunk needs to be in memory at a time and readers
+    never see a half-loaded table.
+
+    Args:
+        df_chunks (iterable of pd.DataFrame): The chunks to load, in order.
+        db_name (str): The name of the SQLite database file (e.g., 'laptops_analytics.db').
+        table_name (str): The name of the table to create/replace in the database.
+        project_root_dir (str): The root directory of the project, to ensure db is saved there.
+        batch_size (int): Rows per executemany() call.
+        pragmas (dict): PRAGMA name -> value applied for the load (default DEFAULT_LOAD_PRAGMAS).
+        summaries (SummaryTables): Summary tables rebuilt from the chunks as they load
+            (default SummaryTables(); SummaryTables(enabled=False) drops them).
+
+    Returns:
+        int: The number of rows written, or None if an error occurred.
+    """
+    db_path = os.path.join(project_root_dir, db_name)
+
+    try:
+        loader = SQLiteBulkLoader(db_path, table_name, batch_size=batch_size, pragmas=pragmas, summaries=summaries)
+        print(f"Successfully connected to SQLite database: {db_path}")
+
+        try:
+            for chunk_number, chunk in enumerate(df_chunks):
+                with timed_stage('load.write_chunk', rows_in=len(chunk), chunk=chunk_number + 1) as stage:
+                    loader.write(chunk)
+                    stage.rows_out = len(chunk)
+                logger.debug(f"- Chunk {chunk_number + 1}: wrote {len(chunk)} rows ({loader.rows_written} total).")
+            with timed_stage('load.commit', rows_in=loader.rows_written):
+                loader.commit()
+        except Exception:
+            loader.abort()
+            raise
+
+        count = loader.conn.execute(f"SELECT COUNT(*) FROM {quote_identifier(table_name)}").fetchone()[0]
+        print(f"Successfully loaded {loader.rows_written} rows into table '{table_name}' in database '{db_name}'.")
+        print(f"Table '{table_name}' now contains {count} rows.")
+        return loader.rows_written
+
+    except sqlite3.Error as e:
+        print(f"SQLite error occurred: {e}")
+    except Exception as e:
+        print(f"An unexpected error occurred: {e}")
+    finally:
+        if 'loader' in locals() and loader:
+            loader.close()
+            print(f"SQLite connection to '{db_name}' closed.")
+    return None
+
+
+def bulk_load_df_to_sqlite(df, db_name, table_name, project_root_dir=".",
+                           batch_size=DEFAULT_BATCH_SIZE, pragmas=None, summaries=None):
+    """
+    High-throughput replacement for load_df_to_sqlite (see load_df_chunks_to_sqlite).
+
+    Returns:
+        int: The number of rows written, or None if an error occurred.
+    """
+    if df is None:
+        print("Error: DataFrame is None. Cannot load to SQLite.")
+        return None
+    return load_df_chunks_to_sqlite([df], db_name, table_name, project_root_dir=project_root_dir,
+                                    batch_size=batch_size, pragmas=pragmas, summaries=summaries)
+
+
+def _canonical_value_hashes(series):
+    """
+    64-bit hash of every value of a column, the same for a number and for its text form.
+
+    The transform keeps some all-numeric text columns (e.g. a 'Display' of '14', '15.6')
+    as strings or categories, while reading the CSV artifact back infers them as floats,
+    and integers are downcast or widened depending on the path. So every value that
+    reads as a number is hashed as that float64 number, whatever its dtype, and every
+    other value as its string; missing values all hash alike.
+    """
+    if pd.api.types.is_numeric_dtype(series):  # Including bool and nullable integer columns
+        return pd.util.hash_array(series.to_numpy(dtype='float64', na_value=np.nan))
+    # Text and category columns: canonicalize each distinct value once.
+    codes, uniques = pd.factorize(series)
+    text = np.asarray(uniques, dtype=object).astype(str).astype(object)
+    candidates = np.fromiter((value[:1] in NUMBER_START_CHARACTERS for value in text), dtype=bool, count=len(text))
+    numbers = np.full(len(text), np.nan)
+    numbers[candidates] = pd.to_numeric(pd.Series(text[candidates]), errors='coerce').to_numpy(dtype='float64')
+    is_number = ~np.isnan(numbers)
+    unique_hashes = pd.util.hash_array(text)
+    unique_hashes[is_number] = pd.util.hash_array(numbers[is_number])
+    # factorize codes missing values as -1, which picks the NaN hash appended last.
+    unique_hashes = np.append(unique_hashes, pd.util.hash_array(np.array([np.nan])))
+    return unique_hashes[codes]
+
+
+def row_hashes(df):
+    """
+    64-bit hash of each row of `df`, independent of column dtypes: the same listing hashes
+    the same whether it comes straight from the transform (downcast ints, float32,
+    categories, numeric text) or back from the CSV/Parquet artifact.
+    """
+    column_hashes = pd.DataFrame({position: _canonical_value_hashes(df[col])
+                                  for position, col in enumerate(df.columns)}, index=df.index)
+    return pd.util.hash_pandas_object(column_hashes, index=False).to_numpy().view(np.int64)
+
+
+def extract_product_ids(names):
+    """Product IDs embedded in a 'Name' column (see PRODUCT_ID_PATTERN), NaN where there is none."""
+    return pd.to_numeric(names.astype(str).str.extract(PRODUCT_ID_PATTERN)[0], errors='coerce')
+
+
+def add_upsert_keys(df):
+    """
+    Returns a copy of `df` with 'Product_ID' (from 'Name') and 'Row_Hash' columns prepended.
+
+    Row_Hash is a 64-bit hash of every other column of the row, used to detect changed
+    listings. Rows whose Name has no product ID cannot be keyed and are dropped.
+    """
+    product_ids = extract_product_ids(df['Name'])
+    keyed = df[product_ids.notna()]
+    skipped = len(df) - len(keyed)
+    if skipped:
+        print(f"Warning: {skipped} rows have no product ID in 'Name' and were skipped.")
+    keys = pd.DataFrame({PRODUCT_ID_COLUMN: product_ids[product_ids.notna()].astype(np.int64),
+                         ROW_HASH_COLUMN: row_hashes(keyed)}, index=keyed.index)
+    return pd.concat([keys, keyed], axis=1)
+
+
+def _table_columns(conn, table_name):
+    return [row[1] for row in conn.execute(f"PRAGMA table_info({quote_identifier(table_name)})")]
+
+
+def _migrate_to_keyed_table(conn, table_name, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Rebuilds a table from a full (replace) load, which has no key to upsert on, as a keyed
+    table: every stored row gets its Product_ID and Row_Hash (see add_upsert_keys), read
+    back in chunks of `batch_size` rows. Like an upsert, the last row of a product ID
+    wins. Runs in the caller's transaction.
+
+    Raises:
+        ValueError: If a stored row has no product ID; it could not be kept.
+    """
+    target = quote_identifier(table_name)
+    migrated_table = table_name + STAGING_TABLE_SUFFIX
+    migrated = quote_identifier(migrated_table)
+    declared = [(row[1], row[2]) for row in conn.execute(f"PRAGMA table_info({target})")]
+    if 'Name' not in dict(declared):
+        raise ValueError(f"Table '{table_name}' has neither '{PRODUCT_ID_COLUMN}' nor 'Name' to key it on; "
+                         f"reload it with a replace load.")
+    columns = [f"{quote_identifier(PRODUCT_ID_COLUMN)} INTEGER PRIMARY KEY",
+               f"{quote_identifier(ROW_HASH_COLUMN)} INTEGER"]
+    columns += [f"{quote_identifier(col)} {col_type}" for col, col_type in declared]
+    conn.execute(f"DROP TABLE IF EXISTS {migrated}")
+    conn.execute(f"CREATE TABLE {migrated} ({', '.join(columns)})")
+
+    stored = 0
+    for chunk in pd.read_sql_query(f"SELECT * FROM {target}", conn, chunksize=batch_size):
+        unkeyed = int(extract_product_ids(chunk['Name']).isna().sum())
+        if unkeyed:
+            raise ValueError(f"Table '{table_name}' has rows without a product ID in 'Name'; they cannot be "
+                             f"migrated to an incremental table, so it was left unchanged.")
+        insert_df_rows(conn, migrated_table, add_upsert_keys(chunk), batch_size, verb="INSERT OR REPLACE")
+        stored += len(chunk)
+    kept = conn.execute(f"SELECT COUNT(*) FROM {migrated}").fetchone()[0]
+    conn.execute(f"DROP TABLE {target}")
+    conn.execute(f"ALTER TABLE {migrated} RENAME TO {target}")
+    print(f"Table '{table_name}' had no '{PRODUCT_ID_COLUMN}' key; migrated its {stored} rows to a keyed table "
+          f"({stored - kept} duplicate product IDs collapsed).")
+
+
+def _prepare_upsert_table(conn, df, table_name, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Creates the keyed target table if needed, migrating a table from a full load (see
+    _migrate_to_keyed_table); adds any columns it is missing.
+
+    Returns:
+        bool: True if an existing table was migrated.
+    """
+    existing_columns = _table_columns(conn, table_name)
+    migrated = bool(existing_columns) and PRODUCT_ID_COLUMN not in existing_columns
+    if migrated:
+        _migrate_to_keyed_table(conn, table_name, batch_size)
+        existing_columns = _table_columns(conn, table_name)
+    if not existing_columns:
+        conn.execute(build_create_table_sql(df, table_name, primary_key=PRODUCT_ID_COLUMN))
+        return migrated
+    for col, dtype in df.dtypes.items():
+        if col not in existing_columns:
+            conn.execute(f"ALTER TABLE {quote_identifier(table_name)} "
+                         f"ADD COLUMN {quote_identifier(col)} {sqlite_column_type(dtype)}")
+    return migrated
+
+
+def _keep_newer_stored_versions(conn, table_name, columns):
+    """
+    Replaces staged rows that are older than the stored row for the same product (by
+    Source_Version, see multi_file_ingest.py) with that stored row, so they merge as
+    unchanged instead of overwriting newer data. Returns the number of rows replaced.
+    """
+    if SOURCE_VERSION_COLUMN not in columns or SOURCE_VERSION_COLUMN not in _table_columns(conn, table_name):
+        return 0
+    target, incoming = quote_identifier(table_name), quote_identifier(INCOMING_TABLE_NAME)
+    key, version = quote_identifier(PRODUCT_ID_COLUMN), quote_identifier(SOURCE_VERSION_COLUMN)
+    column_list = ', '.join(quote_identifier(col) for col in columns)
+    t_columns = ', '.join(f"t.{quote_identifier(col)}" for col in columns)
+    cursor = conn.execute(
+        f"INSERT OR REPLACE INTO {incoming} ({column_list}) SELECT {t_columns} "
+        f"FROM {incoming} AS i JOIN {target} AS t ON t.{key} = i.{key} WHERE t.{version} > i.{version}")
+    return cursor.rowcount
+
+
+def upsert_df_chunks_to_sqlite(df_chunks, db_name, table_name, project_root_dir=".", delete_missing=False,
+                               batch_size=DEFAULT_BATCH_SIZE, pragmas=None, summaries=None):
+    """
+    Incrementally loads DataFrame chunks into a SQLite table keyed on the product ID.
+
+    Every chunk is keyed (see add_upsert_keys) and staged in a temporary table; when a
+    product ID appears more than once the last row wins. The staged rows are then
+    merged in one transaction with INSERT ... ON CONFLICT: new products are inserted,
+    products whose Row_Hash changed are updated, unchanged rows are not touched, and,
+    with `delete_missing`, products absent from the input are deleted. A row tagged with
+    an older Source_Version than the stored one never replaces it (it counts as unchanged).
+
+    Args:
+        df_chunks (iterable of pd.DataFrame): The transformed rows, in one or more chunks.
+        db_name (str): The name of the SQLite database file (e.g., 'laptops_analytics.db').
+        table_name (str): The name of the table to upsert into.
+        project_root_dir (str): The root directory of the project, to ensure db is saved there.
+        delete_missing (bool): Delete rows whose product ID is not in the input.
+        batch_size (int): Rows per executemany() call.
+        pragmas (dict): PRAGMA name -> value applied for the load (default UPSERT_LOAD_PRAGMAS).
+        summaries (SummaryTables): Summary tables updated with the delta in the same transaction
+            (default SummaryTables(); SummaryTables(enabled=False) drops them).
+
+    Returns:
+        dict: Counts of 'inserted', 'updated', 'unchanged', 'deleted', 'duplicates' and
+        'outdated' (older than the stored version) rows, or None if an error occurred.
+    """
+    # Imported here: text_search imports this module.
+    from text_search import sync_text_search_in_transaction
+
+    db_path = os.path.join(project_root_dir, db_name)
+    summaries = _summaries_or_default(summaries)
+    target = quote_identifier(table_name)
+    incoming = quote_identifier(INCOMING_TABLE_NAME)
+    key = quote_identifier(PRODUCT_ID_COLUMN)
+    row_hash = quote_identifier(ROW_HASH_COLUMN)
+
+    try:
+        conn = sqlite3.connect(db_path, isolation_level=None)
+        apply_pragmas(conn, UPSERT_LOAD_PRAGMAS if pragmas is None else pragmas)
+        print(f"Successfully connected to SQLite database: {db_path}")
+
+        columns = None
+        rows_received = 0
+        for chunk_number, chunk in enumerate(df_chunks):
+            with timed_stage('load.stage_chunk', rows_in=len(chunk), chunk=chunk_number + 1) as stage:
+                keyed = add_upsert_keys(chunk)
+                if columns is None:
+                    columns = list(keyed.columns)
+                    conn.execute(build_create_table_sql(keyed, INCOMING_TABLE_NAME, primary_key=PRODUCT_ID_COLUMN,
+                                                        temporary=True))
+                conn.execute("BEGIN")
+                insert_df_rows(conn, INCOMING_TABLE_NAME, keyed[columns], batch_size, verb="INSERT OR REPLACE")
+                conn.execute("COMMIT")
+                rows_received += len(keyed)
+                stage.rows_out = len(keyed)
+
+        if columns is None:
+            print("No rows to load; skipping incremental load.")
+            return None
+
+        with timed_stage('load.merge', rows_in=rows_received) as stage:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                if _prepare_upsert_table(conn, keyed, table_name, batch_size):
+                    # The summaries counted the migrated table's collapsed duplicates; rebuild them.
+                    summaries.drop(conn)
+                outdated = _keep_newer_stored_versions(conn, table_name, columns)
+                staged = conn.execute(f"SELECT COUNT(*) FROM {incoming}").fetchone()[0]
+                inserted = conn.execute(
+                    f"SELECT COUNT(*) FROM {incoming} AS i WHERE NOT EXISTS "
+                    f"(SELECT 1 FROM {target} AS t WHERE t.{key} = i.{key})").fetchone()[0]
+                updated = conn.execute(
+                    f"SELECT COUNT(*) FROM {incoming} AS i JOIN {target} AS t ON t.{key} = i.{key} "
+                    f"WHERE t.{row_hash} IS NOT i.{row_hash}").fetchone()[0]
+                deleted = 0
+                if delete_missing:
+                    deleted = conn.execute(
+                        f"SELECT COUNT(*) FROM {target} AS t WHERE NOT EXISTS "
+                        f"(SELECT 1 FROM {incoming} AS i WHERE i.{key} = t.{key})").fetchone()[0]
+
+                column_list = ', '.join(quote_identifier(col) for col in columns)
+                assignments = ', '.join(f"{quote_identifier(col)} = excluded.{quote_identifier(col)}"
+                                        for col in columns if col != PRODUCT_ID_COLUMN)
+                summaries.apply_upsert_delta(conn, table_name, INCOMING_TABLE_NAME, PRODUCT_ID_COLUMN,
+                                             ROW_HASH_COLUMN, delete_missing=delete_missing)
+                # 'WHERE true' disambiguates the upsert clause from a join constraint in INSERT ... SELECT.
+                conn.execute(
+                    f"INSERT INTO {target} ({column_list}) SELECT {column_list} FROM {incoming} WHERE true "
+                    f"ON CONFLICT({key}) DO UPDATE SET {assignments} "
+                    f"WHERE {target}.{row_hash} IS NOT excluded.{row_hash}")
+                if delete_missing:
+                    conn.execute(f"DELETE FROM {target} WHERE {key} NOT IN (SELECT {key} FROM {incoming})")
+                # The triggers kept the search index current, unless the table was just recreated.
+                sync_text_search_in_transaction(conn, table_name)
+                if inserted or updated or deleted:
+                    bump_load_generation(conn, table_name)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            stage.rows_out = staged
+
+        counts = {
+            'inserted': inserted,
+            'updated': updated,
+            'unchanged': staged - inserted - updated,
+            'deleted': deleted,
+            'duplicates': rows_received - staged,
+            'outdated': outdated,
+        }
+        print(f"Incremental load into '{table_name}': {counts['inserted']} inserted, {counts['updated']} updated, "
+              f"{counts['unchanged']} unchanged, {counts['deleted']} deleted "
+              f"({counts['duplicates']} duplicate product IDs collapsed).")
+        if outdated:
+            print(f"- {outdated} rows were older than the stored version of their product and were not applied.")
+        return counts
+
+    except sqlite3.Error as e:
+        print(f"SQLite error occurred: {e}")
+    except Exception as e:
+        print(f"An unexpected error occurred: {e}")
+    finally:
+        if 'conn' in locals() and conn:
+            conn.close()
+            print(f"SQLite connection to '{db_name}' closed.")
+    return None
+
+
+def upsert_df_to_sqlite(df, db_name, table_name, project_root_dir=".", delete_missing=False,
+                        batch_size=DEFAULT_BATCH_SIZE, pragmas=None, summaries=None):
+    """Incrementally loads a single DataFrame (see upsert_df_chunks_to_sqlite)."""
+    if df is None:
+        print("Error: DataFrame is None. Cannot load to SQLite.")
+        return None
+    return upsert_df_chunks_to_sqlite([df], db_name, table_name, project_root_dir=project_root_dir,
+                                      delete_missing=delete_missing, batch_size=batch_size, pragmas=pragmas,
+                                      summaries=summaries)
@@ -1,152 +1,571 @@
+import argparse
+import io
+import logging
 import os
-import pandas as pd
+import sys
 
-# Import functions from our existing scripts
-import download_dataset
-from data_extraction import load_raw_data
-from data_transformation import transform_laptop_data
-from load_to_sqlite import load_df_to_sqlite
+# Only light modules are imported up front. pandas and the stage modules that need it
+# (transformation, loading, indexing, ...) are imported inside the steps that use them,
+# and kagglehub only when a download actually runs, so a no-op or resume run starts fast
+# and works without network access. The modules imported below keep pandas out of their
+# top level for the same reason and import it inside the functions that need it.
+from data_extraction import DEFAULT_READER_ENGINE, READER_ENGINES
+from concurrent_pipeline import DEFAULT_MAX_IN_FLIGHT
+from pipeline_metrics import configure_metrics, default_metrics_path, timed_stage
+from pipeline_manifest import MANIFEST_FILENAME, PipelineManifest, code_version, file_fingerprint
+from intermediate_storage import (INTERMEDIATE_FORMATS, COLUMNAR_FORMATS, IntermediateChunkWriter,
+                                  columnar_format_available, intermediate_path)
+from multi_file_ingest import resolve_input_files
 
 # Define constants for file paths and names
 # Assuming this script is in laptop_etl_project, and other scripts are also there.
-# The Kaggle download path is more complex, so we'll handle it in download_dataset.
-# For simplicity in this main orchestrator, we'll assume download_dataset.py
-# makes the CSV available at a known relative path or returns the path.
-
-# Let's make download_dataset.py more robust by having it return the CSV path
-# and creating a dedicated function there. For now, we'll use the hardcoded path
-# as in data_extraction.py for the raw CSV, but ideally, this would be dynamic.
+# The raw CSV is read from kagglehub's cache directory below when it is already there;
+# otherwise it is downloaded and read from the path download_kaggle_dataset() returns.
 
 RAW_CSV_PARENT_DIR = os.path.expanduser("~/.cache/kagglehub/datasets/pradeepjangirml007/laptop-data-set/versions/1")
 RAW_CSV_FILENAME = "laptop.csv"  # This is the known filename within the Kaggle download
 RAW_CSV_FULL_PATH = os.path.join(RAW_CSV_PARENT_DIR, RAW_CSV_FILENAME)
 
 TRANSFORMED_CSV_FILENAME = "transformed_laptops.csv"  # Saved in the project directory
+DEFAULT_INTERMEDIATE_FORMAT = "csv"  # Or 'parquet' / 'feather' to keep dtypes (see intermediate_storage.py)
 DB_NAME = "laptops_analytics.db"  # Saved in the project directory
 TABLE_NAME = "laptops_final"
 PROJECT_ROOT_DIR = "."  # Relative to where this script is run (laptop_etl_project)
+DEFAULT_CHUNKSIZE = 100_000  # Rows per chunk when running with --stream
+LOAD_MODES = ("replace", "upsert")  # Full atomic reload, or incremental load keyed on product ID
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR")
+
+logger = logging.getLogger(__name__)
 
 
-def run_download_step():
+def run_download_step(offline=False):
     """
-    Placeholder for a more integrated download step.
-    Currently, download_dataset.py is run manually or separately.
-    A more robust implementation would have download_kaggle_dataset return the path.
-    For now, we just check if the expected raw CSV exists.
+    Makes sure the raw CSV is present, downloading it with kagglehub if it is missing.
+
+    With `offline`, nothing is downloaded and a missing file is an error.
+
+    Returns:
+        str: Path of the raw CSV to read (RAW_CSV_FULL_PATH if it already exists, else
+            wherever the download put it), or None if it is not available.
     """
     print("--- Step 0: Dataset Download (Verification) ---")
-    if not os.path.exists(RAW_CSV_FULL_PATH):
-        print(f"ERROR: Raw dataset {RAW_CSV_FULL_PATH} not found.")
-        print("Please ensure you have run download_dataset.py from kagglehub, or manually place it.")
-        print("Alternatively, modify download_dataset.py to be callable and return the path.")
-        # For now, we call the existing download_dataset.py's function
-        # We need to modify download_dataset.py to have a callable function.
-        # Let's assume download_kaggle_dataset() is defined in download_dataset.py
-        # and it handles the download and prints the path.
-        try:
-            print("Attempting to run Kaggle dataset download...")
-            # Capture the returned path (even if it's None)
-            # The download_kaggle_dataset function is expected to print its own messages.
-            confirmed_path = download_dataset.download_kaggle_dataset()
-
-            if confirmed_path and os.path.exists(confirmed_path):
-                # If download_kaggle_dataset confirms a path and it exists, we're good.
-                # Potentially update RAW_CSV_FULL_PATH if dynamic paths are fully implemented.
-                # For now, we assume confirmed_path IS RAW_CSV_FULL_PATH if not None.
-                print(f"Raw dataset confirmed at: {confirmed_path}")
-                return True  # Indicates success
-            elif os.path.exists(RAW_CSV_FULL_PATH):
-                # Fallback: if the fixed RAW_CSV_FULL_PATH exists, even if confirmed_path was None
-                print(f"Raw dataset found/downloaded (verified by fixed path): {RAW_CSV_FULL_PATH}")
-                return True
-            else:
-                print(
-                    f"Download script ran, but dataset not found at expected path: {RAW_CSV_FULL_PATH} or via confirmation.")
-                return False  # Explicitly return False
-        except Exception as e:
-            print(f"Error during download attempt: {e}")
-            return False
-    else:
+    if os.path.exists(RAW_CSV_FULL_PATH):
         print(f"Raw dataset already exists: {RAW_CSV_FULL_PATH}")
-        return True
+        return RAW_CSV_FULL_PATH
+    print(f"ERROR: Raw dataset {RAW_CSV_FULL_PATH} not found.")
+    if offline:
+        print("Running with --offline, so it is not downloaded; place the file there manually.")
+        return None
+
+    import download_dataset
 
+    print("Attempting to run Kaggle dataset download...")
+    downloaded_path = download_dataset.download_kaggle_dataset()
+    if downloaded_path is None:
+        print("Download failed; no raw dataset to read.")
+        return None
+    print(f"Raw dataset downloaded: {downloaded_path}")
+    return downloaded_path
+
+
+def run_extraction_step(raw_csv_path, use_schema=True, reader_engine=DEFAULT_READER_ENGINE):
+    """Extracts data from the raw CSV file (with the declared raw schema by default)."""
+    from data_extraction import load_raw_data
 
-def run_extraction_step(raw_csv_path):
-    """Extracts data from the raw CSV file."""
     print("\n--- Step 1: Data Extraction ---")
-    raw_df = load_raw_data(raw_csv_path)  # Use the function from data_extraction.py
+    with timed_stage('extract') as stage:
+        raw_df = load_raw_data(raw_csv_path, use_schema=use_schema, engine=reader_engine)
+        stage.rows_out = None if raw_df is None else len(raw_df)
     if raw_df is not None:
         print("Raw data loaded successfully.")
-        raw_df.info()
+        if logger.isEnabledFor(logging.DEBUG):
+            buffer = io.StringIO()
+            raw_df.info(buf=buffer)
+            logger.debug(buffer.getvalue())
     return raw_df
 
 
-def run_transformation_step(raw_df):
-    """Transforms the raw DataFrame."""
+def resolve_intermediate_format(fmt):
+    """Falls back to CSV when a columnar format is requested but pyarrow is not installed."""
+    if fmt in COLUMNAR_FORMATS and not columnar_format_available():
+        print(f"Warning: pyarrow is not installed; writing the intermediate as CSV instead of {fmt}.")
+        return "csv"
+    return fmt
+
+
+def run_transformation_step(raw_df, parse_cache=None, workers=1, intermediate_format=DEFAULT_INTERMEDIATE_FORMAT,
+                            use_schema=True):
+    """
+    Transforms the raw DataFrame, across `workers` processes when workers > 1.
+
+    With `use_schema`, the result is shrunk to the declared transformed dtypes.
+    """
+    from data_transformation import transform_laptop_data
+    from intermediate_storage import save_intermediate
+    from parallel_transform import transform_laptop_data_parallel
+    from schema import optimize_transformed_dtypes, report_memory_usage
+
     print("\n--- Step 2: Data Transformation ---")
-    transformed_df = transform_laptop_data(raw_df)
+    with timed_stage('transform', rows_in=len(raw_df), workers=workers) as stage:
+        if workers > 1:
+            transformed_df = transform_laptop_data_parallel(raw_df, workers=workers,
+                                                            parse_cache_path=parse_cache and parse_cache.db_path)
+        else:
+            transformed_df = transform_laptop_data(raw_df, parse_cache=parse_cache)
+        stage.rows_out = None if transformed_df is None else len(transformed_df)
     if transformed_df is not None:
         print("Data transformed successfully.")
-        # Save the transformed DataFrame to a CSV file
-        transformed_csv_path = os.path.join(PROJECT_ROOT_DIR, TRANSFORMED_CSV_FILENAME)
+        if use_schema:
+            with timed_stage('transform.optimize_dtypes', rows_in=len(transformed_df)):
+                memory_before = transformed_df.memory_usage(deep=True).sum()
+                optimize_transformed_dtypes(transformed_df)
+            report_memory_usage("Transformed data", memory_before, transformed_df.memory_usage(deep=True).sum())
+        # Save the transformed DataFrame as the intermediate artifact (CSV by default)
+        intermediate_format = resolve_intermediate_format(intermediate_format)
+        transformed_path = intermediate_path(PROJECT_ROOT_DIR, intermediate_format)
         try:
-            transformed_df.to_csv(transformed_csv_path, index=False)
-            print(f"Successfully saved transformed data to {transformed_csv_path}")
+            with timed_stage('transform.save_intermediate', rows_in=len(transformed_df), format=intermediate_format):
+                save_intermediate(transformed_df, transformed_path, intermediate_format)
+            print(f"Successfully saved transformed data to {transformed_path}")
         except Exception as e:
-            print(f"Error saving transformed data to CSV: {e}")
+            print(f"Error saving transformed data to {intermediate_format}: {e}")
             # We might still want to return the df for loading if saving fails for some reason
     return transformed_df
 
 
-def run_load_step(transformed_df):
+def load_transformed_chunks(df_chunks, load_mode="replace", delete_missing=False, summaries=True):
+    """
+    Loads transformed chunks with the chosen load mode.
+
+    'replace' bulk-loads into a staging table that atomically replaces the table;
+    'upsert' inserts/updates only new and changed listings keyed on product ID
+    (and deletes vanished ones when `delete_missing` is set). With `summaries`, the
+    aggregate summary tables (see summary_tables.py) are updated in the same transaction;
+    without, they are dropped in it rather than left stale.
+    """
+    from load_to_sqlite import load_df_chunks_to_sqlite, upsert_df_chunks_to_sqlite
+    from summary_tables import SummaryTables
+
+    summary_tables = SummaryTables(enabled=summaries)
+    with timed_stage('load', load_mode=load_mode) as stage:
+        if load_mode == "upsert":
+            result = upsert_df_chunks_to_sqlite(df_chunks, DB_NAME, TABLE_NAME, project_root_dir=PROJECT_ROOT_DIR,
+                                                delete_missing=delete_missing, summaries=summary_tables)
+        else:
+            result = load_df_chunks_to_sqlite(df_chunks, DB_NAME, TABLE_NAME, project_root_dir=PROJECT_ROOT_DIR,
+                                              summaries=summary_tables)
+        stage.rows_out = loaded_row_count(result)
+        if result is None:
+            stage.status = "error"
+    return result
+
+
+def loaded_row_count(load_result):
+    """Rows written by a load: the bulk loader's count, or the upsert's staged rows."""
+    if isinstance(load_result, dict):
+        return load_result['inserted'] + load_result['updated'] + load_result['unchanged']
+    return load_result
+
+
+def run_load_step(transformed_df, load_mode="replace", delete_missing=False, summaries=True):
     """Loads the transformed DataFrame into SQLite."""
-    print("\n--- Step 3: Data Loading ---")
+    print(f"\n--- Step 3: Data Loading ({load_mode}) ---")
     if transformed_df is not None:
-        load_df_to_sqlite(transformed_df, DB_NAME, TABLE_NAME, project_root_dir=PROJECT_ROOT_DIR)
+        result = load_transformed_chunks([transformed_df], load_mode=load_mode, delete_missing=delete_missing,
+                                         summaries=summaries)
         print("Data loading process finished.")
+        return result
+    print("Skipping load step as transformed DataFrame is None.")
+    return None
+
+
+def run_index_step():
+    """Builds the analytics indexes on the freshly loaded table (see sqlite_indexes.py)."""
+    from sqlite_indexes import build_indexes_and_analyze
+
+    print(f"\n--- Step 4: Indexing '{TABLE_NAME}' ---")
+    return build_indexes_and_analyze(DB_NAME, TABLE_NAME, project_root_dir=PROJECT_ROOT_DIR)
+
+
+def run_post_load_steps(args):
+    """
+    Steps after a successful load: analytics indexes (unless --no-indexes), and the
+    full-text search index, created with --text-search and kept in sync once it exists.
+
+    Returns:
+        bool: True if every step succeeded.
+    """
+    from text_search import build_text_search_index
+
+    succeeded = True
+    if not args.no_indexes and run_index_step() is None:
+        print("Building the analytics indexes failed.")
+        succeeded = False
+    if build_text_search_index(DB_NAME, TABLE_NAME, project_root_dir=PROJECT_ROOT_DIR,
+                               create=args.text_search) is None:
+        print("Maintaining the text search index failed.")
+        succeeded = False
+    return succeeded
+
+
+def iter_transformed_chunks(raw_csv_path, chunksize, parse_cache=None, workers=1,
+                            intermediate_format=DEFAULT_INTERMEDIATE_FORMAT, use_schema=True,
+                            reader_engine=DEFAULT_READER_ENGINE):
+    """
+    Extracts and transforms the raw CSV one chunk at a time.
+
+    With workers > 1, chunks are transformed in a process pool and still come back in
+    order. Each transformed chunk is also written to the intermediate artifact, so it
+    is produced without ever holding the full frame in memory.
+    """
+    from data_extraction import iter_raw_data_chunks
+    from data_transformation import transform_laptop_data
+    from parallel_transform import iter_transform_parallel
+    from schema import optimize_transformed_dtypes
+
+    intermediate_format = resolve_intermediate_format(intermediate_format)
+    writer = IntermediateChunkWriter(intermediate_path(PROJECT_ROOT_DIR, intermediate_format), intermediate_format)
+    raw_chunks = iter_raw_data_chunks(raw_csv_path, chunksize, use_schema=use_schema, engine=reader_engine)
+    if workers > 1:
+        transformed_chunks = iter_transform_parallel(raw_chunks, workers=workers,
+                                                     parse_cache_path=parse_cache and parse_cache.db_path)
     else:
-        print("Skipping load step as transformed DataFrame is None.")
+        transformed_chunks = (transform_laptop_data(raw_chunk, verbose=False, parse_cache=parse_cache)
+                              for raw_chunk in raw_chunks)
+    for chunk_number, transformed_chunk in enumerate(transformed_chunks):
+        print(f"\n--- Transformed chunk {chunk_number + 1} ---")
+        if transformed_chunk is None:
+            print(f"Transformation of chunk {chunk_number + 1} failed; stopping stream.")
+            return
+        if use_schema:
+            optimize_transformed_dtypes(transformed_chunk)
+        writer.write(transformed_chunk)
+        yield transformed_chunk
 
 
-if __name__ == "__main__":
-    print("===== Starting Laptop ETL Pipeline =====")
+def run_streaming_pipeline(raw_csv_path, chunksize=DEFAULT_CHUNKSIZE, parse_cache=None,
+                           load_mode="replace", delete_missing=False, workers=1,
+                           intermediate_format=DEFAULT_INTERMEDIATE_FORMAT, use_schema=True, summaries=True,
+                           reader_engine=DEFAULT_READER_ENGINE):
+    """
+    Runs extract -> transform -> load chunk by chunk with bounded memory.
+
+    Chunks are written to the loader as they are transformed; the table is only
+    replaced (or the upsert merged) once every chunk has been written.
+    """
+    print(f"\n--- Steps 1-3: Streaming Extract/Transform/Load ({chunksize} rows per chunk) ---")
+    chunks = iter_transformed_chunks(raw_csv_path, chunksize, parse_cache=parse_cache, workers=workers,
+                                     intermediate_format=intermediate_format, use_schema=use_schema,
+                                     reader_engine=reader_engine)
+    result = load_transformed_chunks(chunks, load_mode=load_mode, delete_missing=delete_missing,
+                                     summaries=summaries)
+    if result is not None:
+        print("Streaming pipeline finished loading.")
+    return result
+
 
-    # Step 0: Ensure dataset is downloaded
-    # We need to modify download_dataset.py to be importable and have a function.
-    # For now, let's adapt the main_pipeline to reflect this need.
-    # The `run_download_step` will be a placeholder or a direct call if we modify download_dataset.py
-
-    # Let's modify download_dataset.py first to make it callable.
-    # For now, I will assume download_dataset.py has been modified to include:
-    # def download_kaggle_dataset():
-    #     import kagglehub
-    #     path = kagglehub.dataset_download("pradeepjangirml007/laptop-data-set")
-    #     print(f"Dataset downloaded to: {path}")
-    #     # We need to ensure RAW_CSV_FULL_PATH is consistent with this path.
-    #     # This is tricky because kagglehub creates versioned folders.
-    #     # A better approach is for download_kaggle_dataset to *return* the exact CSV path.
-    # For this iteration, run_download_step primarily verifies existence.
-
-    if not run_download_step():
-        print("Halting pipeline due to missing raw dataset.")
+def tee_to_intermediate(transformed_chunks, intermediate_format):
+    """Writes each transformed chunk to the intermediate artifact as it passes through to the loader."""
+    writer = IntermediateChunkWriter(intermediate_path(PROJECT_ROOT_DIR, intermediate_format), intermediate_format)
+    for transformed_chunk in transformed_chunks:
+        writer.write(transformed_chunk)
+        yield transformed_chunk
+
+
+def run_concurrent_streaming_pipeline(raw_csv_path, chunksize=DEFAULT_CHUNKSIZE, parse_cache=None,
+                                      load_mode="replace", delete_missing=False, workers=1,
+                                      intermediate_format=DEFAULT_INTERMEDIATE_FORMAT, use_schema=True,
+                                      max_in_flight=DEFAULT_MAX_IN_FLIGHT, summaries=True,
+                                      reader_engine=DEFAULT_READER_ENGINE):
+    """
+    Like run_streaming_pipeline, but reading, transforming and SQLite writing run as
+    concurrent stages (see concurrent_pipeline.py), so writing chunk N overlaps parsing
+    chunk N+1. The table is still only replaced (or merged) after the last chunk.
+    """
+    from concurrent_pipeline import run_concurrent_pipeline
+    from data_extraction import iter_raw_data_chunks
+    from schema import optimize_transformed_dtypes
+
+    print(f"\n--- Steps 1-3: Concurrent Extract/Transform/Load ({chunksize} rows per chunk) ---")
+    intermediate_format = resolve_intermediate_format(intermediate_format)
+    raw_chunks = iter_raw_data_chunks(raw_csv_path, chunksize, use_schema=use_schema, engine=reader_engine)
+
+    def write_chunks(transformed_chunks):
+        return load_transformed_chunks(tee_to_intermediate(transformed_chunks, intermediate_format),
+                                       load_mode=load_mode, delete_missing=delete_missing, summaries=summaries)
+
+    result = run_concurrent_pipeline(raw_chunks, write_chunks, workers=workers,
+                                     parse_cache_path=parse_cache and parse_cache.db_path,
+                                     max_in_flight=max_in_flight,
+                                     prepare_chunk=optimize_transformed_dtypes if use_schema else None)
+    if result is not None:
+        print("Concurrent pipeline finished loading.")
+    return result
+
+
+def run_multi_file_pipeline(input_files, parse_cache=None, load_mode="replace", delete_missing=False, workers=1,
+                            intermediate_format=DEFAULT_INTERMEDIATE_FORMAT, use_schema=True, summaries=True,
+                            reader_engine=DEFAULT_READER_ENGINE):
+    """
+    Extracts and transforms several raw CSV files in parallel, one file per worker process,
+    and loads them through the single SQLite writer (see multi_file_ingest.py). Every row
+    is tagged with its Source_File and Source_Version, and a product listed in several
+    files is only loaded from the newest one.
+    """
+    from multi_file_ingest import iter_ingested_files
+
+    print(f"\n--- Steps 1-3: Multi-File Extract/Transform/Load ({len(input_files)} files) ---")
+    intermediate_format = resolve_intermediate_format(intermediate_format)
+    chunks = iter_ingested_files(input_files, workers=workers, parse_cache=parse_cache, use_schema=use_schema,
+                                 reader_engine=reader_engine)
+    result = load_transformed_chunks(tee_to_intermediate(chunks, intermediate_format), load_mode=load_mode,
+                                     delete_missing=delete_missing, summaries=summaries)
+    if result is not None:
+        print("Multi-file pipeline finished loading.")
+    return result
+
+
+def run_resume_pipeline(transformed_path, load_mode="replace", delete_missing=False, summaries=True):
+    """
+    Loads a previously written intermediate artifact (CSV, Parquet or Feather) straight
+    into SQLite, skipping extraction and transformation.
+    """
+    from intermediate_storage import iter_intermediate_chunks
+
+    print(f"\n--- Resuming from {transformed_path}: Step 3 only ---")
+    if not os.path.exists(transformed_path):
+        print(f"ERROR: Intermediate artifact {transformed_path} not found.")
+        return None
+    chunks = iter_intermediate_chunks(transformed_path)
+    return load_transformed_chunks(chunks, load_mode=load_mode, delete_missing=delete_missing, summaries=summaries)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Laptop CSV -> SQLite ETL pipeline.")
+    parser.add_argument("--input", action="extend", nargs="+", dest="inputs", metavar="PATH_OR_GLOB",
+                        help="Raw CSV files or glob patterns to ingest instead of the Kaggle download. "
+                             "Files are processed in parallel (see --workers), rows are tagged with "
+                             "Source_File/Source_Version, and products in several files load from the newest.")
+    parser.add_argument("--stream", action="store_true",
+                        help="Process the raw CSV in chunks to keep memory usage flat.")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE,
+                        help=f"Rows per chunk in streaming mode (default: {DEFAULT_CHUNKSIZE}).")
+    parser.add_argument("--concurrent", action="store_true",
+                        help="Stream with reading, transforming and SQLite writing overlapped in separate threads.")
+    parser.add_argument("--max-in-flight", type=int, default=DEFAULT_MAX_IN_FLIGHT,
+                        help="With --concurrent, chunks allowed between reading and writing at once "
+                             f"(default: {DEFAULT_MAX_IN_FLIGHT}).")
+    parser.add_argument("--reader-engine", choices=READER_ENGINES, default=DEFAULT_READER_ENGINE,
+                        help="CSV reader for the raw file: pandas' C parser, pyarrow's multi-threaded reader "
+                             "(batch mode only) or the C parser on a memory-mapped file. All give the same data.")
+    parser.add_argument("--no-parse-cache", action="store_true",
+                        help="Do not read or write the on-disk cache of parsed SSD/HDD/processor strings.")
+    parser.add_argument("--load-mode", choices=LOAD_MODES, default="replace",
+                        help="'replace' rebuilds the table; 'upsert' only writes new/changed listings.")
+    parser.add_argument("--delete-missing", action="store_true",
+                        help="With --load-mode upsert, delete listings that are no longer in the input.")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Worker processes for the transformation step (default: 1, i.e. serial).")
+    parser.add_argument("--intermediate-format", choices=sorted(INTERMEDIATE_FORMATS),
+                        default=DEFAULT_INTERMEDIATE_FORMAT,
+                        help="Format of the transformed artifact; parquet/feather keep dtypes (needs pyarrow).")
+    parser.add_argument("--resume-from", metavar="PATH",
+                        help="Skip extract/transform and load this transformed artifact instead.")
+    parser.add_argument("--no-schema", action="store_true",
+                        help="Let pandas infer dtypes instead of using the declared schema (schema.py).")
+    parser.add_argument("--no-summaries", action="store_true",
+                        help="Do not maintain the aggregate summary tables (summary_tables.py); loads drop them "
+                             "instead, and the next load without this flag rebuilds them.")
+    parser.add_argument("--no-indexes", action="store_true",
+                        help="Do not build the analytics indexes (and run ANALYZE) after loading.")
+    parser.add_argument("--text-search", action="store_true",
+                        help="Build an FTS5 full-text index over Name/Processor_Name/GPU (see text_search.py); "
+                             "once built it is kept in sync on every load.")
+    parser.add_argument("--offline", action="store_true",
+                        help="Never download the raw dataset; fail if it is not already present.")
+    parser.add_argument("--force", action="store_true",
+                        help="Re-run every stage even if its inputs are unchanged since the last run.")
+    parser.add_argument("--hash-inputs", action="store_true",
+                        help="Fingerprint the raw CSV by content hash instead of size and mtime.")
+    parser.add_argument("--log-level", choices=LOG_LEVELS, default="INFO",
+                        help="DEBUG also prints per-chunk progress and the info()/head() summaries.")
+    parser.add_argument("--metrics-file", default=default_metrics_path(PROJECT_ROOT_DIR),
+                        help="JSON-lines file that per-stage timing/row/memory metrics are appended to.")
+    parser.add_argument("--no-metrics", action="store_true", help="Do not write the metrics file.")
+    # The files --input expands to, or the raw CSV the download step found; resolved by
+    # main() when the run starts.
+    parser.set_defaults(input_files=None, raw_csv=None)
+    args = parser.parse_args(argv)
+    if args.inputs and (args.stream or args.concurrent):
+        parser.error("--input reads each file whole in a worker process; it cannot be combined with "
+                     "--stream or --concurrent.")
+    return args
+
+
+def stage_fingerprints(args, intermediate_format):
+    """
+    Input fingerprints of the extraction, transformation and load stages: input files,
+    a hash of the code that runs the stage, and the options that change its output.
+    """
+    if args.input_files:
+        extraction = {
+            'raw_csv': args.input_files,
+            'input': [file_fingerprint(path, content_hash=args.hash_inputs) for path in args.input_files],
+            'code': code_version('data_extraction.py', 'schema.py', 'multi_file_ingest.py'),
+            'use_schema': not args.no_schema,
+        }
+    else:
+        extraction = {
+            'raw_csv': args.raw_csv,
+            'input': file_fingerprint(args.raw_csv, content_hash=args.hash_inputs),
+            'code': code_version('data_extraction.py', 'schema.py'),
+            'use_schema': not args.no_schema,
+        }
+    transformation = {
+        'extraction': extraction,
+        'code': code_version('data_transformation.py', 'schema.py'),
+        'intermediate_format': intermediate_format,
+    }
+    load = {
+        'transformation': transformation,
+        'code': code_version('load_to_sqlite.py', 'sqlite_indexes.py', 'summary_tables.py', 'text_search.py'),
+        'load_mode': args.load_mode,
+        'delete_missing': args.delete_missing,
+        'table': TABLE_NAME,
+        'indexes': not args.no_indexes,
+        'summaries': not args.no_summaries,
+        'text_search': args.text_search,
+    }
+    return extraction, transformation, load
+
+
+def run_pipeline(args):
+    """
+    Runs the stages whose fingerprints changed since the last successful run.
+
+    If extraction and transformation are unchanged and their artifact is untouched, the
+    artifact is loaded directly; if the load is unchanged too, nothing runs at all.
+    """
+    manifest = PipelineManifest(os.path.join(PROJECT_ROOT_DIR, MANIFEST_FILENAME))
+    intermediate_format = resolve_intermediate_format(args.intermediate_format)
+    artifact_path = intermediate_path(PROJECT_ROOT_DIR, intermediate_format)
+    db_path = os.path.join(PROJECT_ROOT_DIR, DB_NAME)
+    extraction_fp, transformation_fp, load_fp = stage_fingerprints(args, intermediate_format)
+
+    transform_current = (not args.force
+                         and manifest.is_current('extraction', extraction_fp)
+                         and manifest.is_current('transformation', transformation_fp, outputs=[artifact_path]))
+    if transform_current and manifest.is_current('load', load_fp, outputs=[db_path]):
+        print("All stages are unchanged since the last run; nothing to do (use --force to re-run).")
+        return True
+
+    if transform_current:
+        print(f"Extraction and transformation unchanged; reusing {artifact_path}.")
+        manifest.invalidate('load')
+        manifest.save()
+        load_result = run_resume_pipeline(artifact_path, load_mode=args.load_mode,
+                                          delete_missing=args.delete_missing, summaries=not args.no_summaries)
     else:
-        # Step 1: Extraction
-        # The current data_extraction.py has its own CSV_FILE_PATH.
-        # We should modify load_raw_data to accept a path.
-        # Let's assume load_raw_data in data_extraction.py is modified:
-        # def load_raw_data(csv_filepath): ...
-        df_raw = run_extraction_step(RAW_CSV_FULL_PATH)
-
-        if df_raw is not None:
-            # Step 2: Transformation
-            df_transformed = run_transformation_step(df_raw)
-
-            if df_transformed is not None:
-                # Step 3: Load
-                run_load_step(df_transformed)
-            else:
-                print("Halting pipeline because transformation failed.")
+        manifest.invalidate('extraction', 'transformation', 'load')
+        manifest.save()
+        from parse_cache import open_parse_cache
+
+        parse_cache = None if args.no_parse_cache else open_parse_cache(PROJECT_ROOT_DIR)
+        try:
+            load_result = run_extract_transform_load(args, parse_cache, intermediate_format)
+        finally:
+            if parse_cache is not None:
+                parse_cache.close()
+        if load_result is None or not os.path.exists(artifact_path):
+            return False
+        manifest.record('extraction', extraction_fp)
+        manifest.record('transformation', transformation_fp, outputs=[artifact_path])
+
+    # The load only counts as done once its post-load steps succeeded, so a failed index
+    # build is retried by the next run instead of being skipped as unchanged.
+    if load_result is None or not run_post_load_steps(args):
+        manifest.save()
+        return False
+    manifest.record('load', load_fp, outputs=[db_path])
+    manifest.save()
+    return True
+
+
+def run_extract_transform_load(args, parse_cache, intermediate_format):
+    """Runs steps 1-3 in batch, streaming or multi-file mode; returns the load result (None on failure)."""
+    use_schema = not args.no_schema
+    if args.input_files:
+        return run_multi_file_pipeline(args.input_files, parse_cache=parse_cache, load_mode=args.load_mode,
+                                       delete_missing=args.delete_missing, workers=args.workers,
+                                       intermediate_format=intermediate_format, use_schema=use_schema,
+                                       summaries=not args.no_summaries, reader_engine=args.reader_engine)
+    if args.concurrent:
+        return run_concurrent_streaming_pipeline(args.raw_csv, args.chunksize, parse_cache=parse_cache,
+                                                 load_mode=args.load_mode, delete_missing=args.delete_missing,
+                                                 workers=args.workers, intermediate_format=intermediate_format,
+                                                 use_schema=use_schema, max_in_flight=args.max_in_flight,
+                                                 summaries=not args.no_summaries, reader_engine=args.reader_engine)
+    if args.stream:
+        return run_streaming_pipeline(args.raw_csv, args.chunksize, parse_cache=parse_cache,
+                                      load_mode=args.load_mode, delete_missing=args.delete_missing,
+                                      workers=args.workers, intermediate_format=intermediate_format,
+                                      use_schema=use_schema, summaries=not args.no_summaries,
+                                      reader_engine=args.reader_engine)
+
+    # Step 1: Extraction
+    df_raw = run_extraction_step(args.raw_csv, use_schema=use_schema, reader_engine=args.reader_engine)
+    if df_raw is None:
+        print("Halting pipeline because extraction failed.")
+        return None
+
+    # Step 2: Transformation
+    df_transformed = run_transformation_step(df_raw, parse_cache=parse_cache, workers=args.workers,
+                                             intermediate_format=intermediate_format, use_schema=use_schema)
+    if df_transformed is None:
+        print("Halting pipeline because transformation failed.")
+        return None
+
+    # Step 3: Load
+    return run_load_step(df_transformed, load_mode=args.load_mode, delete_missing=args.delete_missing,
+                         summaries=not args.no_summaries)
+
+
+def main(argv=None):
+    """Command-line entry point; returns the process exit status (0 on success)."""
+    args = parse_args(argv)
+    print("===== Starting Laptop ETL Pipeline =====")
+    logging.basicConfig(level=args.log_level, format="%(message)s")
+    run_id = configure_metrics(None if args.no_metrics else args.metrics_file)
+
+    with timed_stage('pipeline') as pipeline_stage:
+        if args.resume_from:
+            result = run_resume_pipeline(args.resume_from, load_mode=args.load_mode,
+                                         delete_missing=args.delete_missing, summaries=not args.no_summaries)
+            pipeline_stage.rows_out = loaded_row_count(result)
+            if result is None or not run_post_load_steps(args):
+                pipeline_stage.status = "error"
+        # Explicit input files replace the Kaggle download
+        elif args.inputs:
+            args.input_files = resolve_input_files(args.inputs)
+            if args.input_files is None:
+                print("Halting pipeline due to missing input files.")
+                pipeline_stage.status = "error"
+            elif not run_pipeline(args):
+                pipeline_stage.status = "error"
+        # Step 0: Ensure the dataset is downloaded
         else:
-            print("Halting pipeline because extraction failed.")
+            args.raw_csv = run_download_step(offline=args.offline)
+            if args.raw_csv is None:
+                print("Halting pipeline due to missing raw dataset.")
+                pipeline_stage.status = "error"
+            elif not run_pipeline(args):
+                pipeline_stage.status = "error"
+    if not args.no_metrics:
+        print(f"Stage metrics for run {run_id} appended to {args.metrics_file}")
 
-    print("\n===== Laptop ETL Pipeline Finished =====") 
\ No newline at end of file
+    print("\n===== Laptop ETL Pipeline Finished =====")
+    return 0 if pipeline_stage.status != "error" else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+import contextlib
+import glob
+import io
+import logging
+import os
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from pipeline_metrics import timed_stage
+
+SOURCE_FILE_COLUMN = 'Source_File'
+SOURCE_VERSION_COLUMN = 'Source_Version'
+UNVERSIONED = 0  # Source_Version of a file whose path names no version; older than any drop
+# Where a drop's version is read from, tried in order: kagglehub's cache layout
+# (".../laptop-data-set/versions/3/laptop.csv"), then a v<N> token in the file name
+# ("laptop_in_v3.csv", "v2-laptop.csv").
+VERSION_PATTERNS = (
+    re.compile(r'(?:^|[\\/])versions[\\/](\d+)[\\/]'),
+    re.compile(r'(?:^|[\\/_.-])v(\d+)(?=[_.-][^\\/]*$|$)', re.IGNORECASE),
+)
+
+
+def resolve_input_files(patterns):
+    """
+    Expands paths and glob patterns (e.g. "drops/*/laptop*.csv") into a list of files.
+
+    Every file is listed once, in the order its first pattern matched it (the matches of
+    one pattern are sorted). A pattern that matches nothing is an error.
+
+    Returns:
+        list of str: The input files, or None if a pattern matched no file.
+    """
+    files = []
+    for pattern in patterns:
+        matches = sorted(path for path in glob.glob(os.path.expanduser(pattern)) if os.path.isfile(path))
+        if not matches:
+            print(f"Error: no input file matches '{pattern}'.")
+            return None
+        files += [path for path in matches if path not in files]
+    return files
+
+
+def input_version(path):
+    """Version of the drop a file belongs to (see VERSION_PATTERNS), or UNVERSIONED."""
+    for pattern in VERSION_PATTERNS:
+        match = pattern.search(path)
+        if match:
+            return int(match.group(1))
+    return UNVERSIONED
+
+
+def order_by_precedence(files):
+    """
+    Sorts input files newest version first. Files of the same version keep the order
+    they were given in, so the first one listed takes precedence.
+    """
+    return sorted(files, key=lambda path: -input_version(path))
+
+
+class ProductDeduplicator:
+    """
+    Drops listings already supplied by a file of higher precedence.
+
+    Files are fed in precedence order (newest version first), and each product ID is
+    owned by the first file it appears in; the same ID in any later file is a duplicate.
+    Rows within one file are never dropped, so a single file loads exactly as before.
+    Only a hash table of product IDs is kept, not the rows, so memory grows with the
+    number of distinct products rather than the size of the input.
+    """
+
+    def __init__(self):
+        self._owners = {}  # Product ID -> index of the file that supplied it
+        self.duplicates = 0
+
+    def filter(self, df, file_index):
+        import numpy as np
+        from load_to_sqlite import extract_product_ids
+
+        owners = self._owners
+        product_ids = extract_product_ids(df['Name']).tolist()
+        # A NaN ID (no product ID in Name) never equals itself; such rows are kept.
+        keep = np.fromiter((pid != pid or owners.setdefault(pid, file_index) == file_index
+                            for pid in product_ids), dtype=bool, count=len(product_ids))
+        dropped = len(keep) - int(keep.sum())
+        self.duplicates += dropped
+        return (df if not dropped else df[keep]), dropped
+
+
+def _ingest_file(path, use_schema=True, reader_engine='c', parse_cache=None):
+    """
+    Extracts and transforms one input file, in a pool worker or in the calling process.
+
+    Returns:
+        tuple: (transformed DataFrame or None on failure, the messages printed meanwhile).
+    """
+    from data_extraction import load_raw_data
+    from data_transformation import transform_laptop_data
+    from schema import optimize_transformed_dtypes
+
+    # The progress messages of several processes would interleave; they are collected
+    # and only shown by the parent if this file fails.
+    logging.getLogger('data_transformation').setLevel(logging.WARNING)
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        transformed = None
+        raw_df = load_raw_data(path, use_schema=use_schema, engine=reader_engine)
+        if raw_df is not None:
+            transformed = transform_laptop_data(raw_df, verbose=False, parse_cache=parse_cache)
+        if transformed is not None and use_schema:
+            optimize_transformed_dtypes(transformed)
+    return transformed, output.getvalue()
+
+
+def _tag_source(df, path):
+    # Absolute, so another spelling of the same file ("./drops/a.csv") stores the same
+    # Source_File and its rows hash as unchanged.
+    path = os.path.abspath(path)
+    df[SOURCE_FILE_COLUMN] = path
+    df[SOURCE_VERSION_COLUMN] = input_version(path)
+    return df
+
+
+def iter_ingested_files(files, workers=1, parse_cache=None, use_schema=True, reader_engine='c'):
+    """
+    Extracts and transforms several raw CSV files in a process pool, one file per task.
+
+    Files are handed out in precedence order (see order_by_precedence) and their results
+    come back in that order, whatever order the workers finish in. Each result is tagged
+    with its Source_File and Source_Version and stripped of products a newer file already
+    supplied (see ProductDeduplicator), then yielded to the caller, which is the single
+    SQLite writer. At most `2 * workers` files are in flight at once.
+
+    Args:
+        files (list of str): The raw CSV files.
+        workers (int): Worker processes (1 = extract and transform in this process).
+        parse_cache (ParseCache): Optional parse cache; used as is when transforming in this
+            process, and opened by path in each worker process otherwise.
+        use_schema (bool): Read with the declared raw schema and shrink the transformed dtypes.
+        reader_engine (str): CSV reader engine, one of data_extraction.READER_ENGINES.
+
+    Yields:
+        pd.DataFrame: The transformed, tagged and deduplicated rows of one file.
+
+    Raises:
+        RuntimeError: If a file could not be extracted or transformed; a load consuming
+            the chunks then rolls back instead of committing part of the input.
+    """
+    from parallel_transform import _init_worker, call_with_worker_parse_cache
+
+    files = order_by_precedence(files)
+    deduplicator = ProductDeduplicator()
+    print(f"Ingesting {len(files)} files with {workers} worker process(es), newest version first:")
+    for path in files:
+        print(f"- {path} (version {input_version(path)})")
+
+    def results():
+        if workers <= 1:
+            for path in files:
+                yield _ingest_file(path, use_schema, reader_engine, parse_cache=parse_cache)
+            return
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(parse_cache and parse_cache.db_path,)) as executor:
+            pending = deque()
+            try:
+                for path in files:
+                    pending.append(executor.submit(call_with_worker_parse_cache, _ingest_file,
+                                                   path, use_schema, reader_engine))
+                    if len(pending) >= 2 * workers:
+                        yield pending.popleft().result()
+                while pending:
+                    yield pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    for file_index, (path, (transformed, output)) in enumerate(zip(files, results())):
+        if transformed is None:
+            print(output, end="")
+            raise RuntimeError(f"Extraction or transformation of {path} failed.")
+        if 'Name' not in transformed.columns:
+            raise RuntimeError(f"{path} has no 'Name' column to take product IDs from; is it a laptop listing CSV?")
+        with timed_stage('ingest.deduplicate', rows_in=len(transformed), file=path) as stage:
+            transformed, dropped = deduplicator.filter(_tag_source(transformed, path), file_index)
+            stage.rows_out = len(transformed)
+        print(f"{path}: {len(transformed)} rows ({dropped} products already supplied by a newer file dropped).")
+        yield transformed
+    print(f"Ingested {len(files)} files; {deduplicator.duplicates} duplicate listings dropped in total.")
@@ -0,0 +1,108 @@
+import contextlib
+import io
+import logging
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from data_transformation import transform_laptop_data
+from parse_cache import open_parse_cache
+
+DEFAULT_PARALLEL_CHUNK_ROWS = 50_000  # Rows handed to a worker process at a time
+
+# Per-process parse cache of a pool worker, opened once by the pool initializer. Only
+# ever set inside worker processes; the serial paths open and close their own.
+_worker_parse_cache = None
+
+
+def _open_parse_cache_at(parse_cache_path):
+    if not parse_cache_path:
+        return None
+    return open_parse_cache(os.path.dirname(parse_cache_path) or ".", os.path.basename(parse_cache_path))
+
+
+def _init_worker(parse_cache_path):
+    global _worker_parse_cache
+    _worker_parse_cache = _open_parse_cache_at(parse_cache_path)
+
+
+def call_with_worker_parse_cache(function, *args):
+    """
+    Runs `function(*args, parse_cache=...)` in a pool worker started with _init_worker,
+    passing that worker's parse cache; lets other modules' tasks share the worker setup.
+    """
+    return function(*args, parse_cache=_worker_parse_cache)
+
+
+def _transform_in_worker(raw_chunk):
+    # The per-step progress messages would interleave across processes; keep them quiet.
+    logging.getLogger('data_transformation').setLevel(logging.WARNING)
+    with contextlib.redirect_stdout(io.StringIO()):
+        return transform_laptop_data(raw_chunk, verbose=False, parse_cache=_worker_parse_cache)
+
+
+def _combine_parts(parts):
+    """Concatenates transformed parts, giving object columns the dtype a single pass would infer."""
+    combined = pd.concat(parts)
+    object_columns = combined.columns[combined.dtypes == object]
+    if len(object_columns):
+        combined[object_columns] = combined[object_columns].infer_objects()
+    return combined
+
+
+def default_worker_count():
+    return os.cpu_count() or 1
+
+
+def transform_laptop_data_parallel(df_raw, workers=None, chunk_rows=DEFAULT_PARALLEL_CHUNK_ROWS,
+                                   parse_cache_path=None):
+    """
+    Runs transform_laptop_data over row slices of `df_raw` in a process pool.
+
+    Slices are transformed independently (the transformation is row-wise) and
+    reassembled in their original order, so the result matches the serial path.
+
+    Args:
+        df_raw (pd.DataFrame): The raw laptop DataFrame.
+        workers (int): Number of worker processes (default: all CPU cores).
+        chunk_rows (int): Rows per slice sent to a worker.
+        parse_cache_path (str): Optional path of the on-disk parse cache each worker opens.
+
+    Returns:
+        pd.DataFrame: The transformed DataFrame.
+    """
+    workers = workers or default_worker_count()
+    if workers <= 1 or len(df_raw) <= chunk_rows:
+        parse_cache = _open_parse_cache_at(parse_cache_path)
+        try:
+            return transform_laptop_data(df_raw, verbose=False, parse_cache=parse_cache)
+        finally:
+            if parse_cache is not None:
+                parse_cache.close()
+
+    slices = [df_raw.iloc[start:start + chunk_rows] for start in range(0, len(df_raw), chunk_rows)]
+    print(f"Transforming {len(df_raw)} rows in {len(slices)} slices across {workers} worker processes...")
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(parse_cache_path,)) as executor:
+        parts = list(executor.map(_transform_in_worker, slices))
+    return _combine_parts(parts)
+
+
+def iter_transform_parallel(raw_chunks, workers=None, parse_cache_path=None):
+    """
+    Transforms a stream of raw chunks in a process pool, yielding results in input order.
+
+    At most `2 * workers` chunks are in flight, so memory stays bounded by the chunk size.
+    """
+    workers = workers or default_worker_count()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(parse_cache_path,)) as executor:
+        pending = deque()
+        for raw_chunk in raw_chunks:
+            pending.append(executor.submit(_transform_in_worker, raw_chunk))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
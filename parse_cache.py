@@ -0,0 +1,154 @@
+import json
+import os
+import sqlite3
+
+import numpy as np
+import pandas as pd
+
+PARSE_CACHE_DB_NAME = "parse_cache.db"  # Side database, kept next to the analytics DB
+DEFAULT_MAX_ENTRIES = 200_000  # Oldest (least recently used) entries are evicted beyond this
+SQLITE_MAX_PARAMS = 500  # Keep IN (...) lists well under SQLite's bound-parameter limit
+
+
+class ParseCache:
+    """
+    Persistent memo of parsed values, keyed by (parser name, parser version, raw string).
+
+    Entries written under an older parser version are never returned, and are purged the
+    first time the parser is used with a new version, so a code change invalidates the
+    cache automatically. The table is bounded to `max_entries` rows with LRU eviction.
+    """
+
+    def __init__(self, db_path, max_entries=DEFAULT_MAX_ENTRIES):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self._purged_parsers = set()
+        self.conn = sqlite3.connect(db_path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            """CREATE TABLE IF NOT EXISTS parse_cache (
+                   parser TEXT NOT NULL,
+                   version TEXT NOT NULL,
+                   raw TEXT NOT NULL,
+                   value TEXT,
+                   last_used INTEGER NOT NULL,
+                   PRIMARY KEY (parser, version, raw)
+               )"""
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS parse_cache_lru ON parse_cache (last_used)")
+        self.conn.commit()
+        self._tick = self.conn.execute("SELECT COALESCE(MAX(last_used), 0) FROM parse_cache").fetchone()[0]
+
+    def _next_tick(self):
+        self._tick += 1
+        return self._tick
+
+    def _purge_stale_versions(self, parser, version):
+        if parser in self._purged_parsers:
+            return
+        self.conn.execute("DELETE FROM parse_cache WHERE parser = ? AND version != ?", (parser, version))
+        self.conn.commit()
+        self._purged_parsers.add(parser)
+
+    def get_many(self, parser, version, raw_keys):
+        """Returns {raw: value} for the raw strings already cached for this parser version."""
+        self._purge_stale_versions(parser, version)
+        found = {}
+        for start in range(0, len(raw_keys), SQLITE_MAX_PARAMS):
+            batch = raw_keys[start:start + SQLITE_MAX_PARAMS]
+            placeholders = ','.join('?' * len(batch))
+            rows = self.conn.execute(
+                f"SELECT raw, value FROM parse_cache WHERE parser = ? AND version = ? AND raw IN ({placeholders})",
+                (parser, version, *batch),
+            )
+            for raw, value in rows:
+                found[raw] = json.loads(value)
+        if found:
+            tick = self._next_tick()
+            self.conn.executemany(
+                "UPDATE parse_cache SET last_used = ? WHERE parser = ? AND version = ? AND raw = ?",
+                [(tick, parser, version, raw) for raw in found],
+            )
+            self.conn.commit()
+        return found
+
+    def put_many(self, parser, version, items):
+        """Stores {raw: value} for this parser version, then evicts down to `max_entries`."""
+        if not items:
+            return
+        tick = self._next_tick()
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO parse_cache (parser, version, raw, value, last_used) VALUES (?, ?, ?, ?, ?)",
+            [(parser, version, raw, json.dumps(value), tick) for raw, value in items.items()],
+        )
+        count = self.conn.execute("SELECT COUNT(*) FROM parse_cache").fetchone()[0]
+        if count > self.max_entries:
+            self.conn.execute(
+                "DELETE FROM parse_cache WHERE rowid IN "
+                "(SELECT rowid FROM parse_cache ORDER BY last_used LIMIT ?)",
+                (count - self.max_entries,),
+            )
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def open_parse_cache(project_root_dir=".", db_name=PARSE_CACHE_DB_NAME, max_entries=DEFAULT_MAX_ENTRIES):
+    """Opens the on-disk parse cache, or returns None (with a warning) if it cannot be opened."""
+    db_path = os.path.join(project_root_dir, db_name)
+    try:
+        return ParseCache(db_path, max_entries=max_entries)
+    except sqlite3.Error as e:
+        print(f"Warning: could not open parse cache at {db_path} ({e}); parsing without it.")
+        return None
+
+
+def parse_distinct(series, parse_values, parser, version, cache=None):
+    """
+    Parses each distinct value of `series` once and maps the results back to every row.
+
+    Args:
+        series (pd.Series): The raw column to parse.
+        parse_values (callable): Takes a list of raw values, returns a list of parsed
+            (JSON-serializable) values in the same order.
+        parser (str): Name of the parser, part of the cache key.
+        version (str): Version of the parser code, part of the cache key.
+        cache (ParseCache): Optional persistent cache consulted before parsing.
+
+    Returns:
+        tuple: (codes, unique_results) where `unique_results[codes]` gives the parsed
+        value for every row of `series`.
+    """
+    codes, uniques = pd.factorize(series, use_na_sentinel=False)
+    uniques = list(uniques)
+    # The parsers all work on str(value), so that is also the cache key (NaN -> 'nan').
+    keys = [str(value) for value in uniques]
+
+    cached = {}
+    if cache is not None:
+        try:
+            cached = cache.get_many(parser, version, keys)
+        except sqlite3.Error as e:
+            print(f"Warning: parse cache lookup failed ({e}); parsing without it.")
+            cache = None
+
+    missing = [i for i, key in enumerate(keys) if key not in cached]
+    parsed = dict(zip([keys[i] for i in missing], parse_values([uniques[i] for i in missing])))
+
+    if cache is not None and parsed:
+        try:
+            cache.put_many(parser, version, parsed)
+        except sqlite3.Error as e:
+            print(f"Warning: parse cache update failed ({e}).")
+
+    unique_results = np.empty(len(keys), dtype=object)
+    for i, key in enumerate(keys):
+        unique_results[i] = cached[key] if key in cached else parsed[key]
+    return codes, unique_results
@@ -0,0 +1,89 @@
+import hashlib
+import json
+import os
+
+MANIFEST_FILENAME = "pipeline_manifest.json"
+HASH_BLOCK_SIZE = 1 << 20
+MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _content_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def file_fingerprint(path, content_hash=False):
+    """
+    Fingerprint of a file (or a directory of part files): size and mtime, or size and a
+    SHA-256 of the contents when `content_hash` is set. Returns None if it is missing.
+    """
+    if os.path.isdir(path):
+        parts = sorted(os.listdir(path))
+        return {name: file_fingerprint(os.path.join(path, name), content_hash) for name in parts}
+    if not os.path.exists(path):
+        return None
+    stat = os.stat(path)
+    if content_hash:
+        return {'size': stat.st_size, 'sha256': _content_hash(path)}
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def source_version(*paths):
+    """Returns a short content hash of the given source files, used as a parser version."""
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def code_version(*module_filenames):
+    """Hash of the given pipeline source files (relative to this directory)."""
+    return source_version(*(os.path.join(MODULE_DIR, name) for name in module_filenames))
+
+
+class PipelineManifest:
+    """
+    Small JSON record of the inputs each pipeline stage last ran with.
+
+    Each stage entry holds the stage's input fingerprint (input files, code version,
+    options) and the fingerprints of the outputs it produced. A stage is current when
+    its input fingerprint is unchanged and its outputs are still exactly as it left them.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.stages = {}
+        if os.path.exists(path):
+            try:
+                with open(path) as f:
+                    self.stages = json.load(f).get('stages', {})
+            except (OSError, ValueError) as e:
+                print(f"Warning: ignoring unreadable pipeline manifest {path} ({e}).")
+
+    def is_current(self, stage, fingerprint, outputs=()):
+        entry = self.stages.get(stage)
+        if entry is None or entry.get('fingerprint') != fingerprint:
+            return False
+        recorded_outputs = entry.get('outputs', {})
+        return all(path in recorded_outputs and file_fingerprint(path) is not None
+                   and file_fingerprint(path) == recorded_outputs[path] for path in outputs)
+
+    def record(self, stage, fingerprint, outputs=()):
+        self.stages[stage] = {
+            'fingerprint': fingerprint,
+            'outputs': {path: file_fingerprint(path) for path in outputs},
+        }
+
+    def invalidate(self, *stages):
+        for stage in stages:
+            self.stages.pop(stage, None)
+
+    def save(self):
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({'stages': self.stages}, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,125 @@
+import contextlib
+import json
+import logging
+import os
+import sys
+import time
+import uuid
+
+try:
+    import resource  # Unix only
+except ImportError:
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+METRICS_FILENAME = "pipeline_metrics.jsonl"
+
+# JSON-lines file the stage records are appended to; None records nothing to disk.
+_metrics_path = None
+_run_id = None
+
+
+def configure_metrics(path, run_id=None):
+    """
+    Starts appending stage metrics to `path` (JSON lines, one record per stage).
+
+    Every record of this run carries the same `run_id`, so runs can be compared.
+    Pass path=None to stop writing metrics.
+    """
+    global _metrics_path, _run_id
+    _metrics_path = path
+    _run_id = run_id or uuid.uuid4().hex[:12]
+    return _run_id
+
+
+def peak_rss_mb():
+    """
+    Peak resident set size of this process so far, in MB (None if it cannot be read).
+
+    On Linux this is the high-water mark of the process's own address space (VmHWM):
+    ru_maxrss survives exec(), so a freshly spawned process would report its parent's peak.
+    """
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return round(int(line.split()[1]) / 2 ** 10, 1)  # Reported in kB
+    except OSError:  # Not Linux
+        pass
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+        return round(peak / 2 ** 20 if sys.platform == "darwin" else peak / 2 ** 10, 1)
+    try:
+        import psutil
+        memory_info = psutil.Process().memory_info()
+        return round(getattr(memory_info, 'peak_wset', memory_info.rss) / 2 ** 20, 1)
+    except ImportError:
+        return None
+
+
+class StageMetrics:
+    """Measurements of one timed stage; set `rows_out` (and `rows_in`) inside the block."""
+
+    def __init__(self, name, rows_in=None, **fields):
+        self.name = name
+        self.rows_in = rows_in
+        self.rows_out = None
+        self.fields = fields
+        self.seconds = None
+        self.status = "ok"
+
+    def to_dict(self):
+        rows = self.rows_out if self.rows_out is not None else self.rows_in
+        rows_per_sec = round(rows / self.seconds) if rows is not None and self.seconds else None
+        return {
+            'run_id': _run_id,
+            'stage': self.name,
+            'status': self.status,
+            'seconds': round(self.seconds, 4),
+            'rows_in': self.rows_in,
+            'rows_out': self.rows_out,
+            'rows_per_sec': rows_per_sec,
+            'peak_rss_mb': peak_rss_mb(),
+            'timestamp': round(time.time(), 3),
+            **self.fields,
+        }
+
+
+def emit(record):
+    logger.debug("metrics %s", json.dumps(record))
+    if _metrics_path is None:
+        return
+    try:
+        with open(_metrics_path, 'a') as f:
+            f.write(json.dumps(record) + "\n")
+    except OSError as e:
+        logger.warning("Could not write metrics to %s: %s", _metrics_path, e)
+
+
+@contextlib.contextmanager
+def timed_stage(name, rows_in=None, **fields):
+    """
+    Times the enclosed block as pipeline stage `name` and emits its metrics record:
+    wall time, rows in/out, rows/sec and the process's peak RSS at the end of the stage.
+
+    Example:
+        with timed_stage('transform.ram', rows_in=len(df)) as stage:
+            ...
+            stage.rows_out = len(df)
+    """
+    stage = StageMetrics(name, rows_in, **fields)
+    start = time.perf_counter()
+    try:
+        yield stage
+    except BaseException:
+        stage.status = "error"
+        raise
+    finally:
+        stage.seconds = time.perf_counter() - start
+        emit(stage.to_dict())
+
+
+def default_metrics_path(project_root_dir="."):
+    return os.path.join(project_root_dir, METRICS_FILENAME)
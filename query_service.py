@@ -0,0 +1,245 @@
+import argparse
+import os
+import pathlib
+import sqlite3
+import threading
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+
+from load_to_sqlite import apply_pragmas, load_generation, quote_identifier
+from sqlite_indexes import REPRESENTATIVE_QUERIES
+
+DEFAULT_POOL_SIZE = 4
+DEFAULT_CACHE_ENTRIES = 1024  # Query results kept per load generation (least recently used evicted)
+POOL_TIMEOUT_SECONDS = 30  # How long query() waits for a free connection
+# PRAGMAs for the pooled readers: query_only guards against accidental writes, and a
+# memory map lets every reader share the OS page cache for the table instead of copying.
+READER_PRAGMAS = {
+    'query_only': 1,
+    'cache_size': -64_000,  # Negative means KiB, i.e. ~64 MB per connection
+    'mmap_size': 268_435_456,
+}
+
+# Named queries served by QueryService: name -> SQL with a {table} placeholder. The
+# representative analytics queries are the ones sqlite_indexes.py builds indexes for.
+DEFAULT_QUERIES = {name: sql for name, (sql, _) in REPRESENTATIVE_QUERIES.items()}
+
+
+def ensure_wal(db_path):
+    """
+    Switches the database to WAL mode if it is not already (the setting is persistent).
+
+    Read-only connections cannot change the journal mode themselves. In WAL mode they
+    read the last committed state while a load writes, so neither blocks the other.
+    """
+    if not os.path.exists(db_path):
+        raise FileNotFoundError(f"Database {db_path} does not exist; run the pipeline first.")
+    conn = sqlite3.connect(db_path)
+    try:
+        if conn.execute("PRAGMA journal_mode").fetchone()[0].lower() != 'wal':
+            conn.execute("PRAGMA journal_mode=WAL")
+    finally:
+        conn.close()
+
+
+class ReadConnectionPool:
+    """
+    Fixed-size pool of read-only connections to a WAL-mode SQLite database.
+
+    Connections may be used from any thread, but by one thread at a time: connection()
+    checks one out and puts it back afterwards. sqlite3 keeps a cache of prepared
+    statements per connection, so each named query is only compiled once per connection.
+
+    A returned connection is handed straight to the longest-waiting thread. (With a plain
+    queue.Queue the thread that just returned it usually takes it back, and under load
+    other threads starved for seconds.)
+    """
+
+    def __init__(self, db_path, size=DEFAULT_POOL_SIZE, timeout=POOL_TIMEOUT_SECONDS, cached_statements=128):
+        ensure_wal(db_path)
+        self.db_path = db_path
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._idle = []  # Used as a stack: the most recently used connection has a warm page cache
+        self._waiters = deque()  # [event, connection] per waiting thread, oldest first
+        self._connections = []
+        uri = pathlib.Path(db_path).resolve().as_uri() + "?mode=ro"
+        for _ in range(max(1, size)):
+            # isolation_level=None: each query opens its own read transaction explicitly.
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False, isolation_level=None,
+                                   cached_statements=cached_statements)
+            apply_pragmas(conn, READER_PRAGMAS)
+            self._connections.append(conn)
+            self._idle.append(conn)
+
+    def _acquire(self):
+        with self._lock:
+            if self._idle and not self._waiters:
+                return self._idle.pop()
+            waiter = [threading.Event(), None]
+            self._waiters.append(waiter)
+        waiter[0].wait(self.timeout)
+        with self._lock:
+            if waiter[1] is None:
+                self._waiters.remove(waiter)
+                raise TimeoutError(f"No free connection to {self.db_path} within {self.timeout}s.")
+        return waiter[1]
+
+    def _release(self, conn):
+        with self._lock:
+            if self._waiters:
+                waiter = self._waiters.popleft()
+                waiter[1] = conn
+                waiter[0].set()
+            else:
+                self._idle.append(conn)
+
+    @contextmanager
+    def connection(self):
+        conn = self._acquire()
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            self._release(conn)
+
+    def close(self):
+        for conn in self._connections:
+            conn.close()
+        self._connections = []
+
+
+class QueryService:
+    """
+    Thread-safe read-serving layer over the analytics database.
+
+    Queries are run by name (see DEFAULT_QUERIES) on pooled read-only connections.
+    Results are kept in an LRU cache tagged with the table's load generation, which
+    every load bumps in its committing transaction (see load_to_sqlite.py): the first
+    query after a load sees the new generation and drops the cached results, so no
+    stale result is ever served. The generation check and the query run in one read
+    transaction, so a result always belongs to the generation it is cached under.
+    """
+
+    def __init__(self, db_name="laptops_analytics.db", table_name="laptops_final", project_root_dir=".",
+                 pool_size=DEFAULT_POOL_SIZE, cache_entries=DEFAULT_CACHE_ENTRIES, queries=None):
+        self.table_name = table_name
+        queries = DEFAULT_QUERIES if queries is None else queries
+        self.statements = {name: sql.format(table=quote_identifier(table_name)) for name, sql in queries.items()}
+        self.pool = ReadConnectionPool(os.path.join(project_root_dir, db_name), size=pool_size,
+                                       cached_statements=max(128, 2 * len(self.statements)))
+        self.cache_entries = cache_entries
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+        self._cache_generation = None
+        self._cache_lock = threading.Lock()
+
+    def _cached(self, generation, key):
+        with self._cache_lock:
+            if generation != self._cache_generation:
+                # Any change, including a lower generation (the database was recreated or
+                # restored), means the cached results belong to another table.
+                self._cache.clear()
+                self._cache_generation = generation
+                return None
+            result = self._cache.get(key)
+            if result is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+            return result
+
+    def _store(self, generation, key, result):
+        with self._cache_lock:
+            self.misses += 1
+            if generation != self._cache_generation or self.cache_entries <= 0:
+                return  # A newer load committed while this query ran
+            self._cache[key] = result
+            if len(self._cache) > self.cache_entries:
+                self._cache.popitem(last=False)
+
+    def query(self, name, params=()):
+        """
+        Runs the named query with `params`, from the cache when the table is unchanged.
+
+        Returns:
+            dict: 'columns' (tuple of names), 'rows' (tuple of row tuples), 'generation' (the
+            load generation the rows belong to) and 'cached' (served from the cache), or None
+            if an error occurred. The columns and rows are immutable, since cached results
+            are shared by every caller.
+        """
+        if name not in self.statements:
+            print(f"Error: unknown query '{name}' (available: {', '.join(self.statements)}).")
+            return None
+        try:
+            key = (name, tuple(params))
+            hash(key)  # The cache key; also rejects values sqlite3 could not bind anyway
+        except TypeError:
+            print(f"Error: parameters of query '{name}' must be a sequence of plain values, got {params!r}.")
+            return None
+        try:
+            with self.pool.connection() as conn:
+                conn.execute("BEGIN")
+                generation = load_generation(conn, self.table_name)
+                result = self._cached(generation, key)
+                if result is not None:
+                    return dict(result, cached=True)
+                cursor = conn.execute(self.statements[name], key[1])
+                result = {'columns': tuple(column[0] for column in cursor.description),
+                          'rows': tuple(cursor.fetchall()), 'generation': generation}
+                conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            print(f"SQLite error occurred while running query '{name}': {e}")
+            return None
+        self._store(generation, key, result)
+        return dict(result, cached=False)
+
+    def stats(self):
+        with self._cache_lock:
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._cache),
+                    'generation': self._cache_generation}
+
+    def close(self):
+        self.pool.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def _parse_param(value):
+    """Command-line parameters are strings; pass numbers as numbers."""
+    for convert in (int, float):
+        try:
+            return convert(value)
+        except ValueError:
+            pass
+    return value
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run a named query against the loaded laptop listings.")
+    parser.add_argument("query", choices=sorted(DEFAULT_QUERIES), help="Name of the query to run.")
+    parser.add_argument("params", nargs="*", help="Query parameters, in order (e.g. HP for cheapest_by_brand).")
+    parser.add_argument("--db", default="laptops_analytics.db")
+    parser.add_argument("--table", default="laptops_final")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    try:
+        service = QueryService(args.db, args.table, pool_size=1)
+    except (FileNotFoundError, sqlite3.Error) as e:
+        print(f"Error: {e}")
+    else:
+        with service:
+            query_result = service.query(args.query, [_parse_param(param) for param in args.params])
+        if query_result is not None:
+            print(' | '.join(query_result['columns']))
+            for row in query_result['rows']:
+                print(' | '.join(str(value) for value in row))
+            print(f"({len(query_result['rows'])} rows, load generation {query_result['generation']})")
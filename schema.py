@@ -0,0 +1,113 @@
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Declared schema of the raw laptop CSV: column -> dtype passed to read_csv.
+# Low-cardinality strings are read as 'category'; free text stays 'str'. None means the
+# column is kept but its dtype is left to pandas (e.g. Price, which is numeric).
+# Columns not listed here (such as the 'Unnamed: 0' row counter) are not read at all.
+RAW_SCHEMA = {
+    'Brand': 'category',
+    'Name': str,
+    'Price': None,
+    'Processor_Name': str,
+    'Processor_Brand': 'category',
+    'RAM_Expandable': 'category',
+    'RAM': 'category',
+    'RAM_TYPE': 'category',
+    'Ghz': 'category',
+    'Display_type': 'category',
+    'Display': 'category',
+    'GPU': 'category',
+    'GPU_Brand': 'category',
+    'SSD': 'category',
+    'HDD': 'category',
+    'Adapter': 'category',
+    'Battery_Life': 'category',
+}
+RAW_COLUMNS = list(RAW_SCHEMA)
+RAW_DTYPES = {col: dtype for col, dtype in RAW_SCHEMA.items() if dtype is not None}
+
+# Declared schema of the transformed frame, applied by optimize_transformed_dtypes().
+TRANSFORMED_INTEGER_COLUMNS = ['Price', 'RAM_GB', 'SSD_Capacity_GB', 'HDD_Capacity_GB']
+TRANSFORMED_FLOAT_COLUMNS = ['Processor_Speed_GHz', 'Adapter_Wattage', 'Battery_Life_Hours', 'Display_Size_Inches']
+TRANSFORMED_CATEGORY_COLUMNS = ['Processor_Brand', 'Processor_Series', 'Processor_Generation', 'Processor_Core_Info']
+TRANSFORMED_TEXT_COLUMNS = ['Brand', 'Name', 'Processor_Name', 'RAM_Expandable', 'RAM_TYPE', 'Display_type', 'Display',
+                            'GPU', 'GPU_Brand', 'Price_Range'] + TRANSFORMED_CATEGORY_COLUMNS
+# dtype passed to read_csv for a CSV intermediate: text columns whose values look numeric
+# (e.g. Display '15.6') must stay text, as they were when the frame was transformed.
+TRANSFORMED_CSV_DTYPES = {col: str for col in TRANSFORMED_TEXT_COLUMNS}
+
+INTEGER_DTYPES = [np.int8, np.int16, np.int32, np.int64]
+NULLABLE_INTEGER_DTYPES = {np.int8: 'Int8', np.int16: 'Int16', np.int32: 'Int32', np.int64: 'Int64'}
+
+
+def is_raw_column(col):
+    """usecols= filter for read_csv: keep only the declared raw columns."""
+    return col in RAW_SCHEMA
+
+
+def smallest_integer_dtype(series):
+    """
+    Returns the smallest integer dtype that holds every value of a numeric Series, or None
+    if it has non-integral values. A nullable 'IntN' dtype is used when values are missing.
+    """
+    values = series.dropna()
+    if not len(values) or not np.array_equal(values, np.floor(values)):
+        return None
+    low, high = values.min(), values.max()
+    for dtype in INTEGER_DTYPES:
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return NULLABLE_INTEGER_DTYPES[dtype] if series.hasnans else dtype
+    return None
+
+
+def optimize_transformed_dtypes(df):
+    """
+    Shrinks the transformed frame in place per the declared transformed schema.
+
+    Integer columns are downcast to the smallest fitting integer type, float columns
+    (including integer columns the transform left as floats because values are missing)
+    to float32 only when that is lossless, and the engineered processor strings become
+    categories. Every column keeps its values and its kind (integer, float or text), so
+    it loads into SQLite with the same type and contents as without the schema.
+    """
+    for col in TRANSFORMED_INTEGER_COLUMNS:
+        if col in df.columns and pd.api.types.is_integer_dtype(df[col]):
+            dtype = smallest_integer_dtype(df[col])
+            if dtype is not None:
+                df[col] = df[col].astype(dtype)
+    for col in TRANSFORMED_FLOAT_COLUMNS + TRANSFORMED_INTEGER_COLUMNS:
+        if col in df.columns and pd.api.types.is_float_dtype(df[col]):
+            as_float32 = df[col].astype(np.float32)
+            if np.array_equal(as_float32.astype(np.float64), df[col], equal_nan=True):
+                df[col] = as_float32
+    for col in TRANSFORMED_CATEGORY_COLUMNS:
+        if col in df.columns and df[col].dtype == object:
+            df[col] = df[col].astype('category')
+    return df
+
+
+def object_equivalent_memory(df):
+    """
+    Deep memory the frame would use with its categorical columns stored as plain
+    object strings, i.e. what pandas' default inference would have produced.
+    """
+    total = 0
+    for col in df.columns:
+        series = df[col]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            counts = series.value_counts(dropna=False)
+            total += 8 * len(series)  # One object pointer per row
+            total += sum(sys.getsizeof(value) * count for value, count in counts.items())
+        else:
+            total += series.memory_usage(deep=True, index=False)
+    return total
+
+
+def report_memory_usage(label, before_bytes, after_bytes):
+    ratio = before_bytes / after_bytes if after_bytes else float('inf')
+    print(f"- {label} memory: {before_bytes / 2 ** 20:.1f} MB -> {after_bytes / 2 ** 20:.1f} MB "
+          f"({ratio:.1f}x smaller).")
@@ -0,0 +1,121 @@
+import os
+import sqlite3
+
+from load_to_sqlite import DEFAULT_LOAD_PRAGMAS, apply_pragmas, quote_identifier
+from pipeline_metrics import timed_stage
+
+# Indexes built on the loaded table, as column tuples (the index name is derived from them).
+# They are created after the bulk insert rather than maintained during it, which keeps
+# loads fast; a replace-mode load swaps in a fresh table, so they are rebuilt every load.
+DEFAULT_INDEX_COLUMNS = [
+    ('Brand', 'Price'),  # WHERE Brand = ? ORDER BY Price
+    ('Price_Range', 'Price', 'Name', 'RAM_GB'),  # Covering: listings in a price range, sorted by price
+    ('Processor_Series', 'RAM_GB', 'Price'),  # Covering: count/average price per series and RAM floor
+    ('Brand', 'Price_Range'),  # Covering: GROUP BY Brand, Price_Range
+    ('Price',),  # Price BETWEEN ? AND ?
+    ('RAM_GB',),
+]
+
+# Representative analytics queries whose plans are reported before and after indexing:
+# name -> (SQL with a {table} placeholder, example parameters).
+REPRESENTATIVE_QUERIES = {
+    'cheapest_by_brand': ("SELECT Name, Price FROM {table} WHERE Brand = ? ORDER BY Price LIMIT 20", ('HP',)),
+    'price_range_listing': ("SELECT Name, Price, RAM_GB FROM {table} WHERE Price_Range = ? "
+                            "ORDER BY Price DESC LIMIT 20", ('Premium',)),
+    'series_with_min_ram': ("SELECT COUNT(*), AVG(Price) FROM {table} WHERE Processor_Series = ? AND RAM_GB >= ?",
+                            ('Core i5', 16)),
+    'price_between': ("SELECT Name, Price FROM {table} WHERE Price BETWEEN ? AND ? ORDER BY Price",
+                      (40000, 60000)),
+    'brand_price_range_counts': ("SELECT Brand, Price_Range, COUNT(*) FROM {table} GROUP BY Brand, Price_Range",
+                                 ()),
+}
+
+
+def index_name(table_name, columns):
+    return f"idx_{table_name}_{'_'.join(columns)}".lower()
+
+
+def explain_query_plan(conn, sql, params=()):
+    """Returns the EXPLAIN QUERY PLAN detail lines for a query."""
+    return [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+
+
+def query_plans(conn, table_name, queries=None):
+    """name -> query plan lines for each representative query."""
+    queries = REPRESENTATIVE_QUERIES if queries is None else queries
+    plans = {}
+    for name, (sql, params) in queries.items():
+        try:
+            plans[name] = explain_query_plan(conn, sql.format(table=quote_identifier(table_name)), params)
+        except sqlite3.Error as e:
+            plans[name] = [f"(not plannable: {e})"]
+    return plans
+
+
+def build_indexes(conn, table_name, index_columns=None):
+    """
+    Creates the configured indexes on `table_name` (skipping any whose columns it lacks)
+    and runs ANALYZE so the query planner has fresh statistics. Returns the index names.
+    """
+    index_columns = DEFAULT_INDEX_COLUMNS if index_columns is None else index_columns
+    table_columns = {row[1] for row in conn.execute(f"PRAGMA table_info({quote_identifier(table_name)})")}
+    created = []
+    for columns in index_columns:
+        missing = [col for col in columns if col not in table_columns]
+        if missing:
+            print(f"- Skipping index on {', '.join(columns)}: '{table_name}' has no {', '.join(missing)}.")
+            continue
+        name = index_name(table_name, columns)
+        with timed_stage('index.build', index=name):
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {quote_identifier(name)} ON {quote_identifier(table_name)} "
+                         f"({', '.join(quote_identifier(col) for col in columns)})")
+        created.append(name)
+    with timed_stage('index.analyze'):
+        conn.execute(f"ANALYZE {quote_identifier(table_name)}")
+    return created
+
+
+def print_query_plans(title, plans):
+    print(f"{title}:")
+    for name, lines in plans.items():
+        print(f"  {name}: {' | '.join(lines)}")
+
+
+def build_indexes_and_analyze(db_name, table_name, project_root_dir=".", index_columns=None, queries=None,
+                              report_plans=True):
+    """
+    Post-load step: builds the configured indexes on the loaded table and runs ANALYZE.
+
+    With `report_plans`, the query plans of the representative queries are printed
+    before and after, so it is visible which queries stopped scanning the whole table.
+
+    Args:
+        db_name (str): The name of the SQLite database file (e.g., 'laptops_analytics.db').
+        table_name (str): The table to index.
+        project_root_dir (str): The root directory of the project, where the db is saved.
+        index_columns (list of tuples): Column tuples to index (default DEFAULT_INDEX_COLUMNS).
+        queries (dict): name -> (SQL, params) to explain (default REPRESENTATIVE_QUERIES).
+        report_plans (bool): Print the query plans before and after indexing.
+
+    Returns:
+        dict: 'indexes' (names built) and 'plans_before'/'plans_after', or None on error.
+    """
+    db_path = os.path.join(project_root_dir, db_name)
+    try:
+        conn = sqlite3.connect(db_path, isolation_level=None)
+        apply_pragmas(conn, DEFAULT_LOAD_PRAGMAS)
+        plans_before = query_plans(conn, table_name, queries)
+        if report_plans:
+            print_query_plans("Query plans before indexing", plans_before)
+        indexes = build_indexes(conn, table_name, index_columns)
+        plans_after = query_plans(conn, table_name, queries)
+        print(f"Built {len(indexes)} indexes on '{table_name}' and refreshed planner statistics (ANALYZE).")
+        if report_plans:
+            print_query_plans("Query plans after indexing", plans_after)
+        return {'indexes': indexes, 'plans_before': plans_before, 'plans_after': plans_after}
+    except sqlite3.Error as e:
+        print(f"SQLite error occurred while building indexes: {e}")
+    finally:
+        if 'conn' in locals() and conn:
+            conn.close()
+    return None
@@ -0,0 +1,210 @@
+import pandas as pd
+
+from load_to_sqlite import _table_columns, insert_df_rows, quote_identifier
+
+# Summary tables materialized in the analytics DB: table name -> dimension columns.
+# Each holds, per dimension combination, the row count and the sum and non-null count of
+# every measure; a '<table>_means' view turns those into averages for dashboards.
+DEFAULT_SUMMARY_DEFINITIONS = {
+    'summary_brand_price_range_series': ('Brand', 'Price_Range', 'Processor_Series'),
+    'summary_brand': ('Brand',),
+    'summary_price_range': ('Price_Range',),
+}
+DEFAULT_SUMMARY_MEASURES = ['Price', 'RAM_GB', 'SSD_Capacity_GB', 'Processor_Speed_GHz', 'Display_Size_Inches']
+ROW_COUNT_COLUMN = 'Row_Count'
+MISSING_DIMENSION = ''  # Stored instead of NULL, which would never match itself in the primary key
+
+
+def _sum_column(measure):
+    return f"{measure}_Sum"
+
+
+def _count_column(measure):
+    return f"{measure}_Count"
+
+
+def _dimension_keys(series):
+    """Dimension values as the text SQLite's CAST(... AS TEXT) gives, with '' for missing."""
+    values = series.astype(object)
+    return values.where(values.notna(), MISSING_DIMENSION).astype(str)
+
+
+class SummaryTables:
+    """
+    Incrementally maintained count/sum aggregates of the loaded table.
+
+    Two ways to keep them current, both merging partial aggregates instead of rescanning:
+    - full (replace) loads call add_chunk() for every chunk written and write_replacement()
+      inside the transaction that swaps the new table in;
+    - incremental (upsert) loads call apply_upsert_delta() inside the merge transaction,
+      which subtracts the old version of changed/deleted rows and adds the new rows.
+
+    With `enabled=False` those same calls drop the summary tables (and their views)
+    instead, so a load that skips them never leaves them describing an older table; the
+    next load with summaries enabled recreates them from scratch. A summary whose
+    dimensions the loaded table lacks is dropped for the same reason.
+    """
+
+    def __init__(self, definitions=None, measures=None, enabled=True):
+        self.definitions = DEFAULT_SUMMARY_DEFINITIONS if definitions is None else definitions
+        self.measures = DEFAULT_SUMMARY_MEASURES if measures is None else measures
+        self.enabled = enabled
+        self._totals = {}
+        self._chunk_measures = None
+
+    # --- Full loads: aggregate each chunk in pandas and merge the partial results ---
+
+    def add_chunk(self, df):
+        if not self.enabled:
+            return
+        if self._chunk_measures is None:
+            self._chunk_measures = [m for m in self.measures if m in df.columns]
+        parts = {ROW_COUNT_COLUMN: pd.Series(1, index=df.index, dtype='int64')}
+        for measure in self._chunk_measures:
+            values = pd.to_numeric(df[measure], errors='coerce').astype('float64')
+            parts[_sum_column(measure)] = values
+            parts[_count_column(measure)] = values.notna().astype('int64')
+        for name, dimensions in self.definitions.items():
+            if any(dim not in df.columns for dim in dimensions):
+                continue
+            frame = pd.DataFrame({**{dim: _dimension_keys(df[dim]) for dim in dimensions}, **parts})
+            aggregate = frame.groupby(list(dimensions), sort=False).sum()
+            if name in self._totals:
+                aggregate = pd.concat([self._totals[name], aggregate]).groupby(level=list(dimensions),
+                                                                               sort=False).sum()
+            self._totals[name] = aggregate
+
+    def write_replacement(self, conn):
+        """Replaces every summary table with the aggregates of the chunks added so far."""
+        if not self.enabled:
+            self.drop(conn)
+            return
+        self.drop(conn, [name for name in self.definitions if name not in self._totals])
+        for name, aggregate in self._totals.items():
+            dimensions = self.definitions[name]
+            self._create_table(conn, name, dimensions, self._chunk_measures, replace=True)
+            insert_df_rows(conn, name, aggregate.reset_index())
+        self._totals = {}
+
+    # --- Incremental loads: merge signed deltas in SQL ---
+
+    def apply_upsert_delta(self, conn, table_name, incoming_table, key_column, row_hash_column,
+                           delete_missing=False):
+        """
+        Folds an upsert into the summaries before it is applied to `table_name`.
+
+        Rows of `incoming_table` that are new or whose row hash changed are added; the
+        current version of changed rows (and, with `delete_missing`, of rows absent from
+        the input) is subtracted. Must run in the merge transaction, before the upsert.
+        """
+        if not self.enabled:
+            self.drop(conn)
+            return
+        target_columns = _table_columns(conn, table_name)
+        incoming_columns = _table_columns(conn, incoming_table)
+        measures = [m for m in self.measures if m in target_columns and m in incoming_columns]
+        target, incoming = quote_identifier(table_name), quote_identifier(incoming_table)
+        key, row_hash = quote_identifier(key_column), quote_identifier(row_hash_column)
+        target_is_empty = conn.execute(f"SELECT NOT EXISTS (SELECT 1 FROM {target})").fetchone()[0]
+
+        for name, dimensions in self.definitions.items():
+            if any(dim not in target_columns or dim not in incoming_columns for dim in dimensions):
+                print(f"- Dropping summary '{name}': the loaded table lacks one of {', '.join(dimensions)}.")
+                self.drop(conn, [name])
+                continue
+            if not self._is_current_table(conn, name, dimensions, measures):
+                # New or reconfigured summary: start from the table's current contents.
+                self._create_table(conn, name, dimensions, measures, replace=True)
+                if not target_is_empty:
+                    self._merge_aggregate(conn, name, dimensions, measures,
+                                          f"SELECT 1 AS _sign, * FROM {target}")
+            elif target_is_empty:
+                conn.execute(f"DELETE FROM {quote_identifier(name)}")
+
+            columns = ', '.join(quote_identifier(col) for col in (*dimensions, *measures))
+            t_columns = ', '.join(f"t.{quote_identifier(col)}" for col in (*dimensions, *measures))
+            i_columns = ', '.join(f"i.{quote_identifier(col)}" for col in (*dimensions, *measures))
+            sources = [
+                f"SELECT -1 AS _sign, {t_columns} FROM {target} AS t JOIN {incoming} AS i ON i.{key} = t.{key} "
+                f"WHERE t.{row_hash} IS NOT i.{row_hash}",
+                f"SELECT 1 AS _sign, {i_columns} FROM {incoming} AS i LEFT JOIN {target} AS t ON t.{key} = i.{key} "
+                f"WHERE t.{key} IS NULL OR t.{row_hash} IS NOT i.{row_hash}",
+            ]
+            if delete_missing:
+                sources.append(f"SELECT -1 AS _sign, {t_columns} FROM {target} AS t WHERE NOT EXISTS "
+                               f"(SELECT 1 FROM {incoming} AS i WHERE i.{key} = t.{key})")
+            delta_sql = f"SELECT _sign, {columns} FROM ({' UNION ALL '.join(sources)})"
+            self._merge_aggregate(conn, name, dimensions, measures, delta_sql)
+
+    def rebuild(self, conn, table_name):
+        """Recomputes every summary table from scratch from `table_name` (e.g. after manual edits)."""
+        if not self.enabled:
+            self.drop(conn)
+            return
+        target_columns = _table_columns(conn, table_name)
+        measures = [m for m in self.measures if m in target_columns]
+        for name, dimensions in self.definitions.items():
+            if any(dim not in target_columns for dim in dimensions):
+                self.drop(conn, [name])
+                continue
+            self._create_table(conn, name, dimensions, measures, replace=True)
+            self._merge_aggregate(conn, name, dimensions, measures,
+                                  f"SELECT 1 AS _sign, * FROM {quote_identifier(table_name)}")
+
+    def drop(self, conn, names=None):
+        """Drops the named summary tables (default: all of them) and their '<table>_means' views."""
+        for name in self.definitions if names is None else names:
+            conn.execute(f"DROP VIEW IF EXISTS {quote_identifier(f'{name}_means')}")
+            conn.execute(f"DROP TABLE IF EXISTS {quote_identifier(name)}")
+
+    # --- Helpers ---
+
+    @staticmethod
+    def _summary_columns(dimensions, measures):
+        columns = [ROW_COUNT_COLUMN]
+        for measure in measures:
+            columns += [_sum_column(measure), _count_column(measure)]
+        return [*dimensions, *columns]
+
+    def _is_current_table(self, conn, name, dimensions, measures):
+        return _table_columns(conn, name) == self._summary_columns(dimensions, measures)
+
+    def _create_table(self, conn, name, dimensions, measures, replace=False):
+        table, view = quote_identifier(name), quote_identifier(f"{name}_means")
+        if replace:
+            conn.execute(f"DROP VIEW IF EXISTS {view}")
+            conn.execute(f"DROP TABLE IF EXISTS {table}")
+        columns = [f"{quote_identifier(dim)} TEXT NOT NULL" for dim in dimensions]
+        columns.append(f"{quote_identifier(ROW_COUNT_COLUMN)} INTEGER NOT NULL")
+        for measure in measures:
+            columns += [f"{quote_identifier(_sum_column(measure))} REAL NOT NULL",
+                        f"{quote_identifier(_count_column(measure))} INTEGER NOT NULL"]
+        primary_key = ', '.join(quote_identifier(dim) for dim in dimensions)
+        conn.execute(f"CREATE TABLE IF NOT EXISTS {table} ({', '.join(columns)}, PRIMARY KEY ({primary_key}))")
+
+        means = [f"{quote_identifier(_sum_column(m))} / NULLIF({quote_identifier(_count_column(m))}, 0) "
+                 f"AS {quote_identifier(m + '_Mean')}" for m in measures]
+        view_columns = [quote_identifier(dim) for dim in dimensions] + [quote_identifier(ROW_COUNT_COLUMN)] + means
+        conn.execute(f"CREATE VIEW IF NOT EXISTS {view} AS SELECT {', '.join(view_columns)} FROM {table}")
+
+    @staticmethod
+    def _merge_aggregate(conn, name, dimensions, measures, source_sql):
+        """Adds the signed aggregates of `source_sql` (a _sign column plus the raw columns) into a summary."""
+        table = quote_identifier(name)
+        select = [f"COALESCE(CAST({quote_identifier(dim)} AS TEXT), '')" for dim in dimensions]
+        select.append("SUM(_sign)")
+        updates = [f"{quote_identifier(ROW_COUNT_COLUMN)} = {quote_identifier(ROW_COUNT_COLUMN)} "
+                   f"+ excluded.{quote_identifier(ROW_COUNT_COLUMN)}"]
+        for measure in measures:
+            value = quote_identifier(measure)
+            select += [f"COALESCE(SUM(_sign * {value}), 0)", f"SUM(_sign * ({value} IS NOT NULL))"]
+            for col in (_sum_column(measure), _count_column(measure)):
+                updates.append(f"{quote_identifier(col)} = {quote_identifier(col)} + excluded.{quote_identifier(col)}")
+        columns = ', '.join(quote_identifier(col) for col in SummaryTables._summary_columns(dimensions, measures))
+        group_by = ', '.join(str(position + 1) for position in range(len(dimensions)))
+        conn.execute(
+            f"INSERT INTO {table} ({columns}) SELECT {', '.join(select)} FROM ({source_sql}) WHERE true "
+            f"GROUP BY {group_by} "
+            f"ON CONFLICT({', '.join(quote_identifier(dim) for dim in dimensions)}) DO UPDATE SET {', '.join(updates)}")
+        conn.execute(f"DELETE FROM {table} WHERE {quote_identifier(ROW_COUNT_COLUMN)} = 0")
+
@@ -0,0 +1,181 @@
+import argparse
+
+import numpy as np
+import pandas as pd
+
+# Seeded generator of raw laptop rows in the same messy text format as the Kaggle
+# laptop.csv that transform_laptop_data expects ("8 GB", "2.5 Ghz Processor",
+# "512 GB SSD Storage", "65 W", "Intel Core i5 (12th Gen)", ...), at any scale.
+
+DEFAULT_CHUNK_ROWS = 250_000  # Rows generated (and written) at a time
+FIRST_PRODUCT_ID = 500_000
+
+BRANDS = ['ASUS', 'Lenovo', 'HP', 'Dell', 'Acer', 'MSI', 'Samsung', 'Apple', 'Infinix', 'Microsoft',
+          'AVITA', 'Gigabyte', 'LG', 'Honor', 'Xiaomi']
+MODEL_LINES = ['Vivobook 15', 'Ideapad Slim 3', '15s-fy5007TU', 'Inspiron 3520', 'Aspire 7', 'Modern 14',
+               'Galaxy Book3', 'MacBook Air', 'Inbook Y2 Plus', 'Surface Laptop 5', 'TUF Gaming F15',
+               'Victus 16', 'G15-5520', 'Nitro 5', 'Zenbook 14 OLED', 'ThinkPad E14']
+# (Processor_Name, Processor_Brand, short name used inside 'Name')
+PROCESSORS = [
+    ('Intel Core i3 (11th Gen)', 'Intel', 'Core i3 11th Gen'),
+    ('Intel Core i5 (11th Gen)', 'Intel', 'Core i5 11th Gen'),
+    ('Intel Core i5 (12th Gen)', 'Intel', 'Core i5 12th Gen'),
+    ('Intel Core i5 (13th Gen)', 'Intel', 'Core i5 13th Gen'),
+    ('Intel Core i7 (12th Gen)', 'Intel', 'Core i7 12th Gen'),
+    ('Intel Core i7 (13th Gen)', 'Intel', 'Core i7 13th Gen'),
+    ('Intel Core i9 (13th Gen)', 'Intel', 'Core i9 13th Gen'),
+    ('Intel Core Ultra 7', 'Intel', 'Core Ultra 7'),
+    ('Intel Celeron Dual-Core', 'Intel', 'Celeron Dual Core'),
+    ('Intel Pentium Quad-Core', 'Intel', 'Pentium Quad Core'),
+    ('AMD Dual-Core Ryzen 3', 'AMD', 'AMD Dual Core Ryzen 3'),
+    ('AMD Hexa-Core Ryzen 5', 'AMD', 'AMD Hexa Core Ryzen 5'),
+    ('AMD Octa-Core Ryzen 7', 'AMD', 'AMD Octa Core Ryzen 7'),
+    ('AMD Octa-Core Ryzen 9', 'AMD', 'AMD Octa Core Ryzen 9'),
+    ('AMD Athlon Silver', 'AMD', 'AMD Athlon Silver'),
+    ('Apple M1', 'Apple', 'Apple M1'),
+    ('Apple M2 Pro', 'Apple', 'Apple M2 Pro'),
+    ('Apple M3 Max', 'Apple', 'Apple M3 Max'),
+    ('MediaTek Octa Core', 'MediaTek', 'MediaTek Octa Core'),
+    ('Qualcomm Snapdragon 7c', 'Qualcomm', 'Snapdragon 7c'),
+]
+RAM_SIZES = [4, 8, 8, 16, 16, 16, 32, 64]
+RAM_VARIANTS = ['{} GB', '{} GB', '{}GB', '{} GB RAM']
+RAM_TYPES = [' DDR4 RAM ', ' DDR4 RAM', ' DDR5 RAM ', ' LPDDR5 RAM', ' LPDDR4X RAM', ' LPDDR5X RAM ', ' RAM']
+RAM_EXPANDABLE = ['Not Expandable', ' 8 GB Expandable', ' 16 GB Expandable', ' 32 GB Expandable',
+                  ' 64 GB Expandable']
+GHZ_VALUES = ['1.1', '2.1', '2.4', '2.5', '3.0', '3.3', '4.2', '4.4', '4.8', '5.0']
+GHZ_VARIANTS = ['{} Ghz Processor', '{} Ghz Processor', '{} Ghz Max', '{}GHz']
+DISPLAY_TYPES = ['LCD', 'LED']
+DISPLAYS = ['15.6 ', '14 ', '16 ', '13.3 ', '17.3 ', '16.1 ', '11.6 ', '13.4 ', '14.0 ']
+GPUS = [('UHD', 'Intel'), ('Iris Xe', 'Intel'), ('Arc', 'Intel'), ('Radeon', 'AMD'), ('Radeon Vega 8', 'AMD'),
+        ('GeForce RTX 3050 GPU, 4 GB', 'NVIDIA'), ('GeForce RTX 4060 GPU, 8 GB', 'NVIDIA'),
+        ('Geforce GTX 1650 GPU, 4 GB', 'Nvidia'), ('Integrated', 'Apple'), ('Adreno', 'Qualcomm')]
+SSDS = ['No SSD', '256 GB SSD Storage', '512 GB SSD Storage', '512 GB SSD Storage', '1 TB SSD Storage',
+        '2 TB SSD Storage', '128 GB EMMC Storage']
+HDDS = ['No HDD', 'No HDD', 'No HDD', '1 TB HDD Storage', '500 GB HDD Storage']
+ADAPTERS = ['45 W', '65 W', '65 W', '90 W', '120 W', '180 W', '240 W', '65 Watt', 'No Adapter']
+BATTERY_LIVES = ['4 Hrs', '6 Hrs', '8 Hrs', '10 Hrs', '12.5 Hrs', '18 Hrs', 'Up to 20 Hrs', 'No Battery']
+OPERATING_SYSTEMS = ['Windows 11', 'Windows 11', 'Windows 10', 'Mac OS', 'Google Chrome', 'DOS']
+
+RAW_COLUMN_ORDER = ['Unnamed: 0', 'Brand', 'Name', 'Price', 'Processor_Name', 'Processor_Brand', 'RAM_Expandable',
+                    'RAM', 'RAM_TYPE', 'Ghz', 'Display_type', 'Display', 'GPU', 'GPU_Brand', 'SSD', 'HDD',
+                    'Adapter', 'Battery_Life']
+
+
+def _pick_indices(rng, values, n_rows):
+    return rng.integers(0, len(values), n_rows)
+
+
+def _pick(rng, values, n_rows):
+    """Draws `n_rows` values uniformly from `values` (repeats in `values` act as weights)."""
+    return np.array(values, dtype=object)[_pick_indices(rng, values, n_rows)]
+
+
+def _with_missing(rng, series, missing_rate):
+    if not missing_rate:
+        return series
+    return series.mask(rng.random(len(series)) < missing_rate)
+
+
+def generate_raw_chunk(n_rows, seed=0, start_row=0, missing_rate=0.01, duplicate_rate=0.0):
+    """
+    Generates `n_rows` raw laptop rows as a DataFrame in the raw CSV's column layout.
+
+    The same (seed, start_row) always produces the same rows. A `missing_rate` share of
+    the parseable columns is left empty, and a `duplicate_rate` share of rows reuse an
+    earlier product ID (as relisted products do), for exercising incremental loads.
+    """
+    rng = np.random.default_rng([seed, start_row])
+    row_numbers = np.arange(start_row, start_row + n_rows)
+
+    brand_idx = _pick_indices(rng, BRANDS, n_rows)
+    model_idx = _pick_indices(rng, MODEL_LINES, n_rows)
+    processor_idx = _pick_indices(rng, PROCESSORS, n_rows)
+    ram_sizes = np.array(RAM_SIZES)[_pick_indices(rng, RAM_SIZES, n_rows)]
+    display_idx = _pick_indices(rng, DISPLAYS, n_rows)
+    ssd_idx = _pick_indices(rng, SSDS, n_rows)
+    gpu_idx = _pick_indices(rng, GPUS, n_rows)
+    os_idx = _pick_indices(rng, OPERATING_SYSTEMS, n_rows)
+
+    product_ids = FIRST_PRODUCT_ID + row_numbers
+    if duplicate_rate and start_row:
+        relisted = rng.random(n_rows) < duplicate_rate
+        product_ids[relisted] = FIRST_PRODUCT_ID + rng.integers(0, start_row, relisted.sum())
+
+    brands = np.array(BRANDS, dtype=object)[brand_idx]
+    processor_names = np.array([p[0] for p in PROCESSORS], dtype=object)[processor_idx]
+    processor_short = np.array([p[2] for p in PROCESSORS], dtype=object)[processor_idx]
+    displays = np.array(DISPLAYS, dtype=object)[display_idx]
+    ssds = np.array(SSDS, dtype=object)[ssd_idx]
+    names = (pd.Series(brands) + ' ' + np.array(MODEL_LINES, dtype=object)[model_idx] + ' Laptop ('
+             + pd.Series(displays).str.strip() + ' Inch | ' + processor_short + ' | '
+             + pd.Series(ram_sizes).astype(str) + ' GB | ' + np.array(OPERATING_SYSTEMS, dtype=object)[os_idx]
+             + ' | ' + pd.Series(ssds).str.replace(' Storage', '', regex=False) + ')::'
+             + pd.Series(product_ids).astype(str) + '::computer::laptops')
+
+    ram_variant_idx = _pick_indices(rng, RAM_VARIANTS, n_rows)
+    rams = [RAM_VARIANTS[v].format(size) for v, size in zip(ram_variant_idx, ram_sizes)]
+    ghz_variant_idx = _pick_indices(rng, GHZ_VARIANTS, n_rows)
+    ghz_value_idx = _pick_indices(rng, GHZ_VALUES, n_rows)
+    ghz = [GHZ_VARIANTS[v].format(GHZ_VALUES[g]) for v, g in zip(ghz_variant_idx, ghz_value_idx)]
+
+    df = pd.DataFrame({
+        'Unnamed: 0': row_numbers,
+        'Brand': brands,
+        'Name': names.to_numpy(),
+        'Price': rng.integers(15_000, 300_000, n_rows) // 10 * 10,
+        'Processor_Name': processor_names,
+        'Processor_Brand': np.array([p[1] for p in PROCESSORS], dtype=object)[processor_idx],
+        'RAM_Expandable': _pick(rng, RAM_EXPANDABLE, n_rows),
+        'RAM': rams,
+        'RAM_TYPE': _pick(rng, RAM_TYPES, n_rows),
+        'Ghz': ghz,
+        'Display_type': _pick(rng, DISPLAY_TYPES, n_rows),
+        'Display': displays,
+        'GPU': np.array([g[0] for g in GPUS], dtype=object)[gpu_idx],
+        'GPU_Brand': np.array([g[1] for g in GPUS], dtype=object)[gpu_idx],
+        'SSD': ssds,
+        'HDD': _pick(rng, HDDS, n_rows),
+        'Adapter': _pick(rng, ADAPTERS, n_rows),
+        'Battery_Life': _pick(rng, BATTERY_LIVES, n_rows),
+    }, columns=RAW_COLUMN_ORDER)
+    for col in ['RAM', 'Ghz', 'Adapter', 'Battery_Life', 'Display']:
+        df[col] = _with_missing(rng, df[col], missing_rate)
+    return df
+
+
+def iter_raw_chunks(n_rows, seed=0, chunk_rows=DEFAULT_CHUNK_ROWS, **options):
+    """Yields `n_rows` synthetic raw rows in chunks of at most `chunk_rows` (see generate_raw_chunk)."""
+    for start_row in range(0, n_rows, chunk_rows):
+        yield generate_raw_chunk(min(chunk_rows, n_rows - start_row), seed=seed, start_row=start_row, **options)
+
+
+def write_raw_csv(path, n_rows, seed=0, chunk_rows=DEFAULT_CHUNK_ROWS, **options):
+    """
+    Writes `n_rows` synthetic raw rows to a CSV laid out like the Kaggle laptop.csv.
+
+    Rows are generated and appended a chunk at a time, so memory stays flat even for
+    tens of millions of rows. Returns the path.
+    """
+    for chunk_number, chunk in enumerate(iter_raw_chunks(n_rows, seed=seed, chunk_rows=chunk_rows, **options)):
+        chunk.to_csv(path, index=False, mode='w' if chunk_number == 0 else 'a', header=chunk_number == 0)
+    return path
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic raw laptop CSV.")
+    parser.add_argument("rows", type=int, help="Number of rows to generate.")
+    parser.add_argument("output", help="Path of the CSV to write.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--missing-rate", type=float, default=0.01,
+                        help="Share of RAM/Ghz/Display/Adapter/Battery_Life values left empty.")
+    parser.add_argument("--duplicate-rate", type=float, default=0.0,
+                        help="Share of rows that reuse an earlier product ID.")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    write_raw_csv(args.output, args.rows, seed=args.seed, missing_rate=args.missing_rate,
+                  duplicate_rate=args.duplicate_rate)
+    print(f"Wrote {args.rows} synthetic rows to {args.output}")
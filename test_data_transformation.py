@@ -0,0 +1,79 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_transformation import (PROCESSOR_FEATURE_COLUMNS, engineer_processor_features, extract_core_info,
+                                 extract_processor_brand, extract_processor_generation, extract_processor_series)
+from parse_cache import open_parse_cache
+
+TRANSFORMED_CSV = os.path.join(os.path.dirname(os.path.abspath(__file__)), "transformed_laptops.csv")
+
+# Row-wise reference helpers the vectorized engine must reproduce, by output column.
+REFERENCE_HELPERS = {
+    'Processor_Brand': extract_processor_brand,
+    'Processor_Series': extract_processor_series,
+    'Processor_Generation': extract_processor_generation,
+    'Processor_Core_Info': extract_core_info,
+}
+
+EDGE_CASE_NAMES = [
+    np.nan, None, '', ' ', 'nan', 'None',
+    'Apple M1', 'Apple M2 Pro', 'Apple M3 Max Chip', 'M2 ultra',
+    'Intel Core i7-1255U', 'Intel Core i5 1035G1', 'Intel Core i9 13th Gen', 'Intel Core i3-N305',
+    'Intel Core Ultra 7', 'Intel Core ultra9 185H', 'Intel Core m3-8100Y', 'Intel Xeon W-11955M',
+    'Intel Celeron Dual Core N4500', 'Intel Pentium Silver N6000', 'Intel Core i5 (12th Generation)',
+    'AMD Ryzen 5 5600H', 'AMD Ryzen 9 7940HS', 'AMD Ryzen 7 0000', 'AMD Ryzen Threadripper',
+    'AMD Athlon Silver 3050U', 'AMD Hexa-Core Ryzen 5', 'AMD Octa Core Ryzen 7 Processor',
+    'MediaTek Octa-core', 'MediaTek MT8183', 'MediaTek Kompanio 520 (Octa Core)', 'Mediatek Quad-core',
+    'Qualcomm Snapdragon 7c Gen 2', 'Snapdragon', 'Qualcomm Adreno', 'Deca-Core 3.0 GHz', 'Unknown CPU',
+]
+
+
+def reference_features(processor_names):
+    """The four row-wise helpers applied the way the transform used to run them."""
+    return pd.DataFrame({col: processor_names.apply(helper) for col, helper in REFERENCE_HELPERS.items()},
+                        index=processor_names.index)
+
+
+def assert_parity(processor_names):
+    result = engineer_processor_features(processor_names)
+    # The helpers ran on object columns; .apply on a category column would turn their None into NaN.
+    expected = reference_features(processor_names.astype(object))
+    assert list(result.columns) == PROCESSOR_FEATURE_COLUMNS
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_parity_on_real_processor_names():
+    processor_names = pd.read_csv(TRANSFORMED_CSV, usecols=['Processor_Name'])['Processor_Name']
+    assert_parity(processor_names)
+
+
+@pytest.mark.parametrize('name', EDGE_CASE_NAMES)
+def test_parity_on_edge_case(name):
+    assert_parity(pd.Series([name], dtype=object))
+
+
+def test_parity_on_categorical_input():
+    names = pd.Series(EDGE_CASE_NAMES * 3, dtype='category', index=np.arange(len(EDGE_CASE_NAMES) * 3) * 7)
+    assert_parity(names)
+
+
+def test_parity_on_empty_input():
+    result = engineer_processor_features(pd.Series([], dtype=object))
+    assert list(result.columns) == PROCESSOR_FEATURE_COLUMNS
+    assert result.empty
+
+
+def test_parity_through_parse_cache(tmp_path):
+    names = pd.Series(EDGE_CASE_NAMES, dtype=object)
+    cache = open_parse_cache(str(tmp_path))
+    try:
+        first = engineer_processor_features(names, parse_cache=cache)  # Parses and stores
+        second = engineer_processor_features(names, parse_cache=cache)  # Served from the cache
+    finally:
+        cache.close()
+    expected = reference_features(names)
+    pd.testing.assert_frame_equal(first, expected)
+    pd.testing.assert_frame_equal(second, expected)
@@ -0,0 +1,53 @@
+import os
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from load_to_sqlite import (PRODUCT_ID_COLUMN, bulk_load_df_to_sqlite, extract_product_ids, upsert_df_to_sqlite)
+
+TRANSFORMED_CSV = os.path.join(os.path.dirname(os.path.abspath(__file__)), "transformed_laptops.csv")
+DB_NAME = "test.db"
+TABLE_NAME = "laptops_final"
+
+
+@pytest.fixture(scope='module')
+def listings():
+    """Transformed listings, one per product ID, so row counts are easy to reason about."""
+    df = pd.read_csv(TRANSFORMED_CSV)
+    return df[~extract_product_ids(df['Name']).duplicated()].reset_index(drop=True)
+
+
+def table_rows(db_dir, columns):
+    with sqlite3.connect(os.path.join(db_dir, DB_NAME)) as conn:
+        return pd.read_sql_query(f"SELECT {', '.join(columns)} FROM {TABLE_NAME} ORDER BY Name", conn)
+
+
+def test_upsert_after_replace_load_keeps_stored_rows(tmp_path, listings):
+    assert bulk_load_df_to_sqlite(listings, DB_NAME, TABLE_NAME, project_root_dir=str(tmp_path)) == len(listings)
+
+    delta = listings.head(50).copy()
+    delta['Price'] += 1
+    counts = upsert_df_to_sqlite(delta, DB_NAME, TABLE_NAME, project_root_dir=str(tmp_path))
+
+    assert counts['inserted'] == 0 and counts['updated'] == 50 and counts['deleted'] == 0
+    stored = table_rows(str(tmp_path), [PRODUCT_ID_COLUMN, 'Name', 'Price'])
+    assert len(stored) == len(listings)
+    expected = pd.concat([delta, listings.iloc[50:]]).sort_values('Name')
+    assert stored['Price'].tolist() == expected['Price'].tolist()
+
+
+def test_upsert_after_replace_load_of_same_rows_changes_nothing(tmp_path, listings):
+    bulk_load_df_to_sqlite(listings, DB_NAME, TABLE_NAME, project_root_dir=str(tmp_path))
+    counts = upsert_df_to_sqlite(listings, DB_NAME, TABLE_NAME, project_root_dir=str(tmp_path))
+    assert (counts['inserted'], counts['updated'], counts['unchanged']) == (0, 0, len(listings))
+
+
+def test_upsert_refuses_to_migrate_rows_without_product_id(tmp_path, listings):
+    unkeyed = listings.head(10).copy()
+    unkeyed.loc[0, 'Name'] = "Laptop without a product ID"
+    bulk_load_df_to_sqlite(unkeyed, DB_NAME, TABLE_NAME, project_root_dir=str(tmp_path))
+
+    assert upsert_df_to_sqlite(listings.head(5), DB_NAME, TABLE_NAME, project_root_dir=str(tmp_path)) is None
+    stored = table_rows(str(tmp_path), ['Name'])
+    assert sorted(stored['Name']) == sorted(unkeyed['Name'])
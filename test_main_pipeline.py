@@ -0,0 +1,48 @@
+import os
+import sqlite3
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import main_pipeline
+from intermediate_storage import save_intermediate
+from schema import optimize_transformed_dtypes
+
+TRANSFORMED_CSV = os.path.join(os.path.dirname(os.path.abspath(__file__)), "transformed_laptops.csv")
+
+
+@pytest.fixture
+def transformed_df():
+    """Transformed listings with numeric-looking text (Display '15.6') and missing RAM_GB values."""
+    df = pd.read_csv(TRANSFORMED_CSV)
+    df['Display'] = df['Display'].str.strip()
+    df = df[pd.to_numeric(df['Display'], errors='coerce').notna()].reset_index(drop=True)
+    df.loc[::7, 'RAM_GB'] = np.nan
+    return df
+
+
+def stored_table(db_path):
+    with sqlite3.connect(db_path) as conn:
+        types = {row[1]: row[2] for row in conn.execute(f"PRAGMA table_info({main_pipeline.TABLE_NAME})")}
+        rows = pd.read_sql_query(f"SELECT * FROM {main_pipeline.TABLE_NAME} ORDER BY rowid", conn)
+    return types, rows
+
+
+@pytest.mark.parametrize('use_schema', [True, False])
+def test_resumed_csv_load_matches_fresh_load(tmp_path, monkeypatch, transformed_df, use_schema):
+    monkeypatch.chdir(tmp_path)
+    if use_schema:
+        transformed_df = optimize_transformed_dtypes(transformed_df)
+    main_pipeline.run_load_step(transformed_df)
+    fresh_types, fresh_rows = stored_table(main_pipeline.DB_NAME)
+
+    artifact_path = str(tmp_path / main_pipeline.TRANSFORMED_CSV_FILENAME)
+    save_intermediate(transformed_df, artifact_path)
+    os.remove(main_pipeline.DB_NAME)
+    main_pipeline.run_resume_pipeline(artifact_path)
+    resumed_types, resumed_rows = stored_table(main_pipeline.DB_NAME)
+
+    assert resumed_types == fresh_types
+    assert fresh_types['Display'] == 'TEXT'
+    pd.testing.assert_frame_equal(resumed_rows, fresh_rows)
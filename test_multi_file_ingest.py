@@ -0,0 +1,32 @@
+import os
+
+import pandas as pd
+import pytest
+
+from load_to_sqlite import upsert_df_to_sqlite
+from multi_file_ingest import SOURCE_FILE_COLUMN, _tag_source
+
+TRANSFORMED_CSV = os.path.join(os.path.dirname(os.path.abspath(__file__)), "transformed_laptops.csv")
+DB_NAME = "test.db"
+TABLE_NAME = "laptops_final"
+
+
+@pytest.fixture(scope='module')
+def listings():
+    return pd.read_csv(TRANSFORMED_CSV)
+
+
+def test_source_file_is_stored_absolute(tmp_path, monkeypatch, listings):
+    monkeypatch.chdir(tmp_path)
+    tagged = _tag_source(listings.head(5).copy(), os.path.join("drops", "v2", "laptop.csv"))
+    assert set(tagged[SOURCE_FILE_COLUMN]) == {str(tmp_path / "drops" / "v2" / "laptop.csv")}
+
+
+def test_reingesting_file_under_another_spelling_changes_nothing(tmp_path, monkeypatch, listings):
+    monkeypatch.chdir(tmp_path)
+    first = upsert_df_to_sqlite(_tag_source(listings.copy(), os.path.join("drops", "laptop.csv")),
+                                DB_NAME, TABLE_NAME, project_root_dir=str(tmp_path))
+    again = upsert_df_to_sqlite(_tag_source(listings.copy(), os.path.join(".", "drops", "..", "drops", "laptop.csv")),
+                                DB_NAME, TABLE_NAME, project_root_dir=str(tmp_path))
+    assert first['inserted'] > 0
+    assert (again['inserted'], again['updated'], again['unchanged']) == (0, 0, first['inserted'])
@@ -0,0 +1,45 @@
+import os
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from load_to_sqlite import LOAD_GENERATION_TABLE, bulk_load_df_to_sqlite
+from query_service import QueryService
+
+TRANSFORMED_CSV = os.path.join(os.path.dirname(os.path.abspath(__file__)), "transformed_laptops.csv")
+DB_NAME = "test.db"
+TABLE_NAME = "laptops_final"
+
+
+@pytest.fixture
+def service(tmp_path):
+    bulk_load_df_to_sqlite(pd.read_csv(TRANSFORMED_CSV), DB_NAME, TABLE_NAME, project_root_dir=str(tmp_path))
+    with QueryService(DB_NAME, TABLE_NAME, project_root_dir=str(tmp_path)) as service:
+        yield service
+
+
+def set_generation(db_dir, generation):
+    with sqlite3.connect(os.path.join(db_dir, DB_NAME)) as conn:
+        conn.execute(f"UPDATE {LOAD_GENERATION_TABLE} SET generation = ? WHERE table_name = ?",
+                     (generation, TABLE_NAME))
+
+
+def test_results_are_cached_until_the_generation_changes(tmp_path, service):
+    assert not service.query('cheapest_by_brand', ('HP',))['cached']
+    assert service.query('cheapest_by_brand', ('HP',))['cached']
+
+    set_generation(str(tmp_path), 10)
+    assert not service.query('cheapest_by_brand', ('HP',))['cached']
+    assert service.query('cheapest_by_brand', ('HP',))['cached']
+
+
+def test_cache_recovers_when_the_generation_goes_backwards(tmp_path, service):
+    set_generation(str(tmp_path), 10)
+    service.query('cheapest_by_brand', ('HP',))
+
+    set_generation(str(tmp_path), 0)  # E.g. the database file was recreated
+    result = service.query('cheapest_by_brand', ('HP',))
+    assert not result['cached'] and result['generation'] == 0
+    assert service.query('cheapest_by_brand', ('HP',))['cached']
+    assert service.stats()['generation'] == 0
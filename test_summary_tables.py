@@ -0,0 +1,72 @@
+import os
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from load_to_sqlite import (bulk_load_df_to_sqlite, load_df_to_sqlite, upsert_df_to_sqlite)
+from summary_tables import DEFAULT_SUMMARY_DEFINITIONS, ROW_COUNT_COLUMN, SummaryTables
+
+TRANSFORMED_CSV = os.path.join(os.path.dirname(os.path.abspath(__file__)), "transformed_laptops.csv")
+DB_NAME = "test.db"
+TABLE_NAME = "laptops_final"
+
+
+@pytest.fixture(scope='module')
+def listings():
+    return pd.read_csv(TRANSFORMED_CSV)
+
+
+def summary_contents(conn):
+    return {name: pd.read_sql_query(f"SELECT * FROM {name} ORDER BY {', '.join(dims)}", conn)
+            for name, dims in DEFAULT_SUMMARY_DEFINITIONS.items()}
+
+
+def assert_summaries_match_rebuild(db_dir):
+    """The stored summaries equal a from-scratch rebuild() of the loaded table."""
+    conn = sqlite3.connect(os.path.join(db_dir, DB_NAME), isolation_level=None)
+    try:
+        stored = summary_contents(conn)
+        conn.execute("BEGIN")
+        SummaryTables().rebuild(conn, TABLE_NAME)
+        rebuilt = summary_contents(conn)
+        conn.execute("ROLLBACK")
+        table_rows = conn.execute(f"SELECT COUNT(*) FROM {TABLE_NAME}").fetchone()[0]
+    finally:
+        conn.close()
+    for name in DEFAULT_SUMMARY_DEFINITIONS:
+        pd.testing.assert_frame_equal(stored[name], rebuilt[name], check_exact=False, rtol=1e-9)
+        assert stored[name][ROW_COUNT_COLUMN].sum() == table_rows
+
+
+def summary_tables_present(db_dir):
+    with sqlite3.connect(os.path.join(db_dir, DB_NAME)) as conn:
+        return {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE name LIKE 'summary_%'")}
+
+
+@pytest.mark.parametrize('loader', [bulk_load_df_to_sqlite, load_df_to_sqlite])
+def test_replace_loads_maintain_summaries_by_default(tmp_path, listings, loader):
+    bulk_load_df_to_sqlite(listings, DB_NAME, TABLE_NAME, project_root_dir=str(tmp_path))
+    loader(listings.head(100), DB_NAME, TABLE_NAME, project_root_dir=str(tmp_path))
+    assert_summaries_match_rebuild(str(tmp_path))
+
+
+def test_upserts_maintain_summaries_by_default(tmp_path, listings):
+    bulk_load_df_to_sqlite(listings, DB_NAME, TABLE_NAME, project_root_dir=str(tmp_path))
+    upsert_df_to_sqlite(listings.head(500), DB_NAME, TABLE_NAME, project_root_dir=str(tmp_path))  # Migrates
+    assert_summaries_match_rebuild(str(tmp_path))
+
+    changed = listings.iloc[300:800].copy()
+    changed['Price'] = changed['Price'] * 2
+    upsert_df_to_sqlite(changed, DB_NAME, TABLE_NAME, project_root_dir=str(tmp_path), delete_missing=True)
+    assert_summaries_match_rebuild(str(tmp_path))
+
+
+def test_disabled_summaries_are_dropped_then_rebuilt(tmp_path, listings):
+    bulk_load_df_to_sqlite(listings, DB_NAME, TABLE_NAME, project_root_dir=str(tmp_path))
+    upsert_df_to_sqlite(listings.head(200), DB_NAME, TABLE_NAME, project_root_dir=str(tmp_path),
+                        summaries=SummaryTables(enabled=False))
+    assert summary_tables_present(str(tmp_path)) == set()
+
+    upsert_df_to_sqlite(listings.head(300), DB_NAME, TABLE_NAME, project_root_dir=str(tmp_path))
+    assert_summaries_match_rebuild(str(tmp_path))
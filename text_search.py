@@ -0,0 +1,191 @@
+import argparse
+import os
+import re
+import sqlite3
+
+import pandas as pd
+
+from load_to_sqlite import _table_columns, quote_identifier
+from pipeline_metrics import timed_stage
+
+# Columns indexed for free-text search, with their bm25 weights (a match in Name counts most).
+SEARCH_COLUMNS = {'Name': 10.0, 'Processor_Name': 4.0, 'GPU': 2.0}
+FTS_TABLE_SUFFIX = "_fts"
+# unicode61 splits "Ideapad Slim 3 (82KU017KIN)::594497::..." into plain words; the
+# prefix indexes make the prefix queries built by build_match_query cheap.
+FTS_OPTIONS = "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'"
+DEFAULT_SEARCH_LIMIT = 20
+
+
+def fts_table_name(table_name):
+    return table_name + FTS_TABLE_SUFFIX
+
+
+def _trigger_names(table_name):
+    fts = fts_table_name(table_name)
+    return {'insert': f"{fts}_ai", 'delete': f"{fts}_ad", 'update': f"{fts}_au"}
+
+
+def _object_exists(conn, object_type, name):
+    return conn.execute("SELECT 1 FROM sqlite_master WHERE type = ? AND name = ?", (object_type, name)).fetchone() is not None
+
+
+def _create_sync_triggers(conn, table_name):
+    """Triggers that mirror every insert/delete/update of the searched columns into the FTS index."""
+    table, fts = quote_identifier(table_name), quote_identifier(fts_table_name(table_name))
+    triggers = _trigger_names(table_name)
+    columns = ', '.join(quote_identifier(col) for col in SEARCH_COLUMNS)
+    new_values = ', '.join(f"new.{quote_identifier(col)}" for col in SEARCH_COLUMNS)
+    old_values = ', '.join(f"old.{quote_identifier(col)}" for col in SEARCH_COLUMNS)
+    delete_old = f"INSERT INTO {fts} ({fts}, rowid, {columns}) VALUES ('delete', old.rowid, {old_values});"
+    insert_new = f"INSERT INTO {fts} (rowid, {columns}) VALUES (new.rowid, {new_values});"
+    conn.execute(f"CREATE TRIGGER IF NOT EXISTS {quote_identifier(triggers['insert'])} "
+                 f"AFTER INSERT ON {table} BEGIN {insert_new} END")
+    conn.execute(f"CREATE TRIGGER IF NOT EXISTS {quote_identifier(triggers['delete'])} "
+                 f"AFTER DELETE ON {table} BEGIN {delete_old} END")
+    conn.execute(f"CREATE TRIGGER IF NOT EXISTS {quote_identifier(triggers['update'])} "
+                 f"AFTER UPDATE OF {columns} ON {table} BEGIN {delete_old} {insert_new} END")
+
+
+def sync_text_search_in_transaction(conn, table_name, create=False):
+    """
+    The work of sync_text_search, inside a transaction the caller has already begun.
+
+    A load that swaps in a new table (see load_to_sqlite.SQLiteBulkLoader.commit) calls
+    this after the rename in its swap transaction, so the index is rebuilt against the new
+    rowids before anyone can see the new table. If the new table lacks a searched column,
+    an existing index is dropped rather than left pointing at rows that no longer exist.
+
+    Returns:
+        str: 'created', 'rebuilt', 'in sync', 'dropped', or 'absent' if there is no index to maintain.
+    """
+    fts_name = fts_table_name(table_name)
+    fts = quote_identifier(fts_name)
+    exists = _object_exists(conn, 'table', fts_name)
+    if not exists and not create:
+        return 'absent'
+    table_columns = _table_columns(conn, table_name)
+    missing = [col for col in SEARCH_COLUMNS if col not in table_columns]
+    if missing:
+        print(f"- Skipping text search index: '{table_name}' has no {', '.join(missing)}.")
+        if exists:
+            conn.execute(f"DROP TABLE {fts}")
+            return 'dropped'
+        return 'absent'
+    triggers_present = all(_object_exists(conn, 'trigger', name) for name in _trigger_names(table_name).values())
+    if exists and triggers_present:
+        return 'in sync'
+
+    if not exists:
+        columns = ', '.join(quote_identifier(col) for col in SEARCH_COLUMNS)
+        conn.execute(f"CREATE VIRTUAL TABLE {fts} USING fts5({columns}, "
+                     f"content = {quote_identifier(table_name)}, content_rowid = 'rowid', {FTS_OPTIONS})")
+    _create_sync_triggers(conn, table_name)
+    with timed_stage('text_search.rebuild'):
+        conn.execute(f"INSERT INTO {fts} ({fts}) VALUES ('rebuild')")
+    return 'rebuilt' if exists else 'created'
+
+
+def sync_text_search(conn, table_name, create=False):
+    """
+    Keeps the FTS5 index of `table_name` in sync after a load.
+
+    The index is an external-content FTS5 table (it stores no copy of the text) kept
+    current by triggers, so incremental (upsert) loads update it row by row as they
+    change the table. A full load swaps in a new table, which drops the triggers; the
+    loader recreates them and rebuilds the index in its swap transaction, and anything
+    still missing (e.g. after a table was replaced by other means) is repaired here. The
+    index is only created when `create` is set; an existing one is always maintained.
+
+    Returns:
+        str: 'created', 'rebuilt', 'in sync', 'dropped', or 'absent' if there is no index to maintain.
+    """
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        status = sync_text_search_in_transaction(conn, table_name, create=create)
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    return status
+
+
+def build_text_search_index(db_name, table_name, project_root_dir=".", create=False):
+    """Post-load step around sync_text_search; prints what it did and returns its status (None on error)."""
+    db_path = os.path.join(project_root_dir, db_name)
+    try:
+        conn = sqlite3.connect(db_path, isolation_level=None)
+        status = sync_text_search(conn, table_name, create=create)
+        if status != 'absent':
+            print(f"Text search index '{fts_table_name(table_name)}' over {', '.join(SEARCH_COLUMNS)}: {status}.")
+        return status
+    except sqlite3.Error as e:
+        print(f"SQLite error occurred while building the text search index: {e}")
+    finally:
+        if 'conn' in locals() and conn:
+            conn.close()
+    return None
+
+
+def build_match_query(text):
+    """
+    Turns free text such as "ideapad ryzen 5" into an FTS5 query matching every word as a
+    prefix ("ideapad"* AND "ryzen"* AND "5"*). Returns None if the text has no words.
+    """
+    words = re.findall(r'\w+', text.lower())
+    if not words:
+        return None
+    return ' '.join(f'"{word}"*' for word in words)
+
+
+def search_laptops(text, db_name, table_name, project_root_dir=".", limit=DEFAULT_SEARCH_LIMIT):
+    """
+    Full-text search over Name, Processor_Name and GPU, best matches first (bm25 rank).
+
+    Args:
+        text (str): Free-text query, e.g. "chromebook mediatek".
+        db_name (str): The name of the SQLite database file (e.g., 'laptops_analytics.db').
+        table_name (str): The searched table (its FTS index must have been built).
+        project_root_dir (str): The root directory of the project, where the db is saved.
+        limit (int): Maximum number of rows returned.
+
+    Returns:
+        pd.DataFrame: Matching rows of `table_name` with a 'Search_Rank' column (lower is
+        better), or None if an error occurred.
+    """
+    match_query = build_match_query(text)
+    if match_query is None:
+        print("Error: the search text has no words to match.")
+        return None
+    fts = quote_identifier(fts_table_name(table_name))
+    weights = ', '.join(str(weight) for weight in SEARCH_COLUMNS.values())
+    sql = (f"SELECT t.*, bm25({fts}, {weights}) AS Search_Rank "
+           f"FROM {fts} JOIN {quote_identifier(table_name)} AS t ON t.rowid = {fts}.rowid "
+           f"WHERE {fts} MATCH ? ORDER BY Search_Rank LIMIT ?")
+    db_path = os.path.join(project_root_dir, db_name)
+    try:
+        conn = sqlite3.connect(db_path)
+        return pd.read_sql_query(sql, conn, params=(match_query, limit))
+    except (sqlite3.Error, pd.errors.DatabaseError) as e:
+        print(f"SQLite error occurred while searching: {e}")
+    finally:
+        if 'conn' in locals() and conn:
+            conn.close()
+    return None
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Full-text search over the loaded laptop listings.")
+    parser.add_argument("text", help='Free-text query, e.g. "ideapad ryzen 5".')
+    parser.add_argument("--db", default="laptops_analytics.db")
+    parser.add_argument("--table", default="laptops_final")
+    parser.add_argument("--limit", type=int, default=DEFAULT_SEARCH_LIMIT)
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    results = search_laptops(args.text, args.db, args.table, limit=args.limit)
+    if results is not None:
+        with pd.option_context('display.max_colwidth', 90, 'display.width', 200):
+            print(results[['Name', 'Price', 'Processor_Name', 'GPU', 'Search_Rank']].to_string(index=False))